@@ -16,6 +16,7 @@ from .models import (
     PersonaBase,
     PersonaInteractionState,
     Memory,
+    MemoryView,
     Relationship,
     RelationshipType,
     EmotionalState,
@@ -38,6 +39,7 @@ __all__ = [
     "PersonaBase", 
     "PersonaInteractionState",
     "Memory",
+    "MemoryView",
     "Relationship",
     "RelationshipType",
     "EmotionalState",
@@ -5,19 +5,68 @@ Provides unified configuration management for both MCP server and PersonaAPI ser
 to ensure consistent settings and operational parity.
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 from ..config import get_config as get_original_config, ConfigManager as OriginalConfigManager
 from ..logging import get_logger
 
 
+# Declarative validation rules: (dotted config keys, check, severity, message).
+# Each check receives the values of its keys in order; a falsy result records
+# the message under the given severity ("errors" or "warnings").
+_VALIDATION_RULES: Tuple[Tuple[Tuple[str, ...], Callable[..., Any], str, str], ...] = (
+    (("server.port",), lambda port: isinstance(port, int) and port > 0,
+     "errors", "Server port must be a positive integer"),
+    (("personaapi.port", "server.port"), lambda api_port, mcp_port: api_port != mcp_port,
+     "errors", "PersonaAPI port cannot be the same as MCP server port"),
+    (("database.sqlite_path",), bool,
+     "errors", "SQLite database path not configured"),
+    (("llm.base_url",), bool,
+     "warnings", "LLM base URL not configured"),
+)
+
+# Sections exposed through get_<section>_config(), in get_all_config() order
+_CONFIG_SECTIONS = (
+    "server", "mcp", "personaapi", "database", "memory",
+    "llm", "logging", "bot", "security", "monitoring"
+)
+
+_VALIDATED_SECTIONS = tuple(dict.fromkeys(
+    key.split(".", 1)[0] for keys, _, _, _ in _VALIDATION_RULES for key in keys
+))
+
+
 class ConfigManager:
     """Unified configuration manager for both services"""
     
+    __slots__ = ("config", "logger", "_cache")
+    
     def __init__(self):
         self.config = get_original_config()
         self.logger = get_logger(__name__)
+        self._cache: Dict[str, Mapping[str, Any]] = {}
         self.logger.info("ConfigManager initialized")
 
+    def prewarm(self) -> None:
+        """Materialize every config section once and keep read-only views of them"""
+        for section in _CONFIG_SECTIONS:
+            self._cache[section] = MappingProxyType(getattr(self, f"get_{section}_config")())
+        self.logger.debug("Prewarmed %d config sections", len(self._cache))
+
+    def get_cached(self, section: str) -> Mapping[str, Any]:
+        """Get a read-only view of a config section, built on first use"""
+        view = self._cache.get(section)
+        if view is None:
+            if section not in _CONFIG_SECTIONS:
+                raise KeyError(f"Unknown config section: {section}")
+            view = MappingProxyType(getattr(self, f"get_{section}_config")())
+            self._cache[section] = view
+        return view
+
+    def invalidate_cache(self) -> None:
+        """Drop cached section views so they are rebuilt on next access"""
+        self._cache.clear()
+
     def get_server_config(self) -> Dict[str, Any]:
         """Get server configuration settings"""
         server = getattr(self.config, 'server', None)
@@ -51,7 +100,10 @@ class ConfigManager:
             "description": "HTTP REST API for persona management and monitoring",
             "version": "0.3.0",
             "docs_url": "/docs",
-            "redoc_url": "/redoc"
+            "redoc_url": "/redoc",
+            # Coalesce concurrent memory searches into memory.search_batch calls;
+            # only pays off with many simultaneous dashboard clients
+            "enable_batching": False
         }
 
     def get_database_config(self) -> Dict[str, Any]:
@@ -140,28 +192,17 @@ class ConfigManager:
             "warnings": []
         }
 
-        # Validate server config
-        server_config = self.get_server_config()
-        if not isinstance(server_config.get("port"), int) or server_config.get("port") <= 0:
-            validation_results["errors"].append("Server port must be a positive integer")
-            validation_results["valid"] = False
-
-        # Validate PersonaAPI port
-        personaapi_config = self.get_personaapi_config()
-        if personaapi_config.get("port") == server_config.get("port"):
-            validation_results["errors"].append("PersonaAPI port cannot be the same as MCP server port")
-            validation_results["valid"] = False
-
-        # Validate LLM config
-        llm_config = self.get_llm_config()
-        if not llm_config.get("base_url"):
-            validation_results["warnings"].append("LLM base URL not configured")
-
-        # Validate database paths
-        db_config = self.get_database_config()
-        if not db_config.get("sqlite_path"):
-            validation_results["errors"].append("SQLite database path not configured")
-            validation_results["valid"] = False
+        # Materialize each section referenced by a rule exactly once
+        flat: Dict[str, Any] = {}
+        for section in _VALIDATED_SECTIONS:
+            for key, value in getattr(self, f"get_{section}_config")().items():
+                flat[f"{section}.{key}"] = value
+
+        for keys, check, severity, message in _VALIDATION_RULES:
+            if not check(*(flat.get(key) for key in keys)):
+                validation_results[severity].append(message)
+                if severity == "errors":
+                    validation_results["valid"] = False
 
         return validation_results
 
@@ -191,6 +232,7 @@ class ConfigManager:
                         self.logger.info(f"Updated config {section}.{key} = {value}")
                     else:
                         self.logger.warning(f"Unknown config key: {section}.{key}")
+                self.invalidate_cache()
                 return True
             else:
                 self.logger.error(f"Unknown config section: {section}")
@@ -6,36 +6,105 @@ for both MCP server and PersonaAPI server to ensure operational parity.
 """
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional, List, Dict, Any
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from typing import AsyncGenerator, AsyncIterator, Optional, List, Dict, Any, Set, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 
 from ..persistence import SQLiteManager, VectorMemoryManager
 from ..logging import get_logger
-from .models import Persona, Memory, Relationship, EmotionalState
+from ..utils.ttl_cache import TTLCache
+from .models import MEMORY_FIELDS, Persona, Memory, MemoryView, Relationship, EmotionalState
 
 
-class Base(DeclarativeBase):
-    """Base class for SQLAlchemy models"""
-    pass
+# Compiled-statement cache entries per engine (SQLAlchemy's default is 500)
+QUERY_CACHE_SIZE = 1200
+
+# Connection pool profile for async SQLite engines: 5 warm connections, 10
+# more under bursts, recycled hourly. No pre-ping; a local file connection
+# doesn't go stale the way a network one does
+ENGINE_POOL_OPTIONS = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "connect_args": {"check_same_thread": False, "timeout": 30},
+}
+
+# Seconds a completed health check is reused before probing the backends again
+HEALTH_CACHE_SECONDS = 2.0
+
+# Background retries for vector memory cleanup after a persona is deleted
+VECTOR_CLEANUP_RETRIES = 3
+VECTOR_CLEANUP_BACKOFF_SECONDS = 1.0
+
+# Engines shared by every DatabaseManager in the process that points at the
+# same SQLite file: db_path -> [engine, session factory, reference count]
+_shared_engines: Dict[str, List[Any]] = {}
+
+
+def _acquire_engine(db_path: str) -> Tuple[AsyncEngine, async_sessionmaker]:
+    """Get the shared engine and session factory for a database file"""
+    entry = _shared_engines.get(db_path)
+    if entry is None:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{db_path}",
+            query_cache_size=QUERY_CACHE_SIZE,
+            **ENGINE_POOL_OPTIONS
+        )
+        session_factory = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        entry = _shared_engines[db_path] = [engine, session_factory, 0]
+    entry[2] += 1
+    return entry[0], entry[1]
+
+
+def _release_engine(db_path: str) -> Optional[AsyncEngine]:
+    """Drop one reference to a shared engine, returning it once it is unused"""
+    entry = _shared_engines.get(db_path)
+    if entry is None:
+        return None
+    entry[2] -= 1
+    if entry[2] > 0:
+        return None
+    del _shared_engines[db_path]
+    return entry[0]
 
 
 class DatabaseManager:
     """Unified database manager for both SQLite and ChromaDB operations"""
     
+    __slots__ = (
+        "sqlite", "vector", "logger", "engine", "async_session", "_db_path",
+        "_persona_cache", "_name_cache", "_persona_generations", "_persona_writes",
+        "_inflight_health", "_last_health", "_cleanup_tasks"
+    )
+    
     def __init__(self, sqlite_manager: Optional[SQLiteManager] = None, 
                  vector_manager: Optional[VectorMemoryManager] = None):
         self.sqlite = sqlite_manager or SQLiteManager()
         self.vector = vector_manager or VectorMemoryManager()
         self.logger = get_logger(__name__)
         
-        # Create async engine for relationship data
-        db_path = str(self.sqlite.db_path)
-        self.engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
-        self.async_session = async_sessionmaker(
-            self.engine, class_=AsyncSession, expire_on_commit=False
-        )
+        # Short-lived read caches for hot persona lookups
+        self._persona_cache = TTLCache(maxsize=256, ttl=30)
+        self._name_cache = TTLCache(maxsize=256, ttl=30)
+        # Bumped by every persona write so reads that started before it
+        # don't cache what they loaded; per id, and in total for name lookups
+        self._persona_generations: Dict[str, int] = {}
+        self._persona_writes = 0
+        
+        # Concurrent health probes share a single in-flight check
+        self._inflight_health: Optional[asyncio.Task] = None
+        self._last_health: Tuple[float, Dict[str, Any]] = (0.0, {})
+        
+        # Vector memory deletions being retried in the background
+        self._cleanup_tasks: Set[asyncio.Task] = set()
+        
+        # Async engine for relationship data, shared per database file
+        self.engine: Optional[AsyncEngine] = None
+        self._db_path = str(self.sqlite.db_path)
+        self.engine, self.async_session = _acquire_engine(self._db_path)
 
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -50,19 +119,6 @@ class DatabaseManager:
             finally:
                 await session.close()
 
-    async def initialize(self):
-        """Initialize database systems"""
-        # Initialize SQLite database
-        await self.sqlite.initialize()
-        self.logger.info("Database systems initialized successfully")
-    
-    async def close(self):
-        """Close database connections"""
-        if hasattr(self, 'engine'):
-            await self.engine.dispose()
-        await self.vector.close()
-        self.logger.info("Database connections closed")
-
     async def initialize(self):
         """Initialize database systems"""
         # Initialize SQLite database
@@ -72,13 +128,46 @@ class DatabaseManager:
     async def close(self):
         """Close database connections"""
         # Note: SQLiteManager doesn't have a close method
+        for task in self._cleanup_tasks:
+            task.cancel()
         await self.vector.close()
-        if hasattr(self, 'engine'):
-            await self.engine.dispose()
+        if self.engine is not None:
+            self.engine = None
+            unused_engine = _release_engine(self._db_path)
+            if unused_engine is not None:
+                await unused_engine.dispose()
         self.logger.info("DatabaseManager closed")
 
+    @staticmethod
+    def _hydrate(model_cls, data: Dict[str, Any], trust_db: bool):
+        """Build a model from a row, skipping validation for rows we wrote ourselves"""
+        if trust_db:
+            return model_cls.model_construct(**data)
+        return model_cls(**data)
+
     async def health_check(self) -> Dict[str, Any]:
-        """Check health of database components"""
+        """Check health of database components, coalescing concurrent probes"""
+        checked_at, result = self._last_health
+        if result and time.monotonic() - checked_at < HEALTH_CACHE_SECONDS:
+            return result
+        
+        if self._inflight_health is None:
+            self._inflight_health = asyncio.create_task(self._run_health_check())
+        
+        # Shield so one cancelled caller does not cancel the check for the others
+        return await asyncio.shield(self._inflight_health)
+
+    async def _run_health_check(self) -> Dict[str, Any]:
+        """Probe SQLite and vector memory and cache the outcome"""
+        try:
+            result = await self._probe_health()
+            self._last_health = (time.monotonic(), result)
+            return result
+        finally:
+            self._inflight_health = None
+
+    async def _probe_health(self) -> Dict[str, Any]:
+        """Run the actual backend health probes"""
         try:
             # Test SQLite connection by counting personas
             personas = await self.list_personas()
@@ -110,48 +199,130 @@ class DatabaseManager:
         """Create a new persona"""
         persona = Persona(**persona_data)
         await self.sqlite.store_persona(persona.dict())
-        self.logger.info(f"Created persona: {persona.name} ({persona.id})")
+        self.logger.info("Created persona: %s (%s)", persona.name, persona.id)
         return persona
 
-    async def get_persona(self, persona_id: str) -> Optional[Persona]:
+    def _cache_persona(self, persona: Persona) -> None:
+        """Populate the id and name caches with a loaded persona"""
+        self._persona_cache.set(persona.id, persona)
+        self._name_cache.set(persona.name, persona)
+
+    def _evict_persona(self, persona_id: str) -> None:
+        """Drop a persona from both caches"""
+        self._persona_cache.pop(persona_id)
+        # Match name entries by id: the id entry may already have been LRU-evicted,
+        # and a rename leaves the entry under the old name
+        for name in self._name_cache.keys():
+            cached = self._name_cache.get(name)
+            if cached is not None and cached.id == persona_id:
+                self._name_cache.pop(name)
+
+    def _invalidate_persona(self, persona_id: str) -> None:
+        """Evict a persona and stop in-flight reads from re-caching it"""
+        self._persona_generations[persona_id] = self._persona_generations.get(persona_id, 0) + 1
+        self._persona_writes += 1
+        self._evict_persona(persona_id)
+
+    async def get_persona(self, persona_id: str, trust_db: bool = True) -> Optional[Persona]:
         """Get persona by ID"""
+        persona = self._persona_cache.get(persona_id)
+        if persona is not None:
+            return persona
+        
+        generation = self._persona_generations.get(persona_id, 0)
         persona_data = await self.sqlite.get_persona(persona_id)
         if persona_data:
-            return Persona(**persona_data)
+            persona = self._hydrate(Persona, persona_data, trust_db)
+            if self._persona_generations.get(persona_id, 0) == generation:
+                self._cache_persona(persona)
+            return persona
         return None
 
-    async def get_persona_by_name(self, name: str) -> Optional[Persona]:
+    async def get_persona_by_name(self, name: str, trust_db: bool = True) -> Optional[Persona]:
         """Get persona by name"""
+        persona = self._name_cache.get(name)
+        if persona is not None:
+            return persona
+        
+        writes = self._persona_writes
         persona_data = await self.sqlite.get_persona_by_name(name)
         if persona_data:
-            return Persona(**persona_data)
+            persona = self._hydrate(Persona, persona_data, trust_db)
+            if self._persona_writes == writes:
+                self._cache_persona(persona)
+            return persona
         return None
 
-    async def list_personas(self) -> List[Persona]:
+    async def list_personas(self, trust_db: bool = True) -> List[Persona]:
         """Get all personas"""
         personas_data = await self.sqlite.list_personas()
-        return personas_data
+        return [
+            p if isinstance(p, Persona) else self._hydrate(Persona, p, trust_db)
+            for p in personas_data
+        ]
 
     async def update_persona(self, persona_id: str, updates: Dict[str, Any]) -> bool:
         """Update persona data"""
-        success = await self.sqlite.update_persona(persona_id, updates)
+        self._evict_persona(persona_id)
+        try:
+            success = await self.sqlite.update_persona(persona_id, updates)
+        finally:
+            self._invalidate_persona(persona_id)
         if success:
-            self.logger.info(f"Updated persona: {persona_id}")
+            self.logger.info("Updated persona: %s", persona_id)
         return success
 
     async def delete_persona(self, persona_id: str) -> bool:
         """Delete persona and all associated data"""
-        # Delete from vector memory
-        await self.vector.delete_persona_memories(persona_id)
+        self._evict_persona(persona_id)
+        
+        # Vector and SQLite deletion are independent, so run them concurrently
+        vector_task = asyncio.create_task(self.vector.delete_persona_memories(persona_id))
+        try:
+            success = await self.sqlite.delete_persona(persona_id)
+        finally:
+            self._invalidate_persona(persona_id)
+            vector_result, = await asyncio.gather(vector_task, return_exceptions=True)
         
-        # Delete from SQLite
-        success = await self.sqlite.delete_persona(persona_id)
+        if isinstance(vector_result, BaseException) or vector_result is False:
+            self.logger.warning(
+                "Vector memory deletion failed for persona %s, retrying in background: %s",
+                persona_id, vector_result
+            )
+            self._schedule_vector_cleanup(persona_id)
         
         if success:
-            self.logger.info(f"Deleted persona and all associated data: {persona_id}")
+            self.logger.info("Deleted persona and all associated data: %s", persona_id)
         
         return success
 
+    def _schedule_vector_cleanup(self, persona_id: str) -> None:
+        """Retry vector memory deletion for a persona without blocking the caller"""
+        task = asyncio.create_task(self._retry_vector_cleanup(persona_id))
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
+
+    async def _retry_vector_cleanup(self, persona_id: str) -> None:
+        """Retry vector memory deletion with exponential backoff"""
+        delay = VECTOR_CLEANUP_BACKOFF_SECONDS
+        for attempt in range(1, VECTOR_CLEANUP_RETRIES + 1):
+            await asyncio.sleep(delay)
+            try:
+                if await self.vector.delete_persona_memories(persona_id) is not False:
+                    self.logger.info("Vector memory cleanup succeeded for persona %s", persona_id)
+                    return
+            except Exception as e:
+                self.logger.warning(
+                    "Vector memory cleanup attempt %d failed for persona %s: %s",
+                    attempt, persona_id, e
+                )
+            delay *= 2
+        
+        self.logger.error(
+            "Giving up on vector memory cleanup for persona %s after %d attempts",
+            persona_id, VECTOR_CLEANUP_RETRIES
+        )
+
     # Memory operations
     async def store_memory(self, memory: Memory) -> bool:
         """Store memory in both vector and structured storage"""
@@ -169,13 +340,15 @@ class DatabaseManager:
         
         success = vector_success and sqlite_success
         if success:
-            self.logger.debug(f"Stored memory for persona {memory.persona_id}")
+            self.logger.debug("Stored memory for persona %s", memory.persona_id)
         
         return success
 
-    async def search_memories(self, persona_id: str, query: str, 
-                            n_results: int = 5, min_importance: float = 0.0) -> List[Memory]:
-        """Search memories using vector similarity"""
+    async def iter_memories(self, persona_id: str, query: str,
+                            n_results: int = 5, min_importance: float = 0.0,
+                            trust_db: bool = True,
+                            as_view: bool = False) -> AsyncIterator[Union[Memory, MemoryView]]:
+        """Yield memory search hits one at a time, optionally as lightweight views"""
         results = await self.vector.search_memories(
             persona_id=persona_id,
             query=query,
@@ -183,15 +356,32 @@ class DatabaseManager:
             min_importance=min_importance
         )
         
-        # Convert to Memory objects
-        memories = []
         for result in results:
-            memory_data = result.get('metadata', {})
-            memory_data['content'] = result.get('content', '')
-            memory_data['id'] = result.get('id', '')
-            memories.append(Memory(**memory_data))
-        
-        return memories
+            memory_id = result.get('id', '')
+            content = result.get('content', '')
+            meta = result.get('metadata', {})
+            if as_view:
+                yield MemoryView(
+                    id=memory_id,
+                    content=content,
+                    importance=meta.get('importance', 0.5),
+                    metadata=meta
+                )
+            else:
+                fields = {k: v for k, v in meta.items() if k in MEMORY_FIELDS}
+                fields['content'] = content
+                fields['id'] = memory_id
+                yield self._hydrate(Memory, fields, trust_db)
+
+    async def search_memories(self, persona_id: str, query: str, 
+                            n_results: int = 5, min_importance: float = 0.0,
+                            trust_db: bool = True) -> List[Memory]:
+        """Search memories using vector similarity"""
+        return [
+            m async for m in self.iter_memories(
+                persona_id, query, n_results, min_importance, trust_db
+            )
+        ]
 
     async def get_memory_stats(self, persona_id: str) -> Dict[str, Any]:
         """Get memory statistics for a persona"""
@@ -202,18 +392,19 @@ class DatabaseManager:
         return await self.vector.prune_memories(persona_id, max_memories)
 
     # Relationship operations  
-    async def get_relationship(self, persona1_id: str, persona2_id: str) -> Optional[Relationship]:
+    async def get_relationship(self, persona1_id: str, persona2_id: str,
+                               trust_db: bool = True) -> Optional[Relationship]:
         """Get relationship between two personas"""
         relationship_data = await self.sqlite.get_relationship(persona1_id, persona2_id)
         if relationship_data:
-            return Relationship(**relationship_data)
+            return self._hydrate(Relationship, relationship_data, trust_db)
         return None
 
     async def create_relationship(self, relationship: Relationship) -> bool:
         """Create a new relationship"""
         success = await self.sqlite.create_relationship(relationship.dict())
         if success:
-            self.logger.info(f"Created relationship: {relationship.persona1_id} <-> {relationship.persona2_id}")
+            self.logger.info("Created relationship: %s <-> %s", relationship.persona1_id, relationship.persona2_id)
         return success
 
     async def update_relationship(self, persona1_id: str, persona2_id: str, 
@@ -221,41 +412,46 @@ class DatabaseManager:
         """Update relationship data"""
         success = await self.sqlite.update_relationship(persona1_id, persona2_id, updates)
         if success:
-            self.logger.info(f"Updated relationship: {persona1_id} <-> {persona2_id}")
+            self.logger.info("Updated relationship: %s <-> %s", persona1_id, persona2_id)
         return success
 
-    async def list_relationships(self, persona_id: str) -> List[Relationship]:
+    async def list_relationships(self, persona_id: str, trust_db: bool = True) -> List[Relationship]:
         """Get all relationships for a persona"""
         relationships_data = await self.sqlite.get_persona_relationships(persona_id)
-        return [Relationship(**r) for r in relationships_data]
+        return [
+            r if isinstance(r, Relationship) else self._hydrate(Relationship, r, trust_db)
+            for r in relationships_data
+        ]
 
     async def delete_relationship(self, persona1_id: str, persona2_id: str) -> bool:
         """Delete a relationship"""
         success = await self.sqlite.delete_relationship(persona1_id, persona2_id)
         if success:
-            self.logger.info(f"Deleted relationship: {persona1_id} <-> {persona2_id}")
+            self.logger.info("Deleted relationship: %s <-> %s", persona1_id, persona2_id)
         return success
 
     # Emotional state operations
-    async def get_emotional_state(self, persona_id: str) -> Optional[EmotionalState]:
+    async def get_emotional_state(self, persona_id: str,
+                                  trust_db: bool = True) -> Optional[EmotionalState]:
         """Get emotional state for a persona"""
         state_data = await self.sqlite.get_emotional_state(persona_id)
         if state_data:
-            return EmotionalState(**state_data)
+            return self._hydrate(EmotionalState, state_data, trust_db)
         return None
 
     async def update_emotional_state(self, persona_id: str, state: EmotionalState) -> bool:
         """Update emotional state for a persona"""
         success = await self.sqlite.update_emotional_state(persona_id, state.dict())
         if success:
-            self.logger.debug(f"Updated emotional state for persona {persona_id}")
+            self.logger.debug("Updated emotional state for persona %s", persona_id)
         return success
 
     # System operations
     async def get_system_stats(self) -> Dict[str, Any]:
         """Get overall system statistics"""
-        sqlite_stats = await self.sqlite.get_stats()
-        vector_stats = await self.vector.get_stats()
+        sqlite_stats, vector_stats = await asyncio.gather(
+            self.sqlite.get_stats(), self.vector.get_stats()
+        )
         
         return {
             "personas": sqlite_stats.get("personas", 0),
@@ -5,8 +5,12 @@ Provides unified memory operations for both MCP server and PersonaAPI server
 to ensure operational parity and consistent memory management.
 """
 
+import asyncio
 from typing import Dict, List, Any, Optional
 from ..persistence import VectorMemoryManager
+from ..persistence.vector_memory import (
+    HNSW_SEARCH_EF, STORE_BATCH_SIZE, STORE_BATCH_WINDOW_MS
+)
 from ..memory.importance_scorer import MemoryImportanceScorer
 from ..memory.decay_system import MemoryDecaySystem
 from ..memory.pruning_system import MemoryPruningSystem
@@ -17,8 +21,18 @@ from .models import Memory, Persona
 class MemoryManager:
     """Unified memory management system for both services"""
     
-    def __init__(self, vector_manager: Optional[VectorMemoryManager] = None):
-        self.vector_manager = vector_manager or VectorMemoryManager()
+    def __init__(self, vector_manager: Optional[VectorMemoryManager] = None,
+                 ef_search: int = HNSW_SEARCH_EF,
+                 max_batch_size: int = STORE_BATCH_SIZE,
+                 batch_window_ms: float = STORE_BATCH_WINDOW_MS):
+        # Tuning knobs only apply to the default vector store:
+        # ef_search trades recall for latency on its HNSW graph, and the
+        # batch settings control how concurrent stores share an embedding pass
+        self.vector_manager = vector_manager or VectorMemoryManager(
+            ef_search=ef_search,
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms
+        )
         self.importance_scorer = MemoryImportanceScorer()
         
         # Create pruning system first (no dependencies)
@@ -101,17 +115,12 @@ class MemoryManager:
             metadata=metadata or {}
         )
 
-        # Store in vector database
-        success = await self.vector_manager.store_memory(
-            persona_id=persona_id,
-            content=content,
-            memory_type=memory_type,
-            importance=importance,
-            metadata=memory.dict()
-        )
+        # Store in vector database; the backend reads the fields it needs off
+        # the Memory directly instead of a full model dump
+        success = await self.vector_manager.store_memory(memory)
 
         if success:
-            self.logger.debug(f"Stored memory for persona {persona_id} (importance: {importance:.2f})")
+            self.logger.debug("Stored memory for persona %s (importance: %.2f)", persona_id, importance)
         
         return memory
 
@@ -127,18 +136,7 @@ class MemoryManager:
 
         memories = []
         for result in results:
-            metadata = result.get('metadata', {})
-            memory = Memory(
-                id=result.get('id', ''),
-                content=result.get('content', ''),
-                persona_id=metadata.get('persona_id', persona_id),
-                memory_type=metadata.get('memory_type', 'conversation'),
-                importance=metadata.get('importance', 0.5),
-                emotional_valence=metadata.get('emotional_valence', 0.0),
-                related_personas=metadata.get('related_personas', []),
-                visibility=metadata.get('visibility', 'private'),
-                metadata=metadata
-            )
+            memory = self._memory_from_result(result, persona_id, 'private')
             memory.access()  # Record access
             memories.append(memory)
 
@@ -156,23 +154,26 @@ class MemoryManager:
             min_importance=min_importance
         )
 
-        memories = []
-        for result in results:
-            metadata = result.get('metadata', {})
-            memory = Memory(
-                id=result.get('id', ''),
-                content=result.get('content', ''),
-                persona_id=metadata.get('persona_id', ''),
-                memory_type=metadata.get('memory_type', 'conversation'),
-                importance=metadata.get('importance', 0.5),
-                emotional_valence=metadata.get('emotional_valence', 0.0),
-                related_personas=metadata.get('related_personas', []),
-                visibility=metadata.get('visibility', 'shared'),
-                metadata=metadata
-            )
-            memories.append(memory)
+        return [self._memory_from_result(result, '', 'shared') for result in results]
 
-        return memories
+    @staticmethod
+    def _memory_from_result(result: Dict[str, Any], persona_id: str,
+                            visibility: str) -> Memory:
+        """Build a Memory from a vector store hit, skipping field validation"""
+        # Hits were validated when stored, so model_construct avoids re-running
+        # pydantic validation for every row of a search fan-out
+        metadata = result.get('metadata', {})
+        return Memory.model_construct(
+            id=result.get('id', ''),
+            content=result.get('content', ''),
+            persona_id=metadata.get('persona_id', persona_id),
+            memory_type=metadata.get('memory_type', 'conversation'),
+            importance=metadata.get('importance', 0.5),
+            emotional_valence=metadata.get('emotional_valence', 0.0),
+            related_personas=metadata.get('related_personas', []),
+            visibility=metadata.get('visibility', visibility),
+            metadata=metadata
+        )
 
     async def get_memory_stats(self, persona_id: str) -> Dict[str, Any]:
         """Get detailed memory statistics for a persona"""
@@ -229,14 +230,24 @@ class MemoryManager:
         """Delete all memories for a persona"""
         success = await self.vector_manager.delete_persona_memories(persona_id)
         if success:
-            self.logger.info(f"Deleted all memories for persona {persona_id}")
+            self.logger.info("Deleted all memories for persona %s", persona_id)
         return success
 
     async def get_system_stats(self) -> Dict[str, Any]:
         """Get comprehensive memory system statistics"""
-        vector_stats = await self.vector_manager.get_stats()
-        decay_stats = self.decay_system.get_decay_stats()
-        pruning_stats = self.pruning_system.get_pruning_stats()
+        # Fan out so a slow vector backend doesn't serialize the other sections,
+        # and a failing one doesn't take the whole report down
+        results = await asyncio.gather(
+            self.vector_manager.get_stats(),
+            self.get_decay_stats(),
+            self.get_pruning_stats(),
+            return_exceptions=True
+        )
+        vector_stats, decay_stats, pruning_stats = (
+            {"healthy": False, "details": f"Error: {result}"}
+            if isinstance(result, Exception) else result
+            for result in results
+        )
 
         return {
             "vector_memory": vector_stats,
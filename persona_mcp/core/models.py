@@ -5,14 +5,42 @@ These models are used by both MCP server and PersonaAPI server to ensure
 operational parity and consistent data structures.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from pydantic import BaseModel, Field
-import uuid
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, computed_field, model_validator
+import os
+import threading
 import time
 
 
+# Last (millisecond, sequence) handed out; ids minted in one millisecond
+# count up from 0 and spill into the next millisecond past 0xFFF
+_id_lock = threading.Lock()
+_id_state = [0, 0]
+
+
+def _time_ordered_id() -> str:
+    """UUIDv7-style id whose millisecond prefix keeps new records in insertion order"""
+    now = time.time_ns() // 1_000_000
+    with _id_lock:
+        millis, sequence = _id_state
+        if now > millis:
+            millis, sequence = now, 0
+        elif sequence < 0xFFF:
+            # Same millisecond, or the clock stepped back: stay on the last one
+            sequence += 1
+        else:
+            millis, sequence = millis + 1, 0
+        _id_state[0], _id_state[1] = millis, sequence
+    random_bits = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    digits = '%012x%04x%016x' % (
+        millis & 0xFFFF_FFFF_FFFF, 0x7000 | sequence, 0x8000_0000_0000_0000 | random_bits
+    )
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
 class Priority(str, Enum):
     """Persona priority levels"""
     URGENT = "urgent"
@@ -24,9 +52,13 @@ class Priority(str, Enum):
     NONE = "none"
 
 
+# Value -> member table so unvalidated hydration skips Enum.__call__ per row
+PRIORITY_BY_VALUE = {p.value: p for p in Priority}
+
+
 class PersonaBase(BaseModel):
     """Base persona information"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_time_ordered_id)
     name: str
     description: str
     personality_traits: Dict[str, Any] = Field(default_factory=dict)
@@ -48,6 +80,14 @@ class PersonaInteractionState(BaseModel):
     cooldown_until: float = Field(default=0)  # timestamp when can re-engage
     last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+    @classmethod
+    def model_construct(cls, _fields_set=None, **values):
+        """Unvalidated construction that still maps a raw priority string to Priority"""
+        priority = values.get("current_priority")
+        if priority is not None and not isinstance(priority, Priority):
+            values["current_priority"] = PRIORITY_BY_VALUE.get(priority, Priority.NONE)
+        return super().model_construct(_fields_set, **values)
+
     def is_available(self) -> bool:
         """Check if persona is available for interaction"""
         return (time.time() >= self.cooldown_until and 
@@ -79,10 +119,21 @@ class Persona(PersonaBase):
         if self.interaction_state is None:
             self.interaction_state = PersonaInteractionState(persona_id=self.id)
 
+    @classmethod
+    def model_construct(cls, _fields_set=None, **values):
+        """Unvalidated construction that still guarantees an interaction state"""
+        persona = super().model_construct(_fields_set, **values)
+        state = persona.interaction_state
+        if state is None:
+            persona.interaction_state = PersonaInteractionState.model_construct(persona_id=persona.id)
+        elif isinstance(state, dict):
+            persona.interaction_state = PersonaInteractionState.model_construct(**state)
+        return persona
+
 
 class Memory(BaseModel):
     """Individual memory record"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_time_ordered_id)
     persona_id: str
     content: str
     memory_type: str = "conversation"  # conversation, relationship, event, etc.
@@ -93,12 +144,68 @@ class Memory(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     accessed_count: int = Field(default=0)
-    last_accessed: Optional[datetime] = None
+    # Last access as epoch nanoseconds (0 = never); exposed as datetime via last_accessed
+    last_accessed_ns: int = Field(default=0, exclude=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_last_accessed(cls, data: Any) -> Any:
+        """Accept a last_accessed datetime (or ISO string) on input"""
+        if isinstance(data, dict) and "last_accessed" in data:
+            data = dict(data)
+            _set_last_accessed_ns(data, data.pop("last_accessed"))
+        return data
+
+    @classmethod
+    def model_construct(cls, _fields_set=None, **values):
+        """Unvalidated construction that still accepts a last_accessed datetime"""
+        if "last_accessed" in values:
+            _set_last_accessed_ns(values, values.pop("last_accessed"))
+        return super().model_construct(_fields_set, **values)
+
+    @computed_field
+    @property
+    def last_accessed(self) -> Optional[datetime]:
+        """Time of the last access, materialized only when read"""
+        if not self.last_accessed_ns:
+            return None
+        return datetime.fromtimestamp(self.last_accessed_ns / 1e9, timezone.utc)
 
     def access(self):
         """Record memory access for relevance tracking"""
         self.accessed_count += 1
-        self.last_accessed = datetime.now(timezone.utc)
+        self.last_accessed_ns = time.time_ns()
+
+
+# Parses last_accessed inputs (datetimes, ISO strings) the way a datetime field would
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+
+def _set_last_accessed_ns(values: Dict[str, Any], last_accessed: Any) -> None:
+    """Translate a last_accessed value into last_accessed_ns unless already given"""
+    if last_accessed is None or "last_accessed_ns" in values:
+        return
+    if isinstance(last_accessed, (int, float)):
+        # Epoch seconds, as the vector store records them on access
+        values["last_accessed_ns"] = int(last_accessed * 1_000_000) * 1000
+        return
+    last_accessed = _DATETIME_ADAPTER.validate_python(last_accessed)
+    if last_accessed.tzinfo is None:
+        last_accessed = last_accessed.replace(tzinfo=timezone.utc)
+    values["last_accessed_ns"] = int(last_accessed.timestamp() * 1_000_000) * 1000
+
+
+# Field names accepted by Memory, used to project vector-store metadata onto it
+MEMORY_FIELDS = frozenset(Memory.model_fields) | frozenset(Memory.model_computed_fields)
+
+
+@dataclass(slots=True)
+class MemoryView:
+    """Read-only projection of a memory search hit without Pydantic overhead"""
+    id: str
+    content: str
+    importance: float
+    metadata: Dict[str, Any]
 
 
 class RelationshipType(str, Enum):
@@ -115,6 +222,50 @@ class RelationshipType(str, Enum):
     FAMILY = "family"
 
 
+# Value -> member table so unvalidated hydration skips Enum.__call__ per row
+RELATIONSHIP_TYPE_BY_VALUE = {t.value: t for t in RelationshipType}
+
+
+def _interaction_effect(mood: float, social_battery: float, relationship_quality: float,
+                        duration_minutes: float) -> Tuple[float, float]:
+    """Emotional update math on plain floats, returning (mood, social_battery)"""
+    # Positive interactions boost mood and drain social battery
+    mood += relationship_quality * 0.1 * min(duration_minutes / 10, 1.0)
+    mood = -1.0 if mood < -1.0 else 1.0 if mood > 1.0 else mood
+
+    # All interactions drain social battery
+    social_battery -= duration_minutes / 60.0 * 0.3  # 30% per hour of interaction
+    return mood, 0.0 if social_battery < 0.0 else social_battery
+
+
+def _update_relationship_dimensions(affinity: float, trust: float, respect: float,
+                                    intimacy: float, interaction_quality: float,
+                                    duration_minutes: float) -> Tuple[float, float, float, float]:
+    """Relationship update math on plain floats, returning (affinity, trust, respect, intimacy)"""
+    # Weight recent interactions more heavily
+    weight = min(1.0, duration_minutes / 30.0)  # Max weight at 30+ minutes
+
+    affinity += interaction_quality * 0.05 * weight
+    affinity = -1.0 if affinity < -1.0 else 1.0 if affinity > 1.0 else affinity
+
+    # Trust builds slowly with positive interactions
+    if interaction_quality > 0:
+        trust += interaction_quality * 0.03 * weight
+        trust = -1.0 if trust < -1.0 else 1.0 if trust > 1.0 else trust
+
+    # Respect can change based on impressive/disappointing interactions
+    if abs(interaction_quality) > 0.5:  # Significant interactions
+        respect += interaction_quality * 0.04 * weight
+        respect = -1.0 if respect < -1.0 else 1.0 if respect > 1.0 else respect
+
+    # Intimacy grows with positive, extended interactions
+    if interaction_quality > 0.3 and duration_minutes > 10:
+        intimacy += 0.02 * weight
+        intimacy = 1.0 if intimacy > 1.0 else intimacy
+
+    return affinity, trust, respect, intimacy
+
+
 class EmotionalState(BaseModel):
     """Emotional state tracking for personas"""
     persona_id: str
@@ -127,13 +278,9 @@ class EmotionalState(BaseModel):
     
     def apply_interaction_effect(self, relationship_quality: float, duration_minutes: float):
         """Update emotional state based on social interaction"""
-        # Positive interactions boost mood and drain social battery
-        mood_change = relationship_quality * 0.1 * min(duration_minutes / 10, 1.0)
-        self.mood = max(-1.0, min(1.0, self.mood + mood_change))
-        
-        # All interactions drain social battery
-        battery_drain = duration_minutes / 60.0 * 0.3  # 30% per hour of interaction
-        self.social_battery = max(0.0, self.social_battery - battery_drain)
+        self.mood, self.social_battery = _interaction_effect(
+            self.mood, self.social_battery, relationship_quality, duration_minutes
+        )
         
         # Update timestamp
         self.last_updated = datetime.now(timezone.utc)
@@ -151,9 +298,13 @@ class EmotionalState(BaseModel):
             self.mood = min(0.0, self.mood + mood_drift)
 
 
+# Relationship fields that feed the cached compatibility/strength scores
+_RELATIONSHIP_DIMENSIONS = frozenset({"affinity", "trust", "respect", "intimacy"})
+
+
 class Relationship(BaseModel):
     """Enhanced relationship state between two personas"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_time_ordered_id)
     persona1_id: str
     persona2_id: str
     
@@ -178,9 +329,40 @@ class Relationship(BaseModel):
     # Dynamic factors
     recent_interaction_quality: float = Field(default=0.0, ge=-1.0, le=1.0)  # quality of last few interactions
     compatibility_factors: Dict[str, float] = Field(default_factory=dict)    # specific compatibility areas
+
+    # Derived scores, cleared whenever a core dimension is assigned (None = dirty)
+    _cached_compatibility: Optional[float] = PrivateAttr(default=None)
+    _cached_strength: Optional[float] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in _RELATIONSHIP_DIMENSIONS:
+            self._cached_compatibility = None
+            self._cached_strength = None
+        super().__setattr__(name, value)
+
+    @classmethod
+    def model_construct(cls, _fields_set=None, **values):
+        """Unvalidated construction that still maps a raw type string to RelationshipType"""
+        relationship_type = values.get("relationship_type")
+        if relationship_type is not None and not isinstance(relationship_type, RelationshipType):
+            values["relationship_type"] = RELATIONSHIP_TYPE_BY_VALUE.get(
+                relationship_type, RelationshipType.STRANGER
+            )
+        return super().model_construct(_fields_set, **values)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        """Copy the relationship, dropping cached scores if dimensions change"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and not _RELATIONSHIP_DIMENSIONS.isdisjoint(update):
+            copied._cached_compatibility = None
+            copied._cached_strength = None
+        return copied
     
     def get_compatibility_score(self) -> float:
         """Calculate overall social compatibility (0.0 to 1.0)"""
+        if self._cached_compatibility is not None:
+            return self._cached_compatibility
+
         base_score = (abs(self.affinity) * 0.3 + abs(self.trust) * 0.25 + 
                      abs(self.respect) * 0.25 + self.intimacy * 0.2)
         
@@ -188,12 +370,17 @@ class Relationship(BaseModel):
         if self.affinity > 0 and self.trust > 0:
             base_score *= 1.2
             
-        return min(1.0, base_score)
+        self._cached_compatibility = min(1.0, base_score)
+        return self._cached_compatibility
     
     def get_relationship_strength(self) -> float:
         """Get overall relationship strength (-1.0 to 1.0)"""
-        return (self.affinity * 0.4 + self.trust * 0.3 + self.respect * 0.2 + 
-                (self.intimacy if self.affinity > 0 else -self.intimacy) * 0.1)
+        if self._cached_strength is None:
+            self._cached_strength = (
+                self.affinity * 0.4 + self.trust * 0.3 + self.respect * 0.2 +
+                (self.intimacy if self.affinity > 0 else -self.intimacy) * 0.1
+            )
+        return self._cached_strength
     
     def update_relationship_type(self):
         """Auto-update relationship type based on dimensions"""
@@ -215,38 +402,23 @@ class Relationship(BaseModel):
     def update_from_interaction(self, interaction_quality: float, duration_minutes: float = 5.0, 
                               context: str = "conversation"):
         """Update relationship based on interaction outcome"""
-        # Weight recent interactions more heavily
-        weight = min(1.0, duration_minutes / 30.0)  # Max weight at 30+ minutes
-        
         # Update core dimensions
-        affinity_change = interaction_quality * 0.05 * weight
-        self.affinity = max(-1.0, min(1.0, self.affinity + affinity_change))
-        
-        # Trust builds slowly with positive interactions
-        if interaction_quality > 0:
-            trust_change = interaction_quality * 0.03 * weight
-            self.trust = max(-1.0, min(1.0, self.trust + trust_change))
-        
-        # Respect can change based on impressive/disappointing interactions
-        if abs(interaction_quality) > 0.5:  # Significant interactions
-            respect_change = interaction_quality * 0.04 * weight
-            self.respect = max(-1.0, min(1.0, self.respect + respect_change))
-        
-        # Intimacy grows with positive, extended interactions
-        if interaction_quality > 0.3 and duration_minutes > 10:
-            intimacy_change = 0.02 * weight
-            self.intimacy = min(1.0, self.intimacy + intimacy_change)
+        self.affinity, self.trust, self.respect, self.intimacy = _update_relationship_dimensions(
+            self.affinity, self.trust, self.respect, self.intimacy,
+            interaction_quality, duration_minutes
+        )
         
         # Update metadata
+        now = datetime.now(timezone.utc)
         self.interaction_count += 1
         self.total_interaction_time += int(duration_minutes)
-        self.last_interaction = datetime.now(timezone.utc)
+        self.last_interaction = now
         self.recent_interaction_quality = interaction_quality
         
         # Record memorable moments
         if abs(interaction_quality) > 0.7:
             self.memorable_moments.append({
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": now.isoformat(),
                 "quality": interaction_quality,
                 "context": context,
                 "duration": duration_minutes
@@ -268,7 +440,7 @@ class Relationship(BaseModel):
 
 class ConversationContext(BaseModel):
     """Current conversation state and context"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_time_ordered_id)
     participants: List[str] = Field(default_factory=list)  # persona IDs
     current_speaker: Optional[str] = None
     topic: str = Field(default="general")
@@ -302,7 +474,7 @@ class ConversationContext(BaseModel):
 
 class ConversationTurn(BaseModel):
     """Individual turn in a conversation"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_time_ordered_id)
     conversation_id: str
     speaker_id: str
     turn_number: int
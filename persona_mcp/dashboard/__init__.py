@@ -8,9 +8,13 @@ bot process control, and administrative functions.
 from .server import PersonaAPIServer
 from .mcp_client import MCPClient
 from .bot_manager import BotProcessManager
+from .cache import MCPCache
+from .batching import MicroBatcher
 
 __all__ = [
     "PersonaAPIServer",
     "MCPClient", 
-    "BotProcessManager"
+    "BotProcessManager",
+    "MCPCache",
+    "MicroBatcher"
 ]
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Micro-batching for concurrent MCP calls made by the PersonaAPI server.
+
+Requests that arrive within a short window are collected and sent to the
+MCP server as one batched call, so a burst of dashboard tabs costs one
+round-trip instead of one per tab.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..logging import get_logger
+
+
+# Most items dispatched in one batched call
+MICRO_BATCH_MAX_SIZE = 32
+
+# Seconds the first item in a batch waits for company before dispatch
+MICRO_BATCH_TIMEOUT = 0.02
+
+
+class MicroBatcher:
+    """Collect concurrent submissions and dispatch them through one batch handler"""
+
+    def __init__(self, handler: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_size: int = MICRO_BATCH_MAX_SIZE, timeout: float = MICRO_BATCH_TIMEOUT):
+        self.handler = handler
+        self.max_size = max_size
+        self.timeout = timeout
+        self.logger = get_logger(__name__)
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._dispatching = set()
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: Any) -> Any:
+        """Queue item for the next batch and wait for its result"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.timeout, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatching.add(task)
+            task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            self.logger.warning(f"Batch of {len(batch)} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batch counters"""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+            "pending": len(self._pending)
+        }
@@ -8,15 +8,338 @@ providing lifecycle management, logging, and monitoring.
 import subprocess
 import sys
 import asyncio
+import ctypes
+import ctypes.util
 import os
+import select
 import signal
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 
 from ..logging import get_logger
 from ..core import ConfigManager
+from ..utils import fast_json as json
+
+
+# Log markers that end the startup wait
+STARTUP_SUCCESS_MARKERS = (b"Connected to MCP server", b"Bot started successfully")
+STARTUP_FAILURE_MARKERS = (b"ERROR", b"FATAL")
+
+# Bytes read per syscall while scanning a log during startup
+LOG_SCAN_CHUNK_SIZE = 65536
+
+# Bytes carried over between log reads so markers split across reads still match
+_MARKER_OVERLAP = max(map(len, STARTUP_SUCCESS_MARKERS + STARTUP_FAILURE_MARKERS)) - 1
+
+# inotify constants from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+
+def _load_inotify():
+    """Return libc if it provides inotify, otherwise None"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+_libc = _load_inotify()
+
+# Exit polling backoff when neither pidfd nor kqueue is available (seconds)
+EXIT_POLL_INITIAL_DELAY = 0.01
+EXIT_POLL_BACKOFF = 1.5
+EXIT_POLL_MAX_DELAY = 1.0
+
+# Safety sweep interval for exits missed by the per-bot exit watches (seconds)
+MONITOR_SWEEP_INTERVAL = 60
+
+# Rotated copies kept per bot log (bot.log.1 .. bot.log.N)
+LOG_BACKUP_COUNT = 3
+
+# Bot output buffered ahead of the log writer before the pipe stops being read
+LOG_SINK_MAX_PENDING = 1024 * 1024
+
+# Pause before reading a bot's output pipe again after a read error (seconds)
+LOG_SINK_RETRY_DELAY = 1.0
+
+# Initial bytes read back per requested log line when tailing
+TAIL_BYTES_PER_LINE = 256
+
+# Poll interval while some bot has no exit watch (seconds)
+MONITOR_POLL_INTERVAL = 10
+
+# Bot poll cadence by age, oldest first: (min age seconds, tier, interval seconds)
+BOT_POLL_TIERS = (
+    (600, "cold", 60.0),
+    (60, "warm", 10.0),
+    (0, "hot", 1.0),
+)
+
+
+class _LogWatch:
+    """Wakes waiters when a log file is modified, via inotify where available"""
+
+    def __init__(self, path: Path, fallback_interval: float = 1.0):
+        self.fallback_interval = fallback_interval
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._fd = None
+
+        if _libc is not None:
+            fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd >= 0:
+                if _libc.inotify_add_watch(fd, os.fsencode(path), _IN_MODIFY) >= 0:
+                    self._fd = fd
+                    self._loop.add_reader(fd, self._drain)
+                else:
+                    os.close(fd)
+
+    def _drain(self):
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._changed.set()
+
+    async def wait(self, timeout: float):
+        """Wait until the file is modified or timeout elapses"""
+        if self._fd is None:
+            await asyncio.sleep(min(timeout, self.fallback_interval))
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
+
+    def close(self):
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+
+class _RotatingLogSink:
+    """Copies a bot's output pipe into a size-capped, rotated log file"""
+
+    def __init__(self, pipe, log_file: Path, max_bytes: int,
+                 backup_count: int = LOG_BACKUP_COUNT):
+        self.log_file = log_file
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.closed = asyncio.Event()
+        # Set while the startup scan reads the log by offset; the file is
+        # then left to grow past max_bytes rather than be swapped under it
+        self.hold_rotation = False
+        self.logger = get_logger(__name__)
+
+        self._pipe = pipe
+        self._fd = pipe.fileno()
+        os.set_blocking(self._fd, False)
+        self._file = open(log_file, 'ab')
+        self._size = self._file.tell()
+
+        # Chunks read from the pipe, written to disk off the event loop by
+        # one executor job at a time
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._writer = None
+        self._reading = True
+        self._eof = False
+        # Set after a failed write until one succeeds again, so a full disk
+        # is reported once rather than per batch
+        self._write_failed = False
+
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._fd, self._on_readable)
+
+    def _on_readable(self):
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            # Closing the pipe would kill the bot with EPIPE; try again later
+            self.logger.error(f"Error reading bot output for {self.log_file}: {e}")
+            self._stop_reading()
+            self._loop.call_later(LOG_SINK_RETRY_DELAY, self._resume_reading)
+            return
+        if not data:
+            # Bot closed its output (normally because it exited)
+            self._eof = True
+            self._stop_reading()
+            if self._writer is None:
+                self.close()
+            return
+
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        if self._pending_bytes >= LOG_SINK_MAX_PENDING:
+            # Let the pipe fill up until the writer catches up
+            self._stop_reading()
+        if self._writer is None:
+            self._start_write()
+
+    def _start_write(self):
+        chunks, self._pending, self._pending_bytes = self._pending, [], 0
+        self._writer = self._loop.run_in_executor(None, self._write, chunks)
+        self._writer.add_done_callback(self._on_written)
+
+    def _on_written(self, writer):
+        self._writer = None
+        if self.closed.is_set():
+            return
+        error = writer.exception()
+        if error is not None:
+            # The batch is dropped but the pipe keeps draining so the bot
+            # never blocks or dies on a logging problem
+            if not self._write_failed:
+                self.logger.error(f"Dropping bot output, cannot write {self.log_file}: {error}")
+                self._write_failed = True
+        elif self._write_failed:
+            self.logger.info(f"Resumed writing bot log {self.log_file}")
+            self._write_failed = False
+
+        if self._pending:
+            self._start_write()
+        elif self._eof:
+            self.close()
+            return
+        self._resume_reading()
+
+    def _resume_reading(self):
+        if (not self._reading and not self._eof and not self.closed.is_set()
+                and self._pending_bytes < LOG_SINK_MAX_PENDING):
+            self._reading = True
+            self._loop.add_reader(self._fd, self._on_readable)
+
+    def _write(self, chunks: List[bytes]):
+        """Append chunks to the log, rotating as it fills (runs in an executor)"""
+        if self._file.closed:
+            # An earlier write or rotation failed; start from a fresh handle
+            self._file = open(self.log_file, 'ab')
+            self._size = self._file.tell()
+        try:
+            for data in chunks:
+                if self._size and self._size + len(data) > self.max_bytes and not self.hold_rotation:
+                    self._rotate()
+                self._file.write(data)
+                self._size += len(data)
+            self._file.flush()
+        except OSError:
+            # Drop the handle along with anything it still buffers
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            raise
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self.log_file.with_name(f"{self.log_file.name}.{i}")
+            if src.exists():
+                os.replace(src, self.log_file.with_name(f"{self.log_file.name}.{i + 1}"))
+        if self.backup_count > 0:
+            os.replace(self.log_file, self.log_file.with_name(f"{self.log_file.name}.1"))
+        self._file = open(self.log_file, 'wb')
+        self._size = 0
+
+    def _stop_reading(self):
+        if self._reading:
+            self._reading = False
+            self._loop.remove_reader(self._fd)
+
+    def close(self):
+        if self.closed.is_set():
+            return
+        self._stop_reading()
+        self._pipe.close()
+        if self._writer is None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        else:
+            # The file belongs to the in-flight write; close it after that
+            self._writer.add_done_callback(lambda _: self._file.close())
+        self.closed.set()
+
+
+def _scan_startup_log(path: Path, offset: int,
+                      carry: bytes) -> Tuple[Optional[bool], int, bytes]:
+    """Scan log bytes appended after offset for startup markers
+
+    Returns (True, ...) on success, (False, ...) on failure, and (None, offset, carry)
+    to resume from when neither marker has been written yet.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Raw bytes so ASCII markers are found without a UTF-8 decode
+        while data := os.pread(fd, LOG_SCAN_CHUNK_SIZE, offset):
+            offset += len(data)
+            window = carry + data
+            if any(window.find(marker) >= 0 for marker in STARTUP_SUCCESS_MARKERS):
+                return True, offset, b""
+            if any(window.find(marker) >= 0 for marker in STARTUP_FAILURE_MARKERS):
+                return False, offset, b""
+            carry = window[-_MARKER_OVERLAP:]
+    finally:
+        os.close(fd)
+    return None, offset, carry
+
+
+def _tail_lines(path: Path, lines: int) -> List[str]:
+    """Read the last lines of a file by seeking back from the end"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        window = lines * TAIL_BYTES_PER_LINE
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            chunks = f.read(size - start).splitlines(keepends=True)
+            if start > 0:
+                # The first line is cut off by the seek
+                chunks = chunks[1:]
+            if len(chunks) >= lines or start == 0:
+                return [c.decode('utf-8', errors='replace') for c in chunks[-lines:]]
+            window *= 2
+
+
+def _open_exit_notifier(pid: int):
+    """Return (fd, close) for an fd that becomes readable when pid exits, or None"""
+    if hasattr(os, "pidfd_open"):
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError:
+            # Kernel older than 5.3 or process already reaped
+            return None
+        return fd, lambda: os.close(fd)
+
+    if hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            kq.control([select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT
+            )], 0)
+        except OSError:
+            kq.close()
+            return None
+        return kq.fileno(), kq.close
+
+    return None
 
 
 @dataclass
@@ -29,6 +352,12 @@ class BotProcess:
     start_time: datetime
     status: str = "running"
     restart_count: int = 0
+    exit_code: Optional[int] = None
+    tier: str = "hot"
+    started_mono: float = field(default_factory=time.monotonic)
+    next_check_mono: float = 0.0
+    log_sink: Optional[_RotatingLogSink] = None
+    pgid: Optional[int] = None
 
 
 class BotProcessManager:
@@ -49,9 +378,28 @@ class BotProcessManager:
         
         # Ensure log directory exists
         self.log_directory.mkdir(parents=True, exist_ok=True)
+
+        # Every bot inherits the same environment
+        self._bot_env = os.environ.copy()
+
+        # Process group shared by bots so stop_all_bots can signal them at once
+        self._bot_pgid: Optional[int] = None
+        # Bumped when stop_all_bots retires the shared group, so a spawn that
+        # was in flight can tell its bot joined a group being stopped
+        self._bot_group_generation = 0
         
         # Active bot processes
         self.running_bots: Dict[str, BotProcess] = {}
+        self._by_pid: Dict[int, BotProcess] = {}
+
+        # get_bot_status() snapshot and its JSON encoding, dropped whenever a
+        # bot starts, exits or is forgotten
+        self._status_snapshot: Optional[List[Dict[str, Any]]] = None
+        self._status_bytes: Optional[bytes] = None
+        
+        # Exit notifier per watched bot PID as (loop, fd, close). Per-process
+        # fds work on any loop, unlike SIGCHLD handlers which uvloop refuses
+        self._exit_watches: Dict[int, Tuple[asyncio.AbstractEventLoop, int, Any]] = {}
         
         # Background monitoring task
         self._monitor_task = None
@@ -60,6 +408,10 @@ class BotProcessManager:
         """Initialize the bot process manager"""
         self.logger.info("Initializing BotProcessManager")
         
+        # Reap bot exits as soon as the kernel reports them
+        for bot_process in self._by_pid.values():
+            self._watch_exit(bot_process)
+
         # Start background monitoring
         self._monitor_task = asyncio.create_task(self._monitor_processes())
         
@@ -79,6 +431,8 @@ class BotProcessManager:
 
         # Stop all running bots
         await self.stop_all_bots()
+        for pid in list(self._exit_watches):
+            self._unwatch_exit(pid)
         
         self.logger.info("BotProcessManager shutdown complete")
 
@@ -97,8 +451,7 @@ class BotProcessManager:
         command = [
             sys.executable, bot_script,
             "--persona-id", persona_id,
-            "--persona-name", persona_name,
-            "--log-file", str(log_file)
+            "--persona-name", persona_name
         ]
         
         # Add additional arguments if provided
@@ -106,15 +459,22 @@ class BotProcessManager:
             command.extend(additional_args)
 
         try:
-            # Start the bot process
-            with open(log_file, 'w') as log_fp:
-                process = subprocess.Popen(
-                    command,
-                    stdout=log_fp,
-                    stderr=subprocess.STDOUT,
-                    cwd=os.getcwd(),
-                    env=os.environ.copy()
+            # Start the bot process off the event loop
+            loop = asyncio.get_running_loop()
+            generation = self._bot_group_generation
+            process, pgid = await loop.run_in_executor(
+                None, self._spawn_bot, command, self._bot_pgid
+            )
+            if generation != self._bot_group_generation and pgid != process.pid:
+                # stop_all_bots retired the group this bot joined while it was
+                # spawning; start it over as the leader of a fresh group
+                process.kill()
+                process.stdout.close()
+                await self._wait_for_exit(process)
+                process, pgid = await loop.run_in_executor(
+                    None, self._spawn_bot, command, None
                 )
+            log_sink = _RotatingLogSink(process.stdout, log_file, self.max_log_file_size)
 
             # Create bot process record
             bot_process = BotProcess(
@@ -123,13 +483,23 @@ class BotProcessManager:
                 process=process,
                 log_file=log_file,
                 start_time=datetime.now(timezone.utc),
-                status="starting"
+                status="starting",
+                log_sink=log_sink,
+                pgid=pgid
             )
 
             self.running_bots[persona_id] = bot_process
+            self._by_pid[process.pid] = bot_process
+            self._bot_pgid = pgid
+            self._watch_exit(bot_process)
+            self._invalidate_status()
             
             # Wait for startup (with timeout)
-            await self._wait_for_startup(bot_process)
+            log_sink.hold_rotation = True
+            try:
+                await self._wait_for_startup(bot_process)
+            finally:
+                log_sink.hold_rotation = False
             
             self.logger.info(f"Started bot for persona {persona_name} (PID: {process.pid})")
             return bot_process
@@ -137,18 +507,49 @@ class BotProcessManager:
         except Exception as e:
             self.logger.error(f"Failed to start bot for persona {persona_name}: {e}")
             # Cleanup on failure
-            if persona_id in self.running_bots:
-                del self.running_bots[persona_id]
+            bot_process = self.running_bots.get(persona_id)
+            if bot_process is not None:
+                self._forget(bot_process)
             raise
 
+    def _spawn_bot(self, command: List[str],
+                   pgid: Optional[int] = None) -> Tuple[subprocess.Popen, int]:
+        """Spawn a bot in process group pgid (or a new one), output on a pipe"""
+        try:
+            process = self._popen(command, pgid or 0)
+        except PermissionError:
+            # Every earlier bot has exited, so the shared group is gone
+            pgid = None
+            process = self._popen(command, 0)
+
+        if not pgid:
+            # The new bot leads a fresh group that later bots join
+            pgid = process.pid
+        return process, pgid
+
+    def _popen(self, command: List[str], process_group: int) -> subprocess.Popen:
+        # Setting a process group rules out posix_spawn, but on Linux CPython
+        # still vforks without preexec_fn, so the dashboard's page tables are
+        # not copied; our own fds are non-inheritable, so close_fds is skipped
+        return subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=self._bot_env,
+            close_fds=False,
+            process_group=process_group
+        )
+
     async def stop_bot(self, persona_id: str) -> bool:
         """Stop a Matrix bot"""
         if persona_id not in self.running_bots:
             self.logger.warning(f"No bot running for persona ID: {persona_id}")
             return False
 
-        bot_process = self.running_bots[persona_id]
-        
+        return await self._stop_process(self.running_bots[persona_id])
+
+    async def _stop_process(self, bot_process: BotProcess) -> bool:
+        """Terminate a bot, force killing it after shutdown_timeout"""
         try:
             # Graceful shutdown
             bot_process.process.terminate()
@@ -169,7 +570,7 @@ class BotProcessManager:
                 self.logger.warning(f"Force killed bot for persona {bot_process.persona_name}")
 
             # Remove from active bots
-            del self.running_bots[persona_id]
+            self._forget(bot_process)
             return True
 
         except Exception as e:
@@ -203,6 +604,7 @@ class BotProcessManager:
             # Start new process
             new_bot = await self.start_bot(persona_id, persona_name)
             new_bot.restart_count = bot_process.restart_count + 1
+            self._invalidate_status()
             return True
             
         except Exception as e:
@@ -216,27 +618,93 @@ class BotProcessManager:
 
         self.logger.info("Stopping all running bots")
         
-        # Stop all bots concurrently
-        stop_tasks = [
-            self.stop_bot(persona_id) 
-            for persona_id in list(self.running_bots.keys())
-        ]
-        
-        await asyncio.gather(*stop_tasks, return_exceptions=True)
+        # Take ownership of the current bots so a concurrent start_bot
+        # lands in a fresh table and process group instead of being stopped
+        bots, self.running_bots = self.running_bots, {}
+        self._invalidate_status()
+        self._bot_pgid = None
+        self._bot_group_generation += 1
+        bot_processes = list(bots.values())
+        for bot_process in bot_processes:
+            bot_process.status = "stopping"
+
+        # Graceful shutdown with one signal per process group
+        self._signal_bots(bot_processes, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._wait_for_exit(b.process) for b in bot_processes)),
+                timeout=self.shutdown_timeout
+            )
+        except asyncio.TimeoutError:
+            # Force kill whatever is left
+            survivors = [b for b in bot_processes if b.process.poll() is None]
+            self._signal_bots(survivors, signal.SIGKILL)
+            await asyncio.gather(*(self._wait_for_exit(b.process) for b in survivors))
+            self.logger.warning(
+                f"Force killed bots for personas {', '.join(b.persona_name for b in survivors)}"
+            )
+
+        for bot_process in bot_processes:
+            self._forget(bot_process)
         
         self.logger.info("All bots stopped")
 
+    def _signal_bots(self, bot_processes: List[BotProcess], sig: int):
+        """Signal bots, once per process group where they share one"""
+        groups = set()
+        for bot_process in bot_processes:
+            if bot_process.process.poll() is not None:
+                # Already reaped: once a group has no live members its number
+                # may belong to an unrelated group
+                continue
+            if bot_process.pgid is None:
+                bot_process.process.send_signal(sig)
+            else:
+                groups.add(bot_process.pgid)
+
+        for pgid in groups:
+            try:
+                os.killpg(pgid, sig)
+            except ProcessLookupError:
+                pass
+
     def get_bot_status(self) -> List[Dict[str, Any]]:
         """Get status of all bots"""
+        return list(self._current_status())
+
+    def get_bot_status_bytes(self) -> bytes:
+        """get_bot_status() as JSON, re-encoded only after a bot state change"""
+        snapshot = self._current_status()
+        if self._status_bytes is None:
+            self._status_bytes = json.dumps_bytes(snapshot)
+        return self._status_bytes
+
+    def _current_status(self) -> List[Dict[str, Any]]:
+        """Poll due bots, then return the status snapshot, rebuilding it only after a change"""
+        self._poll_due_bots()
+        if self._status_snapshot is None:
+            self._status_snapshot = self._build_bot_status()
+        return self._status_snapshot
+
+    def _invalidate_status(self):
+        self._status_snapshot = None
+        self._status_bytes = None
+
+    def _poll_due_bots(self):
+        """Poll the bots whose tier says they are due"""
+        now = time.monotonic()
+        for bot_process in self.running_bots.values():
+            if now >= bot_process.next_check_mono:
+                self._poll_bot(bot_process, now)
+
+    def _build_bot_status(self) -> List[Dict[str, Any]]:
         status_list = []
         
         for persona_id, bot_process in self.running_bots.items():
-            # Check if process is still running
-            poll_result = bot_process.process.poll()
-            if poll_result is None:
+            if bot_process.exit_code is None:
                 status = "running"
             else:
-                status = f"exited ({poll_result})"
+                status = f"exited ({bot_process.exit_code})"
                 bot_process.status = status
 
             status_list.append({
@@ -259,72 +727,182 @@ class BotProcessManager:
         bot_process = self.running_bots[persona_id]
         
         try:
-            with open(bot_process.log_file, 'r') as f:
-                all_lines = f.readlines()
-                return all_lines[-lines:] if len(all_lines) > lines else all_lines
-                
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _tail_lines, bot_process.log_file, lines)
+
         except Exception as e:
             self.logger.error(f"Error reading logs for persona {bot_process.persona_name}: {e}")
             return [f"Error reading logs: {e}"]
 
     async def _wait_for_startup(self, bot_process: BotProcess):
         """Wait for bot startup with timeout"""
-        start_time = datetime.now()
-        
-        while (datetime.now() - start_time).seconds < self.startup_timeout:
-            # Check if process died
-            if bot_process.process.poll() is not None:
-                raise Exception(f"Bot process exited during startup")
-            
-            # Check log file for success indicators
-            try:
-                if bot_process.log_file.exists():
-                    with open(bot_process.log_file, 'r') as f:
-                        content = f.read()
-                        if "Connected to MCP server" in content or "Bot started successfully" in content:
-                            bot_process.status = "running"
-                            return
-                        if "ERROR" in content or "FATAL" in content:
-                            raise Exception("Bot startup failed - check logs")
-            except Exception:
-                pass  # Continue waiting
-            
-            await asyncio.sleep(1)
-        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.startup_timeout
+        exited = asyncio.create_task(self._wait_for_exit(bot_process.process))
+        watch = _LogWatch(bot_process.log_file)
+        offset = 0
+        carry = b""
+
+        try:
+            while loop.time() < deadline:
+                # Check if process died
+                if exited.done():
+                    raise Exception(f"Bot process exited during startup")
+
+                # Scan only what was appended since the last wake-up, off the
+                # event loop so a large burst of output cannot stall it
+                started, offset, carry = await loop.run_in_executor(
+                    None, _scan_startup_log, bot_process.log_file, offset, carry
+                )
+                if started:
+                    bot_process.status = "running"
+                    return
+                if started is False:
+                    raise Exception("Bot startup failed - check logs")
+
+                # Sleep until the log grows or the process exits
+                changed = asyncio.create_task(watch.wait(deadline - loop.time()))
+                await asyncio.wait({exited, changed}, return_when=asyncio.FIRST_COMPLETED)
+                changed.cancel()
+        finally:
+            watch.close()
+            exited.cancel()
+
         # Timeout reached
         bot_process.status = "startup_timeout"
         raise Exception(f"Bot startup timeout ({self.startup_timeout}s)")
 
     async def _wait_for_exit(self, process: subprocess.Popen):
         """Wait for process to exit"""
-        while process.poll() is None:
-            await asyncio.sleep(0.1)
+        if process.poll() is not None:
+            return
+
+        notifier = _open_exit_notifier(process.pid)
+        if notifier is None:
+            # No exit notification: poll quickly at first, then back off
+            delay = EXIT_POLL_INITIAL_DELAY
+            while process.poll() is None:
+                await asyncio.sleep(delay)
+                delay = min(delay * EXIT_POLL_BACKOFF, EXIT_POLL_MAX_DELAY)
+            return
+
+        fd, close = notifier
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        loop.add_reader(fd, lambda: exited.done() or exited.set_result(None))
+        try:
+            # Re-check after registering so an exit in between is not missed
+            if process.poll() is None:
+                await exited
+        finally:
+            loop.remove_reader(fd)
+            close()
+
+        # Reap the child so returncode is populated
+        process.wait()
+
+    def _forget(self, bot_process: BotProcess):
+        """Drop a bot from the active tables"""
+        if self.running_bots.get(bot_process.persona_id) is bot_process:
+            del self.running_bots[bot_process.persona_id]
+            self._invalidate_status()
+            if not self.running_bots:
+                # The group may be gone and its number reused by another
+                # group, so the next bot starts a fresh one
+                self._bot_pgid = None
+        self._by_pid.pop(bot_process.process.pid, None)
+        self._unwatch_exit(bot_process.process.pid)
+
+    def _watch_exit(self, bot_process: BotProcess):
+        """Reap a bot from the event loop as soon as its process exits"""
+        pid = bot_process.process.pid
+        if pid in self._exit_watches:
+            return
+
+        notifier = _open_exit_notifier(pid)
+        if notifier is None:
+            self.logger.warning(
+                f"No exit notification for bot PID {pid}, "
+                f"polling every {MONITOR_POLL_INTERVAL}s instead"
+            )
+            return
+
+        fd, close = notifier
+        loop = asyncio.get_running_loop()
+        loop.add_reader(fd, self._on_bot_exit, bot_process)
+        self._exit_watches[pid] = (loop, fd, close)
+
+    def _unwatch_exit(self, pid: int):
+        """Drop the exit notifier for pid, if any"""
+        watch = self._exit_watches.pop(pid, None)
+        if watch is not None:
+            loop, fd, close = watch
+            loop.remove_reader(fd)
+            close()
+
+    def _poll_bot(self, bot_process: BotProcess, now: float) -> Optional[int]:
+        """Poll a bot and schedule its next check from its age tier"""
+        poll_result = bot_process.process.poll()
+        if poll_result != bot_process.exit_code:
+            bot_process.exit_code = poll_result
+            self._invalidate_status()
+
+        age = now - bot_process.started_mono
+        for min_age, tier, interval in BOT_POLL_TIERS:
+            if age >= min_age:
+                bot_process.tier = tier
+                bot_process.next_check_mono = now + interval
+                break
+
+        return poll_result
+
+    def _on_bot_exit(self, bot_process: BotProcess):
+        """Reap a bot whose exit notifier fired"""
+        # The notifier stays readable, so it is dropped before the bot is
+        # polled; bots being started or stopped are reaped by their owners
+        self._unwatch_exit(bot_process.process.pid)
+        self._reap_exited([bot_process])
+
+    def _reap_exited(self, bot_processes: List[BotProcess]):
+        """Poll the given bots and drop the ones that have exited"""
+        now = time.monotonic()
+        # Poll only our own children so other subprocess owners keep their exit status
+        for bot_process in bot_processes:
+            poll_result = self._poll_bot(bot_process, now)
+
+            # Bots being started or stopped are owned by their own waiters
+            if bot_process.status in ("starting", "stopping"):
+                continue
+
+            if poll_result is not None:
+                # Process has exited
+                self.logger.warning(
+                    f"Bot for persona {bot_process.persona_name} exited "
+                    f"with code {poll_result}"
+                )
+                
+                # Remove from running bots
+                self._forget(bot_process)
+                
+                # Could implement auto-restart logic here if desired
 
     async def _monitor_processes(self):
-        """Background task to monitor bot processes"""
+        """Background sweep for bot exits the exit watches missed"""
         while True:
+            interval = (MONITOR_SWEEP_INTERVAL if len(self._exit_watches) >= len(self._by_pid)
+                        else MONITOR_POLL_INTERVAL)
             try:
-                # Check each running bot
-                for persona_id, bot_process in list(self.running_bots.items()):
-                    poll_result = bot_process.process.poll()
-                    
-                    if poll_result is not None:
-                        # Process has exited
-                        self.logger.warning(
-                            f"Bot for persona {bot_process.persona_name} exited "
-                            f"with code {poll_result}"
-                        )
-                        
-                        # Remove from running bots
-                        del self.running_bots[persona_id]
-                        
-                        # Could implement auto-restart logic here if desired
-                
-                # Monitor every 10 seconds
-                await asyncio.sleep(10)
+                # Poll only the bots whose tier says they are due
+                now = time.monotonic()
+                self._reap_exited([b for b in self._by_pid.values() if now >= b.next_check_mono])
+
+                # Sleep until the soonest next check
+                next_check = min((b.next_check_mono for b in self._by_pid.values()),
+                                 default=now + interval)
+                await asyncio.sleep(min(max(next_check - now, 0.0), interval))
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"Error in bot process monitoring: {e}")
-                await asyncio.sleep(10)
\ No newline at end of file
+                await asyncio.sleep(interval)
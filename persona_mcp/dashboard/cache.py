@@ -0,0 +1,84 @@
+"""
+Read-through cache for MCP calls made by the PersonaAPI server.
+
+Dashboard pages poll the same read endpoints repeatedly; caching their MCP
+results for a few seconds turns most of those polls into memory reads.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from ..utils import TTLCache
+
+
+# Seconds an MCP read result is served from cache
+MCP_CACHE_TTL = 5.0
+
+# Maximum number of cached MCP results
+MCP_CACHE_SIZE = 512
+
+_MISSING = object()
+
+
+class MCPCache:
+    """TTL+LRU cache of MCP read results keyed by (method, *args)"""
+
+    def __init__(self, maxsize: int = MCP_CACHE_SIZE, ttl: float = MCP_CACHE_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: Dict[Tuple[Hashable, ...], asyncio.Task] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_fetch(self, key: Tuple[Hashable, ...],
+                           fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, or await fetch() once for all waiters"""
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, fetch, self._generation))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: Tuple[Hashable, ...], fetch: Callable[[], Awaitable[Any]],
+                     generation: int) -> Any:
+        try:
+            value = await fetch()
+            # Don't cache a result that an invalidation raced with, or an
+            # empty one: MCPClient helpers return None when the call failed
+            if value and generation == self._generation:
+                self._cache.set(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, methods: Iterable[str] = (), persona_id: Optional[str] = None):
+        """Drop entries for the given methods and/or any entry about persona_id"""
+        methods = set(methods)
+        self._generation += 1
+        for key in self._cache.keys():
+            if key[0] in methods or (persona_id is not None and persona_id in key[1:2]):
+                self._cache.pop(key)
+
+    def clear(self):
+        """Drop every cached entry"""
+        self._generation += 1
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "max_entries": self._cache.maxsize,
+            "ttl_seconds": self._cache.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "inflight": len(self._inflight)
+        }
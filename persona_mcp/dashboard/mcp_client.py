@@ -6,7 +6,8 @@ via WebSocket to maintain operational parity.
 """
 
 import asyncio
-import json
+import itertools
+import time
 import websockets
 import uuid
 from typing import Dict, Any, Optional, List
@@ -14,6 +15,22 @@ from contextlib import asynccontextmanager
 
 from ..logging import get_logger
 from ..core import ConfigManager
+from ..utils import fast_json as json  # Use optimized JSON
+
+# WebSocket options for small pipelined JSON-RPC frames: permessage-deflate
+# costs more CPU than it saves on sub-KB messages, and a deeper receive
+# queue keeps many in-flight responses from stalling the reader
+WEBSOCKET_OPTIONS = {
+    "compression": None,
+    "max_size": 2 ** 22,
+    "max_queue": 256,
+    "ping_interval": 20,
+    "ping_timeout": 10,
+    "write_limit": 2 ** 20,
+}
+
+# Seconds a successful health check is reused before asking the server again
+HEALTH_CHECK_TTL = 2.0
 
 
 class MCPClient:
@@ -28,17 +45,33 @@ class MCPClient:
         
         self.websocket = None
         self.logger = get_logger(__name__)
-        self.request_id = 0
-        self.pending_requests = {}
+        self._request_ids = itertools.count(1)
+        # Keyed by the string id echoed back by the server. MCPRequest.id is
+        # a str there, so a slot array indexed by integer id would still need
+        # an int() parse per response and gains nothing over this lookup
+        self.pending_requests: Dict[str, asyncio.Future] = {}
+        self._response_task = None
+        self._connect_lock = asyncio.Lock()
+        # Socket opened by connection() on a cold client and the number of
+        # blocks still using it; the last one out closes it
+        self._borrowed_socket = None
+        self._borrowers = 0
+        self._bare_request_prefixes: Dict[str, str] = {}
+
+        # Health check cache and in-flight check shared by concurrent callers
+        self._health_ttl = HEALTH_CHECK_TTL
+        self._last_health_ok_mono = 0.0
+        self._health_task = None
 
     async def connect(self):
         """Connect to MCP server"""
         try:
-            self.websocket = await websockets.connect(self.mcp_uri)
+            websocket = await websockets.connect(self.mcp_uri, **WEBSOCKET_OPTIONS)
+            self.websocket = websocket
             self.logger.info(f"Connected to MCP server at {self.mcp_uri}")
             
             # Start response handler
-            asyncio.create_task(self._handle_responses())
+            self._response_task = asyncio.create_task(self._handle_responses(websocket))
             
         except Exception as e:
             self.logger.error(f"Failed to connect to MCP server: {e}")
@@ -47,14 +80,15 @@ class MCPClient:
     async def disconnect(self):
         """Disconnect from MCP server"""
         if self.websocket:
+            self._fail_pending(ConnectionError("MCP disconnected"))
             await self.websocket.close()
             self.websocket = None
             self.logger.info("Disconnected from MCP server")
 
-    async def _handle_responses(self):
+    async def _handle_responses(self, websocket):
         """Handle incoming WebSocket responses"""
         try:
-            async for message in self.websocket:
+            async for message in websocket:
                 if not message:
                     continue
                     
@@ -87,28 +121,50 @@ class MCPClient:
             self.logger.error(f"Error handling MCP responses: {e}")
             import traceback
             self.logger.error(f"Full traceback: {traceback.format_exc()}")
+        finally:
+            # Drop the dead socket so the next call reconnects, and fail its
+            # in-flight calls now rather than after their 30s timeout
+            if self.websocket is websocket:
+                self.websocket = None
+                self._fail_pending(ConnectionError("MCP disconnected"))
+
+    def _fail_pending(self, error: Exception):
+        """Fail every in-flight call with error"""
+        pending, self.pending_requests = self.pending_requests, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
 
     async def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Make MCP JSON-RPC call"""
-        if not self.websocket:
-            await self.connect()
+        if self.websocket is None:
+            # Only the first of a burst of callers opens the connection
+            async with self._connect_lock:
+                if self.websocket is None:
+                    await self.connect()
 
-        self.request_id += 1
-        request_id = str(self.request_id)
+        # The server's MCPRequest model types ids as strings
+        request_id = str(next(self._request_ids))
         
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or {},
-            "id": request_id
-        }
+        if params is None:
+            # Parameterless calls (persona.list, system.status, ...) reuse a
+            # pre-encoded envelope and only splice in the numeric id
+            frame = self._bare_request_prefix(method) + request_id + '"}'
+        else:
+            frame = json.dumps({
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params,
+                "id": request_id
+            })
 
-        # Create future for response
-        future = asyncio.Future()
+        # Create future for response; concurrent calls share the socket
+        # and responses are matched back to callers by id
+        future = asyncio.get_running_loop().create_future()
         self.pending_requests[request_id] = future
 
         try:
-            await self.websocket.send(json.dumps(request))
+            await self.websocket.send(frame)
             result = await asyncio.wait_for(future, timeout=30.0)
             return result
             
@@ -119,14 +175,42 @@ class MCPClient:
             self.pending_requests.pop(request_id, None)
             raise Exception(f"MCP call failed: {e}")
 
+    def _bare_request_prefix(self, method: str) -> str:
+        """Encoded request for method with empty params, up to the id value"""
+        prefix = self._bare_request_prefixes.get(method)
+        if prefix is None:
+            envelope = json.dumps({"jsonrpc": "2.0", "method": method, "params": {}})
+            prefix = self._bare_request_prefixes[method] = envelope[:-1] + ',"id":"'
+        return prefix
+
     @asynccontextmanager
     async def connection(self):
         """Context manager for automatic connection management"""
-        await self.connect()
+        async with self._connect_lock:
+            if self.websocket is None:
+                await self.connect()
+                self._borrowed_socket = self.websocket
+                self._borrowers = 0
+            socket = self.websocket
+            # A long-lived connection is borrowed rather than opening a second one
+            cold = socket is self._borrowed_socket
+            if cold:
+                self._borrowers += 1
+
+        if not cold:
+            yield self
+            return
+
         try:
             yield self
         finally:
-            await self.disconnect()
+            # A socket replaced by a newer cold connection is no longer counted
+            if self._borrowed_socket is socket:
+                self._borrowers -= 1
+                if self._borrowers == 0:
+                    self._borrowed_socket = None
+                    if self.websocket is socket:
+                        await self.disconnect()
 
     # Persona operations
     async def list_personas(self) -> List[Dict[str, Any]]:
@@ -166,6 +250,11 @@ class MCPClient:
         })
         return result.get("memories", [])
 
+    async def search_memories_batch(self, searches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several memory searches in one MCP call; each result has memories or error"""
+        result = await self.call("memory.search_batch", {"searches": searches})
+        return result.get("results", [])
+
     async def get_memory_stats(self, persona_id: str) -> Dict[str, Any]:
         """Get memory statistics via MCP"""
         return await self.call("memory.stats", {"persona_id": persona_id})
@@ -210,9 +299,22 @@ class MCPClient:
     # Health check
     async def health_check(self) -> bool:
         """Check if MCP server is healthy"""
+        if (self.websocket is not None and
+                time.monotonic() - self._last_health_ok_mono < self._health_ttl):
+            return True
+
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._check_health())
+        return await asyncio.shield(self._health_task)
+
+    async def _check_health(self) -> bool:
+        """Run one system.status round trip for health_check"""
         try:
             await self.call("system.status")
+            self._last_health_ok_mono = time.monotonic()
             return True
         except Exception as e:
             self.logger.error(f"MCP health check failed: {e}")
-            return False
\ No newline at end of file
+            return False
+        finally:
+            self._health_task = None
\ No newline at end of file
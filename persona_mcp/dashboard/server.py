@@ -6,19 +6,49 @@ and monitoring using shared core components.
 """
 
 import asyncio
+import time
 from typing import Dict, Any, Optional, List
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, status, Depends
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import APIRouter, FastAPI, HTTPException, Request, status, Depends
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel, ConfigDict, Field
 import uvicorn
 
 from ..logging import get_logger
+from ..utils import HAS_ORJSON
 from ..core import DatabaseManager, MemoryManager, ConfigManager
 from .mcp_client import MCPClient
 from .bot_manager import BotProcessManager
+from .cache import MCPCache
+from .batching import MicroBatcher
+
+
+# Landing page, encoded once and served as the same response object every time
+_ROOT_BODY = b"""
+<html>
+    <head><title>Persona MCP - PersonaAPI Server</title></head>
+    <body>
+        <h1>Persona MCP - PersonaAPI Server</h1>
+        <p>HTTP REST API for persona management and monitoring</p>
+        <ul>
+            <li><a href="/docs">API Documentation</a></li>
+            <li><a href="/api/health">Health Check</a></li>
+            <li><a href="/api/personas">List Personas</a></li>
+        </ul>
+    </body>
+</html>
+"""
+_ROOT_RESPONSE = HTMLResponse(content=_ROOT_BODY)
+
+
+class PersonaCreate(BaseModel):
+    """Request body for creating a persona; extra fields pass through to MCP"""
+    model_config = ConfigDict(extra="allow")
+
+    name: str = Field(min_length=1)
 
 
 class PersonaAPIServer:
@@ -27,11 +57,12 @@ class PersonaAPIServer:
     def __init__(self, host: Optional[str] = None, port: Optional[int] = None):
         # Initialize shared core components
         self.core_config = ConfigManager()
+        self.core_config.prewarm()
         self.logger = get_logger(__name__)
         
         # Get PersonaAPI configuration
-        api_config = self.core_config.get_personaapi_config()
-        security_config = self.core_config.get_security_config()
+        api_config = self.core_config.get_cached("personaapi")
+        security_config = self.core_config.get_cached("security")
         
         self.host = host or api_config["host"]
         self.port = port or api_config["port"]
@@ -42,6 +73,11 @@ class PersonaAPIServer:
         
         # Initialize MCP client for operational parity
         self.mcp_client = MCPClient()
+        self.mcp_cache = MCPCache()
+        self.search_batcher = (
+            MicroBatcher(self.mcp_client.search_memories_batch)
+            if api_config["enable_batching"] else None
+        )
         
         # Initialize bot process manager
         self.bot_manager = BotProcessManager()
@@ -52,7 +88,8 @@ class PersonaAPIServer:
             description=api_config["description"],
             version=api_config["version"],
             docs_url=api_config["docs_url"],
-            redoc_url=api_config["redoc_url"]
+            redoc_url=api_config["redoc_url"],
+            default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse
         )
         
         # Add CORS middleware
@@ -65,8 +102,9 @@ class PersonaAPIServer:
                 allow_credentials=True
             )
         
-        # Setup routes
-        self._setup_routes()
+        # Routes are registered once on the module-level router
+        self.app.state.server = self
+        self.app.include_router(router)
 
     async def initialize(self):
         """Initialize all components"""
@@ -101,230 +139,26 @@ class PersonaAPIServer:
         
         self.logger.info("PersonaAPI Server shutdown complete")
 
-    def _setup_routes(self):
-        """Setup FastAPI routes"""
-
-        # Health check
-        @self.app.get("/", response_class=HTMLResponse)
-        async def root():
-            return """
-            <html>
-                <head><title>Persona MCP - PersonaAPI Server</title></head>
-                <body>
-                    <h1>Persona MCP - PersonaAPI Server</h1>
-                    <p>HTTP REST API for persona management and monitoring</p>
-                    <ul>
-                        <li><a href="/docs">API Documentation</a></li>
-                        <li><a href="/api/health">Health Check</a></li>
-                        <li><a href="/api/personas">List Personas</a></li>
-                    </ul>
-                </body>
-            </html>
-            """
-
-        @self.app.get("/api/health")
-        async def health_check():
-            """Health check endpoint"""
-            try:
-                # Check core components
-                db_health = await self.db_manager.health_check()
-                memory_health = await self.memory_manager.health_check()
-                mcp_health = await self.mcp_client.health_check()
-                
-                overall_health = db_health["overall"] and memory_health["overall"] and mcp_health
-                
-                return {
-                    "status": "healthy" if overall_health else "unhealthy",
-                    "components": {
-                        "database": db_health,
-                        "memory": memory_health,
-                        "mcp_connection": mcp_health
-                    },
-                    "timestamp": asyncio.get_event_loop().time()
-                }
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Health check failed: {e}")
-
-        # Persona management endpoints (using MCP for operational parity)
-        @self.app.get("/api/personas")
-        async def list_personas():
-            """List all personas (via MCP)"""
-            try:
-                personas = await self.mcp_client.list_personas()
-                return {"success": True, "personas": personas}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to list personas: {e}")
-
-        @self.app.get("/api/personas/{persona_id}")
-        async def get_persona(persona_id: str):
-            """Get persona by ID (via MCP)"""
-            try:
-                persona = await self.mcp_client.get_persona(persona_id)
-                if not persona:
-                    raise HTTPException(status_code=404, detail="Persona not found")
-                return {"success": True, "persona": persona}
-            except HTTPException:
-                raise
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to get persona: {e}")
-
-        @self.app.post("/api/personas")
-        async def create_persona(persona_data: Dict[str, Any]):
-            """Create new persona (via MCP)"""
-            try:
-                result = await self.mcp_client.create_persona(persona_data)
-                return {"success": True, "result": result}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to create persona: {e}")
-
-        @self.app.delete("/api/personas/{persona_id}")
-        async def delete_persona(persona_id: str):
-            """Delete persona (via MCP)"""
-            try:
-                result = await self.mcp_client.delete_persona(persona_id)
-                return {"success": True, "result": result}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to delete persona: {e}")
-
-        # Memory management endpoints (using MCP for operational parity)
-        @self.app.get("/api/memory/{persona_id}/search")
-        async def search_memories(persona_id: str, query: str, n_results: int = 5, min_importance: float = 0.0):
-            """Search persona memories (via MCP)"""
-            try:
-                memories = await self.mcp_client.search_memories(
-                    persona_id=persona_id,
-                    query=query,
-                    n_results=n_results,
-                    min_importance=min_importance
-                )
-                return {"success": True, "memories": memories}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to search memories: {e}")
-
-        @self.app.get("/api/memory/{persona_id}/stats")
-        async def get_memory_stats(persona_id: str):
-            """Get memory statistics (via MCP)"""
-            try:
-                stats = await self.mcp_client.get_memory_stats(persona_id)
-                return {"success": True, "stats": stats}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to get memory stats: {e}")
-
-        @self.app.post("/api/memory/{persona_id}/prune")
-        async def prune_memories(persona_id: str, max_memories: int = 1000):
-            """Prune persona memories (via MCP)"""
-            try:
-                result = await self.mcp_client.prune_memories(persona_id, max_memories)
-                return {"success": True, "result": result}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to prune memories: {e}")
-
-        # Bot management endpoints (using BotProcessManager)
-        @self.app.post("/api/bots/{persona_id}/start")
-        async def start_bot(persona_id: str):
-            """Start Matrix bot for persona"""
-            try:
-                # Get persona details first
-                persona = await self.mcp_client.get_persona(persona_id)
-                if not persona:
-                    raise HTTPException(status_code=404, detail="Persona not found")
-
-                # Start bot process
-                bot_process = await self.bot_manager.start_bot(
-                    persona_id=persona_id,
-                    persona_name=persona["name"]
-                )
-                
-                return {
-                    "success": True,
-                    "message": f"Bot started for persona {persona['name']}",
-                    "bot_info": {
-                        "persona_id": persona_id,
-                        "persona_name": persona["name"],
-                        "pid": bot_process.process.pid,
-                        "start_time": bot_process.start_time.isoformat(),
-                        "log_file": str(bot_process.log_file)
-                    }
-                }
-            except ValueError as e:
-                raise HTTPException(status_code=400, detail=str(e))
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to start bot: {e}")
-
-        @self.app.post("/api/bots/{persona_id}/stop")
-        async def stop_bot(persona_id: str):
-            """Stop Matrix bot for persona"""
-            try:
-                success = await self.bot_manager.stop_bot(persona_id)
-                if success:
-                    return {"success": True, "message": "Bot stopped successfully"}
-                else:
-                    raise HTTPException(status_code=404, detail="Bot not found or not running")
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to stop bot: {e}")
-
-        @self.app.post("/api/bots/{persona_id}/restart")
-        async def restart_bot(persona_id: str):
-            """Restart Matrix bot for persona"""
-            try:
-                success = await self.bot_manager.restart_bot(persona_id)
-                if success:
-                    return {"success": True, "message": "Bot restarted successfully"}
-                else:
-                    raise HTTPException(status_code=500, detail="Failed to restart bot")
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to restart bot: {e}")
-
-        @self.app.get("/api/bots/status")
-        async def get_bot_status():
-            """Get status of all bots"""
-            try:
-                status = self.bot_manager.get_bot_status()
-                return {"success": True, "bots": status}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to get bot status: {e}")
-
-        @self.app.get("/api/bots/{persona_id}/logs")
-        async def get_bot_logs(persona_id: str, lines: int = 100):
-            """Get recent bot logs"""
-            try:
-                logs = await self.bot_manager.get_bot_logs(persona_id, lines)
-                return {"success": True, "logs": logs}
-            except ValueError as e:
-                raise HTTPException(status_code=404, detail=str(e))
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to get bot logs: {e}")
-
-        # System information endpoints
-        @self.app.get("/api/system/status")
-        async def get_system_status():
-            """Get comprehensive system status"""
-            try:
-                # Get stats from shared components
-                db_stats = await self.db_manager.get_system_stats()
-                memory_stats = await self.memory_manager.get_system_stats()
-                
-                # Get MCP system status
-                mcp_status = await self.mcp_client.get_system_status()
-                
-                # Get bot status
-                bot_status = self.bot_manager.get_bot_status()
-                
-                return {
-                    "success": True,
-                    "system": {
-                        "database": db_stats,
-                        "memory": memory_stats,
-                        "mcp_server": mcp_status,
-                        "bots": {
-                            "count": len(bot_status),
-                            "running": len([b for b in bot_status if b["status"] == "running"]),
-                            "details": bot_status
-                        }
-                    }
-                }
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to get system status: {e}")
+    async def _search_memories(self, persona_id: str, query: str,
+                               n_results: int, min_importance: float) -> List[Dict[str, Any]]:
+        """Search memories via MCP, through the micro-batcher when enabled"""
+        if self.search_batcher is None:
+            return await self.mcp_client.search_memories(
+                persona_id=persona_id,
+                query=query,
+                n_results=n_results,
+                min_importance=min_importance
+            )
+
+        result = await self.search_batcher.submit({
+            "persona_id": persona_id,
+            "query": query,
+            "n_results": n_results,
+            "min_importance": min_importance
+        })
+        if "error" in result:
+            raise Exception(result["error"])
+        return result.get("memories", [])
 
     async def run(self):
         """Run the PersonaAPI server"""
@@ -336,7 +170,10 @@ class PersonaAPIServer:
                 host=self.host,
                 port=self.port,
                 log_level="info",
-                access_log=True
+                # "auto" picks httptools over h11 whenever it is installed
+                http="auto",
+                # Per-request access lines cost more than the requests themselves under load
+                access_log=False
             )
             server = uvicorn.Server(config)
             
@@ -350,6 +187,275 @@ class PersonaAPIServer:
             await self.shutdown()
 
 
+async def get_server(request: Request) -> PersonaAPIServer:
+    """Resolve the PersonaAPIServer that owns the current app"""
+    return request.app.state.server
+
+
+# Handlers are bound once at import; each app resolves its server per request
+router = APIRouter()
+
+
+# Health check
+@router.get("/", response_class=HTMLResponse)
+async def root():
+    return _ROOT_RESPONSE
+
+
+@router.get("/api/health")
+async def health_check(server: PersonaAPIServer = Depends(get_server)):
+    """Health check endpoint"""
+    try:
+        # Check core components concurrently; let every check finish before failing
+        results = await asyncio.gather(
+            server.db_manager.health_check(),
+            server.memory_manager.health_check(),
+            server.mcp_client.health_check(),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        db_health, memory_health, mcp_health = results
+        
+        overall_health = db_health["overall"] and memory_health["overall"] and mcp_health
+        
+        return {
+            "status": "healthy" if overall_health else "unhealthy",
+            "components": {
+                "database": db_health,
+                "memory": memory_health,
+                "mcp_connection": mcp_health
+            },
+            "timestamp": time.monotonic()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Health check failed: {e}")
+
+
+# Persona management endpoints (using MCP for operational parity)
+@router.get("/api/personas")
+async def list_personas(server: PersonaAPIServer = Depends(get_server)):
+    """List all personas (via MCP)"""
+    try:
+        personas = await server.mcp_cache.get_or_fetch(
+            ("persona.list",), server.mcp_client.list_personas
+        )
+        return {"success": True, "personas": personas}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to list personas: {e}")
+
+
+@router.get("/api/personas/{persona_id}")
+async def get_persona(persona_id: str, server: PersonaAPIServer = Depends(get_server)):
+    """Get persona by ID (via MCP)"""
+    try:
+        persona = await server.mcp_cache.get_or_fetch(
+            ("persona.get", persona_id), lambda: server.mcp_client.get_persona(persona_id)
+        )
+        if not persona:
+            raise HTTPException(status_code=404, detail="Persona not found")
+        return {"success": True, "persona": persona}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get persona: {e}")
+
+
+@router.post("/api/personas")
+async def create_persona(persona_data: PersonaCreate, server: PersonaAPIServer = Depends(get_server)):
+    """Create new persona (via MCP)"""
+    try:
+        result = await server.mcp_client.create_persona(persona_data.model_dump())
+        server.mcp_cache.invalidate(["persona.list", "system.status"])
+        return {"success": True, "result": result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to create persona: {e}")
+
+
+@router.delete("/api/personas/{persona_id}")
+async def delete_persona(persona_id: str, server: PersonaAPIServer = Depends(get_server)):
+    """Delete persona (via MCP)"""
+    try:
+        result = await server.mcp_client.delete_persona(persona_id)
+        server.mcp_cache.invalidate(["persona.list", "system.status"], persona_id=persona_id)
+        return {"success": True, "result": result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to delete persona: {e}")
+
+
+# Memory management endpoints (using MCP for operational parity)
+@router.get("/api/memory/{persona_id}/search")
+async def search_memories(persona_id: str, query: str, n_results: int = 5, min_importance: float = 0.0,
+                          server: PersonaAPIServer = Depends(get_server)):
+    """Search persona memories (via MCP)"""
+    try:
+        memories = await server.mcp_cache.get_or_fetch(
+            ("memory.search", persona_id, query, n_results, min_importance),
+            lambda: server._search_memories(persona_id, query, n_results, min_importance)
+        )
+        return {"success": True, "memories": memories}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to search memories: {e}")
+
+
+@router.get("/api/memory/{persona_id}/stats")
+async def get_memory_stats(persona_id: str, server: PersonaAPIServer = Depends(get_server)):
+    """Get memory statistics (via MCP)"""
+    try:
+        stats = await server.mcp_cache.get_or_fetch(
+            ("memory.stats", persona_id), lambda: server.mcp_client.get_memory_stats(persona_id)
+        )
+        return {"success": True, "stats": stats}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get memory stats: {e}")
+
+
+@router.post("/api/memory/{persona_id}/prune")
+async def prune_memories(persona_id: str, max_memories: int = 1000, server: PersonaAPIServer = Depends(get_server)):
+    """Prune persona memories (via MCP)"""
+    try:
+        result = await server.mcp_client.prune_memories(persona_id, max_memories)
+        server.mcp_cache.invalidate(["system.status"], persona_id=persona_id)
+        return {"success": True, "result": result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to prune memories: {e}")
+
+
+# Bot management endpoints (using BotProcessManager)
+@router.post("/api/bots/{persona_id}/start")
+async def start_bot(persona_id: str, server: PersonaAPIServer = Depends(get_server)):
+    """Start Matrix bot for persona"""
+    try:
+        # Get persona details first
+        persona = await server.mcp_cache.get_or_fetch(
+            ("persona.get", persona_id), lambda: server.mcp_client.get_persona(persona_id)
+        )
+        if not persona:
+            raise HTTPException(status_code=404, detail="Persona not found")
+
+        # Start bot process
+        bot_process = await server.bot_manager.start_bot(
+            persona_id=persona_id,
+            persona_name=persona["name"]
+        )
+        
+        return {
+            "success": True,
+            "message": f"Bot started for persona {persona['name']}",
+            "bot_info": {
+                "persona_id": persona_id,
+                "persona_name": persona["name"],
+                "pid": bot_process.process.pid,
+                "start_time": bot_process.start_time,
+                "log_file": bot_process.log_file
+            }
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to start bot: {e}")
+
+
+@router.post("/api/bots/{persona_id}/stop")
+async def stop_bot(persona_id: str, server: PersonaAPIServer = Depends(get_server)):
+    """Stop Matrix bot for persona"""
+    try:
+        success = await server.bot_manager.stop_bot(persona_id)
+        if success:
+            return {"success": True, "message": "Bot stopped successfully"}
+        else:
+            raise HTTPException(status_code=404, detail="Bot not found or not running")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to stop bot: {e}")
+
+
+@router.post("/api/bots/{persona_id}/restart")
+async def restart_bot(persona_id: str, server: PersonaAPIServer = Depends(get_server)):
+    """Restart Matrix bot for persona"""
+    try:
+        success = await server.bot_manager.restart_bot(persona_id)
+        if success:
+            return {"success": True, "message": "Bot restarted successfully"}
+        else:
+            raise HTTPException(status_code=500, detail="Failed to restart bot")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to restart bot: {e}")
+
+
+@router.get("/api/bots/status")
+async def get_bot_status(server: PersonaAPIServer = Depends(get_server)):
+    """Get status of all bots"""
+    try:
+        # Splice the manager's cached encoding instead of re-serializing every poll
+        return Response(
+            content=b'{"success":true,"bots":' + server.bot_manager.get_bot_status_bytes() + b'}',
+            media_type="application/json"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get bot status: {e}")
+
+
+@router.get("/api/bots/{persona_id}/logs")
+async def get_bot_logs(persona_id: str, lines: int = 100, server: PersonaAPIServer = Depends(get_server)):
+    """Get recent bot logs"""
+    try:
+        logs = await server.bot_manager.get_bot_logs(persona_id, lines)
+        return {"success": True, "logs": logs}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get bot logs: {e}")
+
+
+# System information endpoints
+@router.get("/api/system/status")
+async def get_system_status(server: PersonaAPIServer = Depends(get_server)):
+    """Get comprehensive system status"""
+    try:
+        # Get stats from shared components and MCP system status concurrently
+        results = await asyncio.gather(
+            server.db_manager.get_system_stats(),
+            server.memory_manager.get_system_stats(),
+            server.mcp_cache.get_or_fetch(
+                ("system.status",), server.mcp_client.get_system_status
+            ),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        db_stats, memory_stats, mcp_status = results
+        
+        # Get bot status
+        bot_status = server.bot_manager.get_bot_status()
+        
+        return {
+            "success": True,
+            "system": {
+                "database": db_stats,
+                "memory": memory_stats,
+                "mcp_server": mcp_status,
+                "bots": {
+                    "count": len(bot_status),
+                    "running": sum(1 for b in bot_status if b["status"] == "running"),
+                    "details": bot_status
+                }
+            }
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get system status: {e}")
+
+
+@router.get("/api/cache/stats")
+async def get_cache_stats(server: PersonaAPIServer = Depends(get_server)):
+    """Get MCP response cache statistics"""
+    stats = {"success": True, "cache": server.mcp_cache.get_stats()}
+    if server.search_batcher is not None:
+        stats["search_batching"] = server.search_batcher.get_stats()
+    return stats
+
+
 # Application lifecycle management
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -364,4 +470,10 @@ if __name__ == "__main__":
         server = PersonaAPIServer()
         await server.run()
     
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop is optional; the event loop is created here, not by uvicorn
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
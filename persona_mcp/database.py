@@ -12,9 +12,93 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy.orm import DeclarativeBase
 
 from .persistence import SQLiteManager, VectorMemoryManager
+from .persistence.connection_pool import SQLiteConnectionPool, get_connection_pool
+from .core.database import ENGINE_POOL_OPTIONS
 from .logging import get_logger
 
 
+# Idle connections kept open for relationship queries
+RELATIONSHIP_POOL_SIZE = 2
+
+# Extra connections allowed under load (pool never exceeds size + overflow)
+RELATIONSHIP_POOL_OVERFLOW = 8
+
+# Bump when RELATIONSHIP_SCHEMA changes; stored in PRAGMA user_version
+RELATIONSHIP_SCHEMA_VERSION = 2
+
+# Relationship tables and indexes, applied in one executescript() call
+RELATIONSHIP_SCHEMA = """
+-- Relationships table
+CREATE TABLE IF NOT EXISTS relationships (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    persona1_id TEXT NOT NULL,
+    persona2_id TEXT NOT NULL,
+    affinity REAL DEFAULT 0.5,
+    trust REAL DEFAULT 0.5,
+    respect REAL DEFAULT 0.5,
+    intimacy REAL DEFAULT 0.5,
+    relationship_type TEXT DEFAULT 'stranger',
+    interaction_count INTEGER DEFAULT 0,
+    total_interaction_time REAL DEFAULT 0.0,
+    first_meeting TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_interaction TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(persona1_id, persona2_id),
+    FOREIGN KEY (persona1_id) REFERENCES personas (id),
+    FOREIGN KEY (persona2_id) REFERENCES personas (id)
+);
+
+-- Emotional states table
+CREATE TABLE IF NOT EXISTS emotional_states (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    persona_id TEXT NOT NULL UNIQUE,
+    mood REAL DEFAULT 0.5,
+    energy_level REAL DEFAULT 0.7,
+    stress_level REAL DEFAULT 0.3,
+    curiosity REAL DEFAULT 0.6,
+    social_battery REAL DEFAULT 0.8,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (persona_id) REFERENCES personas (id)
+);
+
+-- Interaction history table for detailed tracking
+CREATE TABLE IF NOT EXISTS interaction_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    persona1_id TEXT NOT NULL,
+    persona2_id TEXT NOT NULL,
+    interaction_quality REAL NOT NULL,
+    duration_minutes REAL DEFAULT 5.0,
+    context TEXT,
+    emotional_impact TEXT, -- JSON of emotional changes
+    memory_references TEXT, -- JSON of related memory IDs
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (persona1_id) REFERENCES personas (id),
+    FOREIGN KEY (persona2_id) REFERENCES personas (id)
+);
+
+-- Indexes for performance. The UNIQUE constraint already indexes
+-- (persona1_id, persona2_id); the reverse index covers lookups by persona2_id
+DROP INDEX IF EXISTS idx_relationships_personas;
+
+CREATE INDEX IF NOT EXISTS idx_relationships_reverse
+ON relationships (persona2_id, persona1_id);
+
+CREATE INDEX IF NOT EXISTS idx_emotional_states_persona
+ON emotional_states (persona_id);
+
+-- Newest-first, so "recent interactions between A and B" needs no sort
+DROP INDEX IF EXISTS idx_interaction_history_personas;
+
+CREATE INDEX IF NOT EXISTS idx_interaction_history_recent
+ON interaction_history (persona1_id, persona2_id, timestamp DESC);
+
+-- Refresh planner statistics for the new indexes
+ANALYZE;
+"""
+
+
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models"""
     pass
@@ -31,144 +115,104 @@ class DatabaseManager:
         # Create async engine for relationship data
         self.engine = create_async_engine(
             f"sqlite+aiosqlite:///{sqlite_manager.db_path}",
-            echo=False
+            echo=False,
+            **ENGINE_POOL_OPTIONS
         )
         self.async_session = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
+        
+        # Reusable WAL-mode connections for relationship queries
+        self.pool = SQLiteConnectionPool(
+            sqlite_manager.db_path,
+            pool_size=RELATIONSHIP_POOL_SIZE,
+            max_overflow=RELATIONSHIP_POOL_OVERFLOW
+        )
     
     async def initialize(self):
         """Initialize both SQLite and ChromaDB"""
         await self.sqlite.initialize()
+        await self.pool.initialize()
         # Vector manager initialization handled separately
         
         # Create relationship tables if they don't exist
         await self._create_relationship_tables()
     
     async def _create_relationship_tables(self):
-        """Create relationship-specific tables in SQLite"""
-        import aiosqlite
-        
-        async with aiosqlite.connect(self.sqlite.db_path) as db:
-            # Relationships table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS relationships (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    persona1_id TEXT NOT NULL,
-                    persona2_id TEXT NOT NULL,
-                    affinity REAL DEFAULT 0.5,
-                    trust REAL DEFAULT 0.5,
-                    respect REAL DEFAULT 0.5,
-                    intimacy REAL DEFAULT 0.5,
-                    relationship_type TEXT DEFAULT 'stranger',
-                    interaction_count INTEGER DEFAULT 0,
-                    total_interaction_time REAL DEFAULT 0.0,
-                    first_meeting TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_interaction TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(persona1_id, persona2_id),
-                    FOREIGN KEY (persona1_id) REFERENCES personas (id),
-                    FOREIGN KEY (persona2_id) REFERENCES personas (id)
-                )
-            """)
-            
-            # Emotional states table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS emotional_states (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    persona_id TEXT NOT NULL UNIQUE,
-                    mood REAL DEFAULT 0.5,
-                    energy_level REAL DEFAULT 0.7,
-                    stress_level REAL DEFAULT 0.3,
-                    curiosity REAL DEFAULT 0.6,
-                    social_battery REAL DEFAULT 0.8,
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (persona_id) REFERENCES personas (id)
-                )
-            """)
-            
-            # Interaction history table for detailed tracking
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS interaction_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    persona1_id TEXT NOT NULL,
-                    persona2_id TEXT NOT NULL,
-                    interaction_quality REAL NOT NULL,
-                    duration_minutes REAL DEFAULT 5.0,
-                    context TEXT,
-                    emotional_impact TEXT, -- JSON of emotional changes
-                    memory_references TEXT, -- JSON of related memory IDs
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (persona1_id) REFERENCES personas (id),
-                    FOREIGN KEY (persona2_id) REFERENCES personas (id)
-                )
-            """)
+        """Create relationship-specific tables in SQLite unless already at the current schema version"""
+        async with self.pool.get_connection() as db:
+            async with db.execute("PRAGMA user_version") as cursor:
+                (version,) = await cursor.fetchone()
+            if version >= RELATIONSHIP_SCHEMA_VERSION:
+                return
             
-            # Create indexes for performance
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_relationships_personas 
-                ON relationships (persona1_id, persona2_id)
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_emotional_states_persona 
-                ON emotional_states (persona_id)
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_interaction_history_personas 
-                ON interaction_history (persona1_id, persona2_id, timestamp)
-            """)
-            
-            await db.commit()
+            # One transaction, so the schema and its version land in a single commit
+            await db.executescript(
+                "BEGIN;"
+                + RELATIONSHIP_SCHEMA
+                + f"PRAGMA user_version = {RELATIONSHIP_SCHEMA_VERSION};"
+                + "COMMIT;"
+            )
+    
+    async def close(self):
+        """Close pooled relationship connections"""
+        await self.pool.close_all()
+
+
+class SimpleSession:
+    """Session-like wrapper around a pooled aiosqlite connection, kept for relationship code"""
+    
+    def __init__(self, pool):
+        self.pool = pool
+        self._checkout = None
+        self._connection = None
+
+    async def __aenter__(self):
+        self._checkout = self.pool.get_connection()
+        self._connection = await self._checkout.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._checkout:
+            try:
+                # Don't hand an open transaction to the next borrower
+                if self._connection.in_transaction:
+                    await self._connection.rollback()
+            finally:
+                await self._checkout.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def execute(self, query, params=None):
+        if params is None:
+            params = []
+        return await self._connection.execute(query, params)
+
+    async def fetchall(self, query, params=None):
+        if params is None:
+            params = []
+        cursor = await self._connection.execute(query, params)
+        return await cursor.fetchall()
+
+    async def fetchone(self, query, params=None):
+        if params is None:
+            params = []
+        cursor = await self._connection.execute(query, params)
+        return await cursor.fetchone()
+
+    async def commit(self):
+        await self._connection.commit()
 
 
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get async database session for relationship operations"""
-    # This is a placeholder - in practice you'd get this from your app's database manager
-    # For now, we'll work directly with SQLite
-    import aiosqlite
-    from .persistence import SQLiteManager
-    
-    # Create a simple session-like object for compatibility
-    class SimpleSession:
-        def __init__(self, db_path):
-            self.db_path = db_path
-            self._connection = None
-            
-        async def __aenter__(self):
-            self._connection = await aiosqlite.connect(self.db_path)
-            return self
-            
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            if self._connection:
-                await self._connection.close()
-                
-        async def execute(self, query, params=None):
-            if params is None:
-                params = []
-            return await self._connection.execute(query, params)
-            
-        async def fetchall(self, query, params=None):
-            if params is None:
-                params = []
-            cursor = await self._connection.execute(query, params)
-            return await cursor.fetchall()
-            
-        async def fetchone(self, query, params=None):
-            if params is None:
-                params = []
-            cursor = await self._connection.execute(query, params)
-            return await cursor.fetchone()
-            
-        async def commit(self):
-            await self._connection.commit()
+    # Borrow a pooled connection: the manager's pool once initialized,
+    # otherwise the shared pool on the default SQLite path
+    if _db_manager is not None:
+        pool = _db_manager.pool
+    else:
+        pool = await get_connection_pool("data/personas.db")
     
-    # Use default SQLite path
-    session = SimpleSession("data/personas.db")
+    session = SimpleSession(pool)
     async with session:
         yield session
 
@@ -3,16 +3,106 @@ Local Ollama LLM integration for persona response generation
 """
 
 import httpx
-import json
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from typing import Dict, List, Optional, Any, AsyncGenerator, Tuple
 from abc import ABC, abstractmethod
 import asyncio
+import random
+import threading
+import time
 from datetime import datetime
 
 from ..logging import get_logger
+from ..utils import fast_json as json
+from ..utils import TTLCache
 from ..models import Persona, ConversationContext
 
 
+# Keep-alive pool for the Ollama client, sized for concurrent persona generation
+OLLAMA_CLIENT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=30.0)
+
+# Generation can take a while, but a dead Ollama host should fail fast
+OLLAMA_CLIENT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+# Seconds an availability probe is reused; failures are retried sooner
+AVAILABILITY_TTL = 5.0
+AVAILABILITY_FAILURE_TTL = 1.0
+
+# Request bodies are pre-encoded with fast_json and posted as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Prompt blocks cached per persona state and per constraint set; keys carry
+# every input, so the TTL only bounds how long idle personas stay resident
+PROMPT_CACHE_SIZE = 256
+PROMPT_CACHE_TTL = 600.0
+
+# Key that opens the "response" string in Ollama's compact stream lines
+_STREAM_RESPONSE_KEY = b'"response":"'
+
+# Prompt inputs larger than this (in characters) are assembled off the event loop
+PROMPT_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+# Canned replies used when Ollama fails
+_FALLBACKS = (
+    "I'm having trouble finding the right words right now.",
+    "Let me think about that for a moment.",
+    "That's an interesting point to consider.",
+    "I appreciate you bringing that up.",
+)
+
+# Quick replies for very low continue scores, by persona state
+_URGENT_TEMPLATES = (
+    "I really must go.",
+    "I have urgent matters to attend to.",
+    "Perhaps we can continue this later.",
+)
+_DRAINED_TEMPLATES = (
+    "I'm feeling a bit drained.",
+    "I think I need a break from talking.",
+    "It's been a long day for me.",
+)
+_FATIGUE_TEMPLATES = (
+    "Interesting... I should get going though.",
+    "I'll let you get back to what you were doing.",
+    "Nice chatting with you.",
+)
+_NEUTRAL_TEMPLATES = (
+    "I see.",
+    "That's good to know.",
+    "Hmm, interesting.",
+)
+
+
+def _fast_extract_response(line: bytes) -> Optional[str]:
+    """Read the "response" string of a compact stream line without parsing the object"""
+    start = line.find(_STREAM_RESPONSE_KEY)
+    if start < 0:
+        return None
+    start += len(_STREAM_RESPONSE_KEY)
+    
+    # Closing quote is the first one not escaped by an odd run of backslashes
+    end = line.find(b'"', start)
+    while end >= 0:
+        backslash = end - 1
+        while backslash >= start and line[backslash] == 0x5C:
+            backslash -= 1
+        if (end - 1 - backslash) % 2 == 0:
+            break
+        end = line.find(b'"', end + 1)
+    if end < 0:
+        return None
+    
+    try:
+        raw = line[start:end]
+        if b"\\" not in raw:
+            return raw.decode("utf-8")
+        # Escapes (newlines, quotes, \uXXXX): decode only the string literal
+        return json.loads(line[start - 1:end + 1])
+    except ValueError:
+        return None
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
@@ -47,20 +137,52 @@ class LLMProvider(ABC):
 class OllamaProvider(LLMProvider):
     """Ollama local LLM provider"""
     
+    # Generation options used when no constraints apply; copied before overriding
+    _DEFAULT_OPTIONS = {
+        "temperature": 0.7,
+        "top_p": 0.9,
+        "top_k": 40,
+        "num_predict": 150,  # Default response length
+    }
+    
     def __init__(self, base_url: str = "http://localhost:11434", default_model: str = "llama3.1:8b"):
         self.base_url = base_url.rstrip('/')
         self.default_model = default_model
-        self.client = httpx.AsyncClient(timeout=60.0)
+        # Ollama speaks plain HTTP/1.1, so reuse comes from keep-alive rather than HTTP/2
+        self.client = httpx.AsyncClient(timeout=OLLAMA_CLIENT_TIMEOUT, limits=OLLAMA_CLIENT_LIMITS)
         self.logger = get_logger(__name__)
+        # (expires_at, available) from the last probe, and the probe in flight
+        self._avail_cache = (0.0, False)
+        self._avail_task = None
+        self._prompt_cache = TTLCache(maxsize=PROMPT_CACHE_SIZE, ttl=PROMPT_CACHE_TTL)
+        # Large prompts are built in worker threads, so cache access is serialized
+        self._prompt_cache_lock = threading.Lock()
     
     async def is_available(self) -> bool:
         """Check if Ollama is running and accessible"""
+        expires_at, available = self._avail_cache
+        if time.monotonic() < expires_at:
+            return available
+        
+        # One probe at a time; concurrent callers share its result
+        if self._avail_task is None:
+            self._avail_task = asyncio.create_task(self._probe_availability())
+        return await asyncio.shield(self._avail_task)
+    
+    async def _probe_availability(self) -> bool:
+        """Run one /api/tags round trip for is_available and cache the answer"""
         try:
             response = await self.client.get(f"{self.base_url}/api/tags")
-            return response.status_code == 200
+            available = response.status_code == 200
         except Exception as e:
-            self.logger.debug(f"Ollama health check failed: {e}")
-            return False
+            self.logger.debug("Ollama health check failed: %s", e)
+            available = False
+        finally:
+            self._avail_task = None
+        
+        ttl = AVAILABILITY_TTL if available else AVAILABILITY_FAILURE_TTL
+        self._avail_cache = (time.monotonic() + ttl, available)
+        return available
     
     async def generate_response(
         self, 
@@ -72,7 +194,7 @@ class OllamaProvider(LLMProvider):
         """Generate response using Ollama"""
         
         # Build the full prompt with persona context
-        full_prompt = self._build_persona_prompt(prompt, persona, context, constraints)
+        full_prompt = await self._prepare_prompt(prompt, persona, context, constraints)
         
         try:
             # Call Ollama API
@@ -84,25 +206,26 @@ class OllamaProvider(LLMProvider):
                 "options": self._get_generation_options(constraints)
             }
             
-            # Log the model being used
-            self.logger.debug(f"Requesting Ollama model: {model_to_use}")
+            # Log the model being used; %-style args are only formatted if the level is enabled
+            self.logger.debug("Requesting Ollama model: %s", model_to_use)
             
             response = await self.client.post(
                 f"{self.base_url}/api/generate",
-                json=payload
+                content=json.dumps_bytes(payload),
+                headers=JSON_HEADERS
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = json.loads(response.content)
                 # Log confirmation of successful model usage
-                self.logger.debug(f"Ollama responded successfully using model: {model_to_use}")
+                self.logger.debug("Ollama responded successfully using model: %s", model_to_use)
                 return result.get("response", "").strip()
             else:
-                self.logger.error(f"Ollama API error: {response.status_code} - {response.text}")
+                self.logger.error("Ollama API error: %s - %s", response.status_code, response.text)
                 return self._generate_fallback_response(persona, context)
                 
         except Exception as e:
-            self.logger.error(f"Error calling Ollama: {e}")
+            self.logger.error("Error calling Ollama: %s", e)
             return self._generate_fallback_response(persona, context)
     
     async def generate_response_stream(
@@ -114,10 +237,8 @@ class OllamaProvider(LLMProvider):
     ) -> AsyncGenerator[str, None]:
         """Generate streaming response using Ollama"""
         
-        logger = get_logger(__name__)
-        
         # Build the full prompt with persona context
-        full_prompt = self._build_persona_prompt(prompt, persona, context, constraints)
+        full_prompt = await self._prepare_prompt(prompt, persona, context, constraints)
         
         try:
             # Call Ollama streaming API
@@ -129,48 +250,101 @@ class OllamaProvider(LLMProvider):
                 "options": self._get_generation_options(constraints)
             }
             
-            logger.info(f"Starting streaming response with model: {model_to_use}")
+            self.logger.info("Starting streaming response with model: %s", model_to_use)
             
             # Use httpx streaming
             async with self.client.stream(
                 'POST', 
                 f"{self.base_url}/api/generate",
-                json=payload
+                content=json.dumps_bytes(payload),
+                headers=JSON_HEADERS
             ) as response:
                 
                 if response.status_code != 200:
-                    logger.error(f"Ollama streaming error: {response.status_code}")
+                    self.logger.error("Ollama streaming error: %s", response.status_code)
                     # Fallback to single chunk
                     yield self._generate_fallback_response(persona, context)
                     return
                 
                 # Process streaming response
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        try:
-                            chunk_data = json.loads(line)
-                            
-                            # Extract response chunk
-                            if "response" in chunk_data:
-                                chunk_text = chunk_data["response"]
-                                if chunk_text:  # Only yield non-empty chunks
-                                    yield chunk_text
-                            
-                            # Check if streaming is complete
-                            if chunk_data.get("done", False):
-                                logger.info("Ollama streaming completed successfully")
-                                break
-                                
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse streaming chunk: {e}")
-                            continue
+                async for chunk_text, done in self._iter_stream_chunks(response):
+                    # Extract response chunk
+                    if chunk_text:  # Only yield non-empty chunks
+                        yield chunk_text
+                    
+                    # Check if streaming is complete
+                    if done:
+                        self.logger.info("Ollama streaming completed successfully")
+                        break
                             
         except Exception as e:
-            logger.error(f"Error in Ollama streaming: {e}")
+            self.logger.error("Error in Ollama streaming: %s", e)
             # Fallback to single response chunk
             fallback = self._generate_fallback_response(persona, context)
             yield fallback
     
+    async def _iter_stream_chunks(self, response: httpx.Response) -> AsyncGenerator[Tuple[str, bool], None]:
+        """Parse an NDJSON stream into (response text, done) pairs, splitting and decoding raw bytes"""
+        buffer = bytearray()
+        async for data in response.aiter_bytes():
+            buffer += data
+            end = buffer.rfind(b"\n")
+            if end < 0:
+                continue
+            
+            # Parse every complete line; keep the partial tail for the next read
+            lines = buffer[:end].split(b"\n")
+            del buffer[:end + 1]
+            for line in lines:
+                chunk_data = self._parse_stream_line(line)
+                if chunk_data is not None:
+                    yield chunk_data
+        
+        # Don't lose a final line that arrived without its newline
+        chunk_data = self._parse_stream_line(buffer)
+        if chunk_data is not None:
+            yield chunk_data
+    
+    def _parse_stream_line(self, line: bytes) -> Optional[Tuple[str, bool]]:
+        """Read (response text, done) from one NDJSON line, or None if it is blank, truncated or malformed"""
+        line = line.rstrip()
+        if not line:
+            return None
+        
+        # Every complete chunk object ends in "}"; don't hand fragments to the parser
+        if not line.endswith(b"}"):
+            self.logger.warning("Skipping incomplete streaming chunk: %r", bytes(line[-40:]))
+            return None
+        
+        # Token lines are compact: lift the field out of the bytes
+        if b'"done":false' in line:
+            chunk_text = _fast_extract_response(line)
+            if chunk_text is not None:
+                return chunk_text, False
+        
+        try:
+            chunk_data = json.loads(line)
+        except json.JSONDecodeError as e:
+            self.logger.warning("Failed to parse streaming chunk: %s", e)
+            return None
+        return chunk_data.get("response") or "", bool(chunk_data.get("done", False))
+    
+    async def _prepare_prompt(
+        self,
+        user_input: str,
+        persona: Persona,
+        context: ConversationContext,
+        constraints: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build the persona prompt, in a worker thread when its inputs are large"""
+        estimated = (
+            len(user_input) + len(persona.description)
+            + sum(len(str(value)) for value in persona.personality_traits.values())
+        )
+        if estimated > PROMPT_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(self._build_persona_prompt, user_input, persona, context, constraints)
+        return self._build_persona_prompt(user_input, persona, context, constraints)
+    
     def _build_persona_prompt(
         self, 
         user_input: str, 
@@ -180,28 +354,8 @@ class OllamaProvider(LLMProvider):
     ) -> str:
         """Build a comprehensive prompt including persona context"""
         
-        # Base persona description
-        prompt_parts = [
-            f"You are {persona.name}. {persona.description}",
-            "",
-            "Your personality traits:",
-        ]
-        
-        for trait, value in persona.personality_traits.items():
-            prompt_parts.append(f"- {trait}: {value}")
-        
-        prompt_parts.append("")
-        
-        # Current state context
-        state = persona.interaction_state
-        prompt_parts.extend([
-            "Current situation:",
-            f"- Energy level: {state.social_energy}/200",
-            f"- Current priority: {state.current_priority.value}",
-            f"- Interest in conversation: {state.interest_level}/100",
-            f"- Available time: {state.available_time} seconds",
-            ""
-        ])
+        # Persona description, traits and current state rarely change between turns
+        prompt_parts = [self._persona_prefix(persona)]
         
         # Conversation context
         if context.topic != "general":
@@ -212,87 +366,134 @@ class OllamaProvider(LLMProvider):
         
         # Apply constraints if provided
         if constraints:
-            prompt_parts.append("")
-            prompt_parts.append("Response guidelines:")
-            
-            if constraints.get("max_length"):
-                prompt_parts.append(f"- Keep response under {constraints['max_length']} words")
-            
-            if constraints.get("style"):
-                prompt_parts.append(f"- Style: {constraints['style']}")
-            
-            if constraints.get("prepare_exit"):
-                prompt_parts.append("- Prepare to end the conversation politely")
-            
-            if constraints.get("avoid_topics"):
-                topics = ", ".join(constraints["avoid_topics"])
-                prompt_parts.append(f"- Avoid discussing: {topics}")
+            prompt_parts.append(self._response_guidelines(constraints))
+        
+        prompt_parts.append(f"\nRespond to: {user_input}\n\nResponse as {persona.name}:")
         
-        prompt_parts.extend([
+        return "\n".join(prompt_parts)
+    
+    def _persona_prefix(self, persona: Persona) -> str:
+        """Persona description, traits and situation block, cached per persona state"""
+        # Read each field once; they feed both the cache key and the text
+        name = persona.name
+        description = persona.description
+        traits = tuple(persona.personality_traits.items())
+        state = persona.interaction_state
+        energy = state.social_energy
+        priority = state.current_priority
+        interest = state.interest_level
+        available = state.available_time
+        key = (persona.id, name, description, traits, energy, priority, interest, available)
+        try:
+            with self._prompt_cache_lock:
+                prefix = self._prompt_cache.get(key)
+        except TypeError:
+            # Unhashable trait values; build without caching
+            key, prefix = None, None
+        if prefix is not None:
+            return prefix
+        
+        # Built as one list display rather than appended line by line
+        prefix = "\n".join([
+            # Base persona description
+            f"You are {name}. {description}",
             "",
-            f"Respond to: {user_input}",
+            "Your personality traits:",
+            *[f"- {trait}: {value}" for trait, value in traits],
             "",
-            f"Response as {persona.name}:"
+            # Current state context
+            "Current situation:",
+            f"- Energy level: {energy}/200",
+            f"- Current priority: {priority.value}",
+            f"- Interest in conversation: {interest}/100",
+            f"- Available time: {available} seconds",
+            ""
         ])
-        
-        return "\n".join(prompt_parts)
+        if key is not None:
+            with self._prompt_cache_lock:
+                self._prompt_cache.set(key, prefix)
+        return prefix
+    
+    def _response_guidelines(self, constraints: Dict[str, Any]) -> str:
+        """Response guidelines block for the given constraints, cached per constraint values"""
+        avoid_topics = constraints.get("avoid_topics")
+        key = (
+            "guidelines", constraints.get("max_length"), constraints.get("style"),
+            bool(constraints.get("prepare_exit")), tuple(avoid_topics) if avoid_topics else None
+        )
+        with self._prompt_cache_lock:
+            guidelines = self._prompt_cache.get(key)
+        if guidelines is not None:
+            return guidelines
+        
+        prompt_parts = ["", "Response guidelines:"]
+        
+        if constraints.get("max_length"):
+            prompt_parts.append(f"- Keep response under {constraints['max_length']} words")
+        
+        if constraints.get("style"):
+            prompt_parts.append(f"- Style: {constraints['style']}")
+        
+        if constraints.get("prepare_exit"):
+            prompt_parts.append("- Prepare to end the conversation politely")
+        
+        if avoid_topics:
+            topics = ", ".join(avoid_topics)
+            prompt_parts.append(f"- Avoid discussing: {topics}")
+        
+        guidelines = "\n".join(prompt_parts)
+        with self._prompt_cache_lock:
+            self._prompt_cache.set(key, guidelines)
+        return guidelines
     
     def _get_generation_options(self, constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get Ollama generation options based on constraints"""
         
-        options = {
-            "temperature": 0.7,
-            "top_p": 0.9,
-            "top_k": 40,
-            "num_predict": 150,  # Default response length
-        }
+        if not constraints:
+            # Shared dict; payloads only serialize it, never mutate it
+            return self._DEFAULT_OPTIONS
         
-        if constraints:
-            # Adjust creativity based on continue score or explicit setting
-            if "creativity" in constraints:
-                options["temperature"] = constraints["creativity"]
-            
-            # Adjust response length
-            if constraints.get("max_length"):
-                # Rough conversion: words to tokens (1 word ≈ 1.3 tokens)
-                max_tokens = int(constraints["max_length"] * 1.3)
-                options["num_predict"] = min(max_tokens, 300)
-            
-            # More focused responses for low engagement
-            if constraints.get("style") == "concise":
-                options["temperature"] = 0.5
-                options["num_predict"] = 50
+        options = dict(self._DEFAULT_OPTIONS)
+        
+        # Adjust creativity based on continue score or explicit setting
+        if "creativity" in constraints:
+            options["temperature"] = constraints["creativity"]
+        
+        # Adjust response length
+        if constraints.get("max_length"):
+            # Rough conversion: words to tokens (1 word ≈ 1.3 tokens)
+            max_tokens = int(constraints["max_length"] * 1.3)
+            options["num_predict"] = min(max_tokens, 300)
+        
+        # More focused responses for low engagement
+        if constraints.get("style") == "concise":
+            options["temperature"] = 0.5
+            options["num_predict"] = 50
         
         return options
     
     def _generate_fallback_response(self, persona: Persona, context: ConversationContext) -> str:
         """Generate a simple fallback response when LLM fails"""
         
-        fallbacks = [
-            "I'm having trouble finding the right words right now.",
-            "Let me think about that for a moment.",
-            "That's an interesting point to consider.",
-            "I appreciate you bringing that up.",
-        ]
+        state = persona.interaction_state
         
         # Choose based on persona priority
-        if persona.interaction_state.current_priority.value == "urgent":
+        if state.current_priority.value == "urgent":
             return "I really need to focus on urgent matters right now."
-        elif persona.interaction_state.social_energy < 30:
+        elif state.social_energy < 30:
             return "I'm feeling a bit drained from all this conversation."
         else:
-            import random
-            return random.choice(fallbacks)
+            return _FALLBACKS[random.randrange(len(_FALLBACKS))]
     
     async def list_available_models(self) -> List[str]:
         """Get list of available Ollama models"""
         try:
             response = await self.client.get(f"{self.base_url}/api/tags")
             if response.status_code == 200:
-                data = response.json()
+                data = json.loads(response.content)
                 return [model["name"] for model in data.get("models", [])]
         except Exception as e:
-            self.logger.warning(f"Failed to get available models: {e}")
+            self.logger.warning("Failed to get available models: %s", e)
         return []
     
     async def close(self):
@@ -307,6 +508,7 @@ class LLMManager:
         self.ollama = OllamaProvider(ollama_host, default_model)
         self.providers = {"ollama": self.ollama}
         self.default_provider = "ollama"
+        self.logger = get_logger(__name__)
     
     async def initialize(self) -> bool:
         """Initialize and verify LLM providers"""
@@ -350,6 +552,21 @@ class LLMManager:
             response = self._generate_template_response(persona, context)
             return response, "template"
     
+    async def generate_batch(
+        self,
+        requests: List[Tuple[int, str, Persona, ConversationContext]]
+    ) -> List[Tuple[str, str]]:
+        """Generate responses for (continue_score, user_input, persona, context) requests concurrently
+        
+        Ollama serves up to OLLAMA_NUM_PARALLEL requests per loaded model at once
+        (and keeps OLLAMA_MAX_LOADED_MODELS models resident), so overlapping the
+        calls turns N sequential round-trips into roughly one.
+        """
+        return await asyncio.gather(*[
+            self.generate_response_by_score(continue_score, user_input, persona, context)
+            for continue_score, user_input, persona, context in requests
+        ])
+    
     async def _generate_full_response(
         self, 
         user_input: str, 
@@ -389,32 +606,15 @@ class LLMManager:
         
         # Choose template category based on persona state
         if state.current_priority.value == "urgent":
-            templates = [
-                "I really must go.",
-                "I have urgent matters to attend to.", 
-                "Perhaps we can continue this later."
-            ]
+            templates = _URGENT_TEMPLATES
         elif state.social_energy < 30:
-            templates = [
-                "I'm feeling a bit drained.",
-                "I think I need a break from talking.",
-                "It's been a long day for me."
-            ]
+            templates = _DRAINED_TEMPLATES
         elif state.interaction_fatigue > 50:
-            templates = [
-                "Interesting... I should get going though.",
-                "I'll let you get back to what you were doing.",
-                "Nice chatting with you."
-            ]
+            templates = _FATIGUE_TEMPLATES
         else:
-            templates = [
-                "I see.",
-                "That's good to know.",
-                "Hmm, interesting."
-            ]
-        
-        import random
-        return random.choice(templates)
+            templates = _NEUTRAL_TEMPLATES
+        
+        return templates[random.randrange(len(templates))]
     
     def estimate_token_usage(self, response: str, response_type: str) -> int:
         """Estimate token consumption for different response types"""
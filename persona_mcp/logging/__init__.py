@@ -10,22 +10,34 @@ Provides standardized logging with:
 - Automatic cleanup of debug code
 """
 
+import json
 import logging
 import logging.config
-import json
 import sys
+import time
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Dict, Any, Optional
 from contextvars import ContextVar
 from pathlib import Path
 
 from ..config import get_config
+from ..utils import fast_json
 
 # Context variable for correlation ID tracking
 correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
 
+# LogRecord attributes that are not extra= fields, skipped when emitting extras
+_LOG_RECORD_RESERVED = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created',
+    'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'message', 'exc_info',
+    'exc_text', 'stack_info', 'correlation_id'
+})
+
+
 class CorrelationFilter(logging.Filter):
     """Add correlation ID to log records for request tracing"""
     
@@ -37,9 +49,23 @@ class CorrelationFilter(logging.Filter):
 class StructuredFormatter(logging.Formatter):
     """JSON structured logging formatter for production monitoring"""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second
+        self._second_prefix = (None, '')
+    
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC timestamp for a record's creation time, reusing the per-second prefix"""
+        second = int(created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+    
     def format(self, record):
         log_entry = {
-            'timestamp': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -55,14 +81,16 @@ class StructuredFormatter(logging.Formatter):
         
         # Add extra fields from record
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                          'filename', 'module', 'lineno', 'funcName', 'created', 
-                          'msecs', 'relativeCreated', 'thread', 'threadName', 
-                          'processName', 'process', 'message', 'exc_info', 
-                          'exc_text', 'stack_info', 'correlation_id']:
+            if key not in _LOG_RECORD_RESERVED:
                 log_entry[key] = value
         
-        return json.dumps(log_entry)
+        # Log lines are formatted on the hot path; orjson when available
+        try:
+            return fast_json.dumps(log_entry)
+        except TypeError:
+            # orjson rejects non-str keys and ints wider than 64 bits that
+            # stdlib json accepts; never drop a record over that
+            return json.dumps(log_entry)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -78,15 +106,24 @@ class ConsoleFormatter(logging.Formatter):
         'RESET': '\033[0m'      # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Padded, colored level names, rendered once per level rather than per record
+        reset = self.COLORS['RESET']
+        self._colored_levels = {
+            level: f"{color}{level:8s}{reset}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+    
     def format(self, record):
         # Get correlation ID
         corr_id = getattr(record, 'correlation_id', 'none')
         corr_display = f"[{corr_id[:8]}]" if corr_id != 'none' else ""
         
         # Color the level name
-        color = self.COLORS.get(record.levelname, '')
-        reset = self.COLORS['RESET']
-        colored_level = f"{color}{record.levelname:8s}{reset}"
+        colored_level = self._colored_levels.get(record.levelname)
+        if colored_level is None:
+            colored_level = f"{record.levelname:8s}{self.COLORS['RESET']}"
         
         # Format the message
         timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S.%f')[:-3]
@@ -273,6 +310,25 @@ def get_correlation_id() -> Optional[str]:
     return None
 
 
+class _ConnectionIdContext:
+    """Sets the correlation ID for a block and restores the previous one via its Token"""
+    
+    __slots__ = ('connection_id', 'token')
+    
+    def __init__(self, connection_id: str):
+        self.connection_id = connection_id
+        self.token = None
+    
+    def __enter__(self):
+        self.token = correlation_id.set(self.connection_id)
+        return self
+    
+    def __exit__(self, *exc_info):
+        correlation_id.reset(self.token)
+        self.token = None
+        return False
+
+
 # Convenience function for WebSocket connection correlation
 def with_connection_id(connection_id: str):
     """
@@ -282,21 +338,7 @@ def with_connection_id(connection_id: str):
         with with_connection_id(connection_id):
             logger.info("Processing WebSocket message")
     """
-    from contextlib import contextmanager
-    
-    @contextmanager
-    def correlation_context():
-        old_id = get_correlation_id()
-        set_correlation_id(connection_id)
-        try:
-            yield
-        finally:
-            if old_id:
-                set_correlation_id(old_id)
-            else:
-                clear_correlation_id()
-    
-    return correlation_context()
+    return _ConnectionIdContext(connection_id)
 
 
 # Migration helpers for converting existing logging
@@ -2,6 +2,7 @@
 MCP JSON-RPC 2.0 protocol handlers for persona interactions
 """
 
+import asyncio
 import json
 import time
 import uuid
@@ -21,6 +22,10 @@ from .session import MCPSessionManager
 from ..core import DatabaseManager, MemoryManager
 
 
+# Most searches accepted in one memory.search_batch request
+MAX_SEARCH_BATCH_SIZE = 32
+
+
 class MCPHandlers:
     """MCP protocol message handlers"""
     
@@ -83,6 +88,7 @@ class MCPHandlers:
             
             # Memory operations
             "memory.search": self.handle_memory_search,
+            "memory.search_batch": self.handle_memory_search_batch,
             "memory.store": self.handle_memory_store,
             "memory.stats": self.handle_memory_stats,
             "memory.prune": self.handle_memory_prune,
@@ -688,6 +694,28 @@ class MCPHandlers:
             "result_count": len(memories)
         }
     
+    async def handle_memory_search_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run several memory searches in one request, reporting errors per search"""
+        
+        searches = params.get("searches")
+        
+        if not isinstance(searches, list) or not searches:
+            raise ValueError("searches must be a non-empty list")
+        if len(searches) > MAX_SEARCH_BATCH_SIZE:
+            raise ValueError(f"At most {MAX_SEARCH_BATCH_SIZE} searches per batch")
+        
+        results = await asyncio.gather(
+            *(self.handle_memory_search(search) for search in searches),
+            return_exceptions=True
+        )
+        
+        return {
+            "results": [
+                {"error": str(result)} if isinstance(result, Exception) else result
+                for result in results
+            ]
+        }
+    
     async def handle_memory_store(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Store a new memory"""
         
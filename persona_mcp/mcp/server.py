@@ -33,10 +33,11 @@ class MCPWebSocketServer:
     ):
         # Initialize shared core components
         self.core_config = ConfigManager()
+        self.core_config.prewarm()
         self.logger = get_logger(__name__)
         
         # Get MCP-specific configuration
-        mcp_config = self.core_config.get_mcp_config()
+        mcp_config = self.core_config.get_cached("mcp")
         self.host = host or mcp_config["host"]
         self.port = port or mcp_config["port"]
         self.path = path
@@ -56,6 +56,7 @@ class PruningConfig:
     # Batch processing
     batch_size: int = 100                         # Process memories in batches
     max_prune_per_batch: int = 50                 # Max memories to delete per batch
+    max_concurrent_personas: int = 8              # Personas pruned in parallel by prune_all_personas
 
 
 @dataclass
@@ -352,16 +353,23 @@ class MemoryPruningSystem:
             
             self.logger.info(f"Starting global pruning for {len(persona_ids)} personas")
             
-            for persona_id in persona_ids:
-                if await self.should_prune_persona(persona_id):
-                    persona_metrics = await self.prune_persona_memories(persona_id)
-                    
-                    # Aggregate metrics
-                    total_metrics.total_memories_before += persona_metrics.total_memories_before
-                    total_metrics.total_memories_after += persona_metrics.total_memories_after
-                    total_metrics.memories_pruned += persona_metrics.memories_pruned
-                    total_metrics.personas_processed += persona_metrics.personas_processed
-                    total_metrics.errors_encountered += persona_metrics.errors_encountered
+            # Personas live in separate collections, so they can be pruned in
+            # parallel; the semaphore bounds concurrent ChromaDB work
+            semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_personas))
+            results = await asyncio.gather(
+                *[self._prune_if_needed(persona_id, semaphore) for persona_id in persona_ids]
+            )
+            
+            for persona_metrics in results:
+                if persona_metrics is None:
+                    continue
+                
+                # Aggregate metrics
+                total_metrics.total_memories_before += persona_metrics.total_memories_before
+                total_metrics.total_memories_after += persona_metrics.total_memories_after
+                total_metrics.memories_pruned += persona_metrics.memories_pruned
+                total_metrics.personas_processed += persona_metrics.personas_processed
+                total_metrics.errors_encountered += persona_metrics.errors_encountered
             
             # Update global pruning timestamp
             self.last_global_prune = datetime.now(timezone.utc)
@@ -381,6 +389,14 @@ class MemoryPruningSystem:
         
         return total_metrics
 
+    async def _prune_if_needed(self, persona_id: str,
+                               semaphore: asyncio.Semaphore) -> Optional[PruningMetrics]:
+        """Prune one persona under the global concurrency limit, if it needs it"""
+        async with semaphore:
+            if await self.should_prune_persona(persona_id):
+                return await self.prune_persona_memories(persona_id)
+            return None
+
     async def get_pruning_recommendations(self, persona_id: str) -> Dict[str, any]:
         """Get pruning recommendations without executing"""
         
@@ -12,6 +12,10 @@ from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
 
+# Prepared statements kept per pooled connection (sqlite3's default is 128);
+# pooling keeps them alive across sessions, so hot queries are parsed once
+STATEMENT_CACHE_SIZE = 256
+
 
 class SQLiteConnectionPool:
     """
@@ -32,8 +36,8 @@ class SQLiteConnectionPool:
         self.max_overflow = max_overflow
         self.enable_wal = enable_wal
         
-        # Connection management
-        self._available_connections = asyncio.Queue(maxsize=pool_size)
+        # Connection management (overflow connections are parked here too once returned)
+        self._available_connections = asyncio.Queue(maxsize=pool_size + max_overflow)
         self._all_connections = set()
         self._checked_out = set()
         self._lock = asyncio.Lock()
@@ -60,7 +64,7 @@ class SQLiteConnectionPool:
     
     async def _create_connection(self) -> aiosqlite.Connection:
         """Create a new optimized database connection"""
-        conn = await aiosqlite.connect(self.db_path)
+        conn = await aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
         
         if self.enable_wal:
             # Enable performance optimizations
@@ -80,16 +84,13 @@ class SQLiteConnectionPool:
         """Get a connection from the pool (context manager)"""
         conn = None
         try:
-            # Try to get from pool
+            # Take an idle connection without waiting if one is parked
             try:
-                conn = await asyncio.wait_for(
-                    self._available_connections.get(), 
-                    timeout=1.0
-                )
+                conn = self._available_connections.get_nowait()
                 self._pool_hits += 1
                 logger.debug("Retrieved connection from pool")
                 
-            except asyncio.TimeoutError:
+            except asyncio.QueueEmpty:
                 # Pool exhausted, create overflow connection if allowed
                 async with self._lock:
                     if len(self._all_connections) < (self.pool_size + self.max_overflow):
@@ -98,11 +99,12 @@ class SQLiteConnectionPool:
                         self._connection_count += 1
                         self._pool_misses += 1
                         logger.debug("Created overflow connection")
-                    else:
-                        # Wait for available connection
-                        conn = await self._available_connections.get()
-                        self._pool_hits += 1
-                        logger.debug("Retrieved connection after wait")
+                
+                if conn is None:
+                    # At capacity: wait for a connection to be returned
+                    conn = await self._available_connections.get()
+                    self._pool_hits += 1
+                    logger.debug("Retrieved connection after wait")
             
             self._checked_out.add(conn)
             self._checkout_count += 1
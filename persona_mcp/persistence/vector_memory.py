@@ -4,21 +4,83 @@ ChromaDB vector memory management for long-term persona memory
 
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils import embedding_functions
 from typing import List, Dict, Any, Optional
 import uuid
+import hashlib
+import heapq
+from operator import itemgetter
 from pathlib import Path
 import asyncio
 import time
 import logging
 
 from ..models import Memory
+from ..utils import TTLCache
+
+
+# HNSW graph parameters for persona collections (ChromaDB indexes with hnswlib)
+HNSW_SPACE = "cosine"
+HNSW_M = 16
+HNSW_CONSTRUCTION_EF = 64
+HNSW_SEARCH_EF = 32
+
+# Factor turning an HNSW distance into 1 - similarity for each collection
+# space. The default embedding model emits unit vectors, for which squared L2
+# is 2 - 2cos and inner product distance is 1 - cos, so every space maps onto
+# the same cosine scale. Collections without a recorded space are ChromaDB's l2
+_DISTANCE_SCALES = {"cosine": 1.0, "ip": 1.0, "l2": 0.5}
+
+# Write coalescing: concurrent stores for a persona share one embedding pass
+STORE_BATCH_SIZE = 50
+STORE_BATCH_WINDOW_MS = 10.0
+
+# Persona collections queried at once by cross-persona searches
+MAX_CONCURRENT_PERSONAS = 8
+
+# Query embedding cache: repeated searches skip the embedding model
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+QUERY_EMBEDDING_TTL_SECONDS = 1800.0
+
+# Metadata keys that map onto Memory fields rather than Memory.metadata
+_MEMORY_METADATA_KEYS = frozenset({
+    "memory_type", "importance", "emotional_valence", "related_personas",
+    "created_at", "accessed_count", "visibility"
+})
+
+# One embedding function per process; its ONNX model is loaded on first use
+_shared_embedding_function = None
+
+
+def get_embedding_function():
+    """Get the process-wide embedding function shared by all managers"""
+    global _shared_embedding_function
+    if _shared_embedding_function is None:
+        _shared_embedding_function = embedding_functions.DefaultEmbeddingFunction()
+    return _shared_embedding_function
+
+
+def _collection_space(collection) -> str:
+    """HNSW distance space a collection was built with"""
+    # configuration only exists on chromadb 1.x; older releases keep the
+    # space in the collection metadata alone
+    hnsw_config = (getattr(collection, "configuration", None) or {}).get("hnsw") or {}
+    space = hnsw_config.get("space") or (collection.metadata or {}).get("hnsw:space")
+    return space if space in _DISTANCE_SCALES else "l2"
 
 
 class VectorMemoryManager:
     """Manages vector-based memory storage using ChromaDB"""
 
-    def __init__(self, persist_directory: str = "data/vector_memory"):
+    def __init__(self, persist_directory: str = "data/vector_memory",
+                 ef_search: int = HNSW_SEARCH_EF,
+                 max_batch_size: int = STORE_BATCH_SIZE,
+                 batch_window_ms: float = STORE_BATCH_WINDOW_MS,
+                 max_concurrent_personas: int = MAX_CONCURRENT_PERSONAS):
         self.persist_directory = Path(persist_directory)
+        self.ef_search = ef_search
+        self.max_batch_size = max_batch_size
+        self.batch_window_ms = batch_window_ms
         self.persist_directory.mkdir(parents=True, exist_ok=True)
         
         # Initialize ChromaDB client with optimized settings
@@ -33,8 +95,25 @@ class VectorMemoryManager:
             )
         )
         
+        # Shared embedding function so queries can be embedded (and cached) once,
+        # and so every manager in the process reuses one loaded model
+        self.embedding_function = get_embedding_function()
+        self._query_embeddings = TTLCache(
+            maxsize=QUERY_EMBEDDING_CACHE_SIZE, ttl=QUERY_EMBEDDING_TTL_SECONDS
+        )
+
         # Memory collections by persona (lazy loaded)
         self.collections = {}
+
+        # Bounds executor queries issued by cross-persona searches, across
+        # every search in flight rather than per request
+        self._shard_semaphore = asyncio.Semaphore(max(1, max_concurrent_personas))
+
+        # Pending writes per persona as (document, metadata, id, future)
+        self._pending_writes: Dict[str, List[tuple]] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        # Full-batch flushes run detached so a cancelled caller can't strand the batch
+        self._running_flushes: set = set()
         
         # Performance tracking
         self.logger = logging.getLogger(__name__)
@@ -71,14 +150,42 @@ class VectorMemoryManager:
         """Create or get ChromaDB collection (sync operation)"""
         try:
             # Try to get existing collection
-            return self.client.get_collection(collection_name)
+            collection = self.client.get_collection(
+                collection_name, embedding_function=self.embedding_function
+            )
         except:
             # Create new collection if it doesn't exist
             return self.client.create_collection(
                 name=collection_name,
-                metadata={"description": f"Memory collection for persona"}
+                embedding_function=self.embedding_function,
+                metadata={
+                    "description": f"Memory collection for persona",
+                    "hnsw:space": HNSW_SPACE,
+                    "hnsw:M": HNSW_M,
+                    "hnsw:construction_ef": HNSW_CONSTRUCTION_EF,
+                    "hnsw:search_ef": self.ef_search
+                }
             )
 
+        # Existing collections keep their graph, but search breadth is tunable
+        self._apply_search_ef(collection)
+        space = _collection_space(collection)
+        if space != HNSW_SPACE:
+            self.logger.info(
+                f"Collection '{collection_name}' uses {space} distance; its scores "
+                f"are rescaled to match {HNSW_SPACE} collections"
+            )
+        return collection
+
+    def _apply_search_ef(self, collection) -> None:
+        """Align a loaded collection's HNSW ef_search with this manager (sync operation)"""
+        try:
+            hnsw_config = (getattr(collection, "configuration", None) or {}).get("hnsw") or {}
+            if hnsw_config.get("ef_search") != self.ef_search:
+                collection.modify(configuration={"hnsw": {"ef_search": self.ef_search}})
+        except Exception as e:
+            self.logger.debug(f"Could not set ef_search on '{collection.name}': {e}")
+
     async def store_memory(self, memory: Memory) -> bool:
         """Store a memory with vector embedding (optimized)"""
         try:
@@ -86,8 +193,6 @@ class VectorMemoryManager:
             if memory.persona_id not in self.collections:
                 await self.initialize_persona_memory(memory.persona_id)
 
-            collection = self.collections[memory.persona_id]
-            
             # Prepare metadata (optimized structure)
             metadata = {
                 "memory_type": memory.memory_type,
@@ -100,23 +205,97 @@ class VectorMemoryManager:
                 **memory.metadata
             }
 
-            # Direct ChromaDB operation (no ThreadPoolExecutor overhead)
+            # Queue the write so concurrent stores are embedded in one batch
+            future = asyncio.get_running_loop().create_future()
+            pending = self._pending_writes.setdefault(memory.persona_id, [])
+            pending.append((memory.content, metadata, memory.id, future))
+
+            if len(pending) >= self.max_batch_size:
+                flush_task = self._flush_tasks.pop(memory.persona_id, None)
+                if flush_task:
+                    flush_task.cancel()
+                flush = asyncio.create_task(self._flush_writes(memory.persona_id))
+                self._running_flushes.add(flush)
+                flush.add_done_callback(self._running_flushes.discard)
+            elif memory.persona_id not in self._flush_tasks:
+                self._flush_tasks[memory.persona_id] = asyncio.create_task(
+                    self._flush_after_window(memory.persona_id)
+                )
+
+            return await future
+            
+        except Exception as e:
+            self.logger.error(f"Error storing memory {memory.id}: {e}")
+            return False
+
+    async def _embed_query(self, query: str):
+        """Embed a search query, reusing cached vectors for repeated queries"""
+        key = hashlib.sha1(query.encode("utf-8")).digest()
+        embedding = self._query_embeddings.get(key)
+        if embedding is None:
+            embeddings = await asyncio.to_thread(self.embedding_function, [query])
+            embedding = embeddings[0]
+            self._query_embeddings.set(key, embedding)
+        return embedding
+
+    async def _flush_after_window(self, persona_id: str):
+        """Flush a persona's pending writes once the batching window closes"""
+        await asyncio.sleep(self.batch_window_ms / 1000)
+        self._flush_tasks.pop(persona_id, None)
+        await self._flush_writes(persona_id)
+
+    async def _flush_writes(self, persona_id: str):
+        """Add all pending writes for a persona in a single ChromaDB call"""
+        batch = self._pending_writes.pop(persona_id, None)
+        if not batch:
+            return
+
+        documents, metadatas, ids, futures = zip(*batch)
+        try:
+            collection = self.collections[persona_id]
+
+            # One add call lets ChromaDB embed the whole batch in one pass
             start_time = time.time()
             await asyncio.to_thread(
                 collection.add,
-                documents=[memory.content],
-                metadatas=[metadata],
-                ids=[memory.id]
+                documents=list(documents),
+                metadatas=list(metadatas),
+                ids=list(ids)
             )
-            
+
             store_time = (time.time() - start_time) * 1000  # Convert to ms
-            self.logger.debug(f"Stored memory '{memory.id}' in {store_time:.2f}ms")
-            
-            return True
-            
+            self.logger.debug(f"Stored {len(ids)} memories for '{persona_id}' in {store_time:.2f}ms")
+
+            for future in futures:
+                if not future.done():
+                    future.set_result(True)
         except Exception as e:
-            self.logger.error(f"Error storing memory {memory.id}: {e}")
-            return False
+            if len(batch) == 1:
+                if not futures[0].done():
+                    futures[0].set_exception(e)
+                return
+
+            # One bad write must not fail its neighbours; retry each on its own
+            self.logger.warning(f"Batched add of {len(ids)} memories for '{persona_id}' failed, retrying individually: {e}")
+            for document, metadata, memory_id, future in batch:
+                try:
+                    await asyncio.to_thread(
+                        self.collections[persona_id].add,
+                        documents=[document],
+                        metadatas=[metadata],
+                        ids=[memory_id]
+                    )
+                except Exception as item_error:
+                    if not future.done():
+                        future.set_exception(item_error)
+                else:
+                    if not future.done():
+                        future.set_result(True)
+        finally:
+            # Never leave a caller waiting on a write that was interrupted
+            for future in futures:
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Write for persona '{persona_id}' was interrupted"))
 
     async def search_memories(
         self, 
@@ -144,41 +323,39 @@ class VectorMemoryManager:
 
             # Perform optimized vector search
             start_time = time.time()
+            query_embedding = await self._embed_query(query)
             results = await asyncio.to_thread(
                 collection.query,
-                query_texts=[query],
+                query_embeddings=[query_embedding],
                 n_results=n_results,
                 where=where_clause if where_clause else None
             )
             
             search_time = (time.time() - start_time) * 1000  # Convert to ms
             
-            # Fast conversion to Memory objects
+            # Fast conversion to Memory objects: column lists are hoisted once and
+            # walked in lockstep instead of re-indexing the result dict per row
             memories = []
             if results and results["documents"] and results["documents"][0]:
-                for i, doc in enumerate(results["documents"][0]):
-                    metadata = results["metadatas"][0][i]
-                    memory_id = results["ids"][0][i]
-                    
+                for memory_id, doc, metadata in zip(
+                    results["ids"][0], results["documents"][0], results["metadatas"][0]
+                ):
                     # Optimized related_personas parsing
                     related_personas_str = metadata.get("related_personas", "")
-                    related_personas = related_personas_str.split(",") if related_personas_str else []
                     
-                    memory = Memory(
+                    # Rows were validated on store; model_construct skips re-validation
+                    memories.append(Memory.model_construct(
                         id=memory_id,
                         persona_id=persona_id,
                         content=doc,
                         memory_type=metadata.get("memory_type", "conversation"),
                         importance=float(metadata.get("importance", 0.5)),
                         emotional_valence=float(metadata.get("emotional_valence", 0.0)),
-                        related_personas=related_personas,
+                        related_personas=related_personas_str.split(",") if related_personas_str else [],
                         visibility=metadata.get("visibility", "private"),  # Include visibility field
-                        metadata={k: v for k, v in metadata.items() 
-                                 if k not in {"memory_type", "importance", "emotional_valence", 
-                                            "related_personas", "created_at", "accessed_count", "visibility"}},
+                        metadata={k: v for k, v in metadata.items() if k not in _MEMORY_METADATA_KEYS},
                         accessed_count=int(metadata.get("accessed_count", 0))
-                    )
-                    memories.append(memory)
+                    ))
 
             self.logger.debug(f"Searched {len(memories)} memories for '{persona_id}' in {search_time:.2f}ms")
             return memories
@@ -386,119 +563,112 @@ class VectorMemoryManager:
                 min_importance=min_importance
             )
             
-            # Convert own memories to result dictionaries (apply visibility filtering)
-            for memory in own_memories:
-                # Apply visibility filtering consistently across all memories
-                memory_visibility = memory.visibility
-                should_include = False
-                
-                if include_shared and memory_visibility == "shared":
-                    should_include = True
-                elif include_public and memory_visibility == "public":
-                    should_include = True
-                # Note: Private memories are excluded even from own persona in cross-persona search
-                # This makes the filtering consistent - cross-persona search only returns shared/public
-                    
-                if should_include:
-                    result = {
-                        "memory_id": memory.id,
-                        "content": memory.content,
-                        "similarity": 1.0,  # Own memories get perfect similarity
-                        "importance": memory.importance,
-                        "memory_type": memory.memory_type,
-                        "created_at": memory.created_at.isoformat(),
-                        "visibility": memory.visibility,
-                        "source": "own",
-                        "source_persona": requesting_persona_id
-                    }
-                    all_results.append(result)
+            visibilities = [
+                visibility for visibility, included in
+                (("shared", include_shared), ("public", include_public)) if included
+            ]
+
+            # Convert own memories to result dictionaries. Private memories are excluded
+            # even from the own persona, so cross-persona search only returns shared/public
+            all_results.extend(
+                {
+                    "memory_id": memory.id,
+                    "content": memory.content,
+                    "similarity": 1.0,  # Own memories get perfect similarity
+                    "importance": memory.importance,
+                    "memory_type": memory.memory_type,
+                    "created_at": memory.created_at.isoformat(),
+                    "visibility": memory.visibility,
+                    "source": "own",
+                    "source_persona": requesting_persona_id
+                }
+                for memory in own_memories if memory.visibility in visibilities
+            )
             
-            # Search across other personas for shared/public memories
+            # Embed once for every collection queried below
+            query_embedding = await self._embed_query(query)
+
+            if len(visibilities) == 1:
+                visibility_filter = {"visibility": visibilities[0]}
+            else:
+                visibility_filter = {"visibility": {"$in": visibilities}}
+
+            # Let ChromaDB's metadata index apply the importance cut before ranking
+            # instead of hydrating and discarding rows here
+            if min_importance > 0.0:
+                visibility_filter = {"$and": [
+                    visibility_filter,
+                    {"importance": {"$gte": min_importance}}
+                ]}
+
+            # Search across other personas for shared/public memories. Each persona
+            # is its own collection, so the shards are queried concurrently; the
+            # semaphore bounds concurrent ChromaDB work
             self.logger.debug(f"Cross-persona search: {len(self.collections)} collections, requesting persona: {requesting_persona_id}")
-            for persona_id in self.collections.keys():
-                if persona_id == requesting_persona_id:
-                    continue
-                self.logger.debug(f"Searching collection {persona_id}")
-                    
-                try:
-                    collection = self.collections[persona_id]
-                    
-                    # ChromaDB doesn't support $or/$and operators, so do separate queries
-                    all_persona_results = []
-                    
-                    # Query for shared memories
-                    if include_shared:
-                        try:
-                            shared_results = await asyncio.to_thread(
-                                collection.query,
-                                query_texts=[query],
-                                n_results=min(n_results, 10),
-                                where={"visibility": "shared"},  # Simplified to single condition
-                                include=['metadatas', 'documents', 'distances']
-                            )
-                            self.logger.debug(f"Shared query for {persona_id} found {len(shared_results.get('documents', [[]])[0]) if shared_results else 0} results")
-                            if shared_results and shared_results.get('documents') and shared_results['documents'][0]:
-                                all_persona_results.append(shared_results)
-                        except Exception as e:
-                            self.logger.debug(f"Shared query failed for {persona_id}: {e}")
-                    
-                    # Query for public memories
-                    if include_public:
-                        try:
-                            public_results = await asyncio.to_thread(
-                                collection.query,
-                                query_texts=[query],
-                                n_results=min(n_results, 10),
-                                where={"visibility": "public"},  # Simplified to single condition
-                                include=['metadatas', 'documents', 'distances']
-                            )
-                            self.logger.debug(f"Public query for {persona_id} found {len(public_results.get('documents', [[]])[0]) if public_results else 0} results")
-                            if public_results and public_results.get('documents') and public_results['documents'][0]:
-                                all_persona_results.append(public_results)
-                        except Exception as e:
-                            self.logger.debug(f"Public query failed for {persona_id}: {e}")
-                    
-                    # Process all results from this persona
-                    for results in all_persona_results:
-                        # Process results from this query
-                        for i in range(len(results['documents'][0])):
-                            metadata = results['metadatas'][0][i]
-                            importance = metadata.get('importance', 0.5)
-                            
-                            # Filter by importance since we can't do it in ChromaDB query
-                            if importance < min_importance:
-                                continue
-                                
-                            content = results['documents'][0][i]
-                            distance = results['distances'][0][i]
-                            similarity = 1.0 - distance
-                            
-                            result = {
-                                "memory_id": results['ids'][0][i],
-                                "content": content,
-                                "similarity": similarity,
-                                "importance": importance,
-                                "memory_type": metadata.get('memory_type', 'conversation'),
-                                "created_at": metadata.get('created_at'),
-                                "visibility": metadata.get('visibility', 'private'),
-                                "source": "cross_persona",
-                                "source_persona": persona_id
-                            }
-                            
-                            all_results.append(result)
-                
-                except Exception as e:
-                    self.logger.warning(f"Failed to search persona {persona_id} for cross-persona memories: {e}")
-                    continue
+            if visibilities:
+                shard_results = await asyncio.gather(*[
+                    self._search_visible_shard(
+                        persona_id, collection, query_embedding,
+                        min(n_results, 10) * len(visibilities), visibility_filter
+                    )
+                    for persona_id, collection in list(self.collections.items())
+                    if persona_id != requesting_persona_id
+                ])
+                for persona_results in shard_results:
+                    all_results.extend(persona_results)
             
-            # Sort by similarity and limit results
-            all_results.sort(key=lambda x: x['similarity'], reverse=True)
-            return all_results[:n_results]
+            # Select the top results in one bounded-heap pass instead of sorting
+            # every candidate from every shard
+            return heapq.nlargest(n_results, all_results, key=itemgetter('similarity'))
             
         except Exception as e:
             self.logger.error(f"Cross-persona memory search failed: {e}")
             return []
 
+    async def _search_visible_shard(self, persona_id: str, collection, query_embedding,
+                                    n_results: int, where: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Query one persona's collection for memories visible to other personas"""
+        self.logger.debug(f"Searching collection {persona_id}")
+        try:
+            try:
+                async with self._shard_semaphore:
+                    results = await asyncio.to_thread(
+                        collection.query,
+                        query_embeddings=[query_embedding],
+                        n_results=n_results,
+                        where=where,
+                        include=['metadatas', 'documents', 'distances']
+                    )
+            except Exception as e:
+                self.logger.debug(f"Visibility query failed for {persona_id}: {e}")
+                return []
+
+            self.logger.debug(f"Visibility query for {persona_id} found {len(results.get('documents', [[]])[0]) if results else 0} results")
+            if not (results and results.get('documents') and results['documents'][0]):
+                return []
+
+            # Collections created before the cosine default are still l2
+            scale = _DISTANCE_SCALES[_collection_space(collection)]
+            persona_results = []
+            for i in range(len(results['documents'][0])):
+                metadata = results['metadatas'][0][i]
+                persona_results.append({
+                    "memory_id": results['ids'][0][i],
+                    "content": results['documents'][0][i],
+                    "similarity": 1.0 - results['distances'][0][i] * scale,
+                    "importance": metadata.get('importance', 0.5),
+                    "memory_type": metadata.get('memory_type', 'conversation'),
+                    "created_at": metadata.get('created_at'),
+                    "visibility": metadata.get('visibility', 'private'),
+                    "source": "cross_persona",
+                    "source_persona": persona_id
+                })
+            return persona_results
+
+        except Exception as e:
+            self.logger.warning(f"Failed to search persona {persona_id} for cross-persona memories: {e}")
+            return []
+
     async def get_shared_memory_stats(self) -> Dict[str, Any]:
         """Get statistics about shared memories across all personas"""
         try:
@@ -561,6 +731,15 @@ class VectorMemoryManager:
     async def close(self):
         """Clean up resources (optimized)"""
         try:
+            # Write out anything still waiting on a batching window
+            for flush_task in self._flush_tasks.values():
+                flush_task.cancel()
+            self._flush_tasks.clear()
+            for persona_id in list(self._pending_writes):
+                await self._flush_writes(persona_id)
+            if self._running_flushes:
+                await asyncio.gather(*self._running_flushes, return_exceptions=True)
+
             # Clear collections cache
             self.collections.clear()
             
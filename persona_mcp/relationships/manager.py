@@ -15,6 +15,23 @@ from ..persistence import SQLiteManager, VectorMemoryManager
 from ..logging import get_logger
 
 
+# Flat score adjustments applied on top of quality impact, by interaction context
+CONTEXT_MODIFIERS = {
+    "conflict": {"trust": -0.2, "affinity": -0.1},
+    "collaboration": {"trust": 0.1, "respect": 0.1},
+    "casual": {"affinity": 0.1},
+    "deep_conversation": {"intimacy": 0.1, "trust": 0.05},
+    "professional": {"respect": 0.1}
+}
+
+_NO_MODIFIER: Dict[str, float] = {}
+
+
+def _clamp_unit(value: float) -> float:
+    """Clamp a score to the [0, 1] range"""
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+
+
 class RelationshipManager:
     """Manages relationships and emotional states between personas"""
     
@@ -288,28 +305,17 @@ class RelationshipManager:
         # Duration factor (longer interactions have more impact)
         duration_factor = min(1.0, duration / 30.0)  # Cap at 30 minutes
         
-        # Context-specific modifiers
-        context_modifiers = {
-            "conflict": {"trust": -0.2, "affinity": -0.1},
-            "collaboration": {"trust": 0.1, "respect": 0.1},
-            "casual": {"affinity": 0.1},
-            "deep_conversation": {"intimacy": 0.1, "trust": 0.05},
-            "professional": {"respect": 0.1}
-        }
-        
-        modifier = context_modifiers.get(context, {})
-        
-        # Update scores
-        relationship.affinity += base_impact * duration_factor + modifier.get("affinity", 0)
-        relationship.trust += (base_impact * 0.8) * duration_factor + modifier.get("trust", 0)
-        relationship.respect += (base_impact * 0.9) * duration_factor + modifier.get("respect", 0)
-        relationship.intimacy += (base_impact * 0.7) * duration_factor + modifier.get("intimacy", 0)
+        modifier = CONTEXT_MODIFIERS.get(context, _NO_MODIFIER)
         
-        # Clamp values to [0, 1] range
-        relationship.affinity = max(0.0, min(1.0, relationship.affinity))
-        relationship.trust = max(0.0, min(1.0, relationship.trust))
-        relationship.respect = max(0.0, min(1.0, relationship.respect))
-        relationship.intimacy = max(0.0, min(1.0, relationship.intimacy))
+        # Update and clamp scores to [0, 1] in one pass
+        relationship.affinity = _clamp_unit(
+            relationship.affinity + base_impact * duration_factor + modifier.get("affinity", 0))
+        relationship.trust = _clamp_unit(
+            relationship.trust + (base_impact * 0.8) * duration_factor + modifier.get("trust", 0))
+        relationship.respect = _clamp_unit(
+            relationship.respect + (base_impact * 0.9) * duration_factor + modifier.get("respect", 0))
+        relationship.intimacy = _clamp_unit(
+            relationship.intimacy + (base_impact * 0.7) * duration_factor + modifier.get("intimacy", 0))
     
     def _determine_relationship_type(self, relationship: Relationship) -> RelationshipType:
         """Determine relationship type based on scores and interaction count"""
@@ -132,6 +132,7 @@ class ChatroomSimulation:
         """Process and potentially end active conversations"""
         
         conversations_to_end = []
+        conversations_to_advance = []
         
         for conv_id, context in self.state.active_conversations.items():
             # Check if conversation should naturally end
@@ -141,7 +142,12 @@ class ChatroomSimulation:
             
             # Randomly advance conversation (simulate autonomous interaction)
             if random.random() < 0.3:  # 30% chance per tick
-                await self._advance_conversation(conv_id)
+                conversations_to_advance.append(conv_id)
+        
+        # Advance independent conversations together so their LLM calls overlap
+        await asyncio.gather(*[
+            self._advance_conversation(conv_id) for conv_id in conversations_to_advance
+        ])
         
         # End conversations that should end
         for conv_id in conversations_to_end:
@@ -3,5 +3,6 @@ Utility modules for performance optimization
 """
 
 from .fast_json import dumps, loads, JSONDecodeError, JSONBenchmark, HAS_ORJSON
+from .ttl_cache import TTLCache
 
-__all__ = ['dumps', 'loads', 'JSONDecodeError', 'JSONBenchmark', 'HAS_ORJSON']
\ No newline at end of file
+__all__ = ['dumps', 'loads', 'JSONDecodeError', 'JSONBenchmark', 'HAS_ORJSON', 'TTLCache']
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Bounded in-process cache with LRU eviction and per-entry expiry
+
+Used for short-lived read caches (e.g. persona lookups) where a burst of
+requests resolves the same key repeatedly.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Tuple
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """LRU cache whose entries expire after a fixed time-to-live"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key, returning its value (expired or not) or default"""
+        entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        return entry[1]
+
+    def keys(self) -> List[Hashable]:
+        """Snapshot of cached keys, including entries that have expired"""
+        return list(self._data)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+__all__ = ['TTLCache']
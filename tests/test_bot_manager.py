@@ -0,0 +1,623 @@
+"""
+Unit tests for persona_mcp.dashboard.bot_manager module
+
+Tests bot process lifecycle helpers using short-lived Python subprocesses.
+"""
+
+import pytest
+import json
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from persona_mcp.dashboard import bot_manager as bot_manager_module
+from persona_mcp.dashboard.bot_manager import (
+    BotProcess, BotProcessManager, _RotatingLogSink, _scan_startup_log, _tail_lines
+)
+
+
+@pytest.fixture
+def bot_manager(tmp_path, monkeypatch):
+    """Create a BotProcessManager whose log directory lives in a temp dir"""
+    monkeypatch.chdir(tmp_path)
+    return BotProcessManager()
+
+
+def _spawn(code: str) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-c", code])
+
+
+def _bot(tmp_path, code: str) -> BotProcess:
+    """Start a child that appends to its log file like a bot would"""
+    log_file = tmp_path / "bot.log"
+    log_file.write_text("starting up\n")
+    script = f"import time\nlog = open({str(log_file)!r}, 'a', buffering=1)\n{code}"
+    return BotProcess(
+        persona_id="persona-1",
+        persona_name="Aria",
+        process=_spawn(script),
+        log_file=log_file,
+        start_time=datetime.now(timezone.utc),
+        status="starting"
+    )
+
+
+async def _assert_exit_reaped(bot_manager, tmp_path):
+    """Track a running bot that exits shortly and check the manager drops it"""
+    bot = _bot(tmp_path, "time.sleep(0.2)")
+    bot.status = "running"
+    bot_manager.running_bots[bot.persona_id] = bot
+    bot_manager._by_pid[bot.process.pid] = bot
+
+    await bot_manager.initialize()
+    try:
+        assert bot.process.pid in bot_manager._exit_watches
+        for _ in range(50):
+            if not bot_manager.running_bots:
+                break
+            await asyncio.sleep(0.05)
+
+        assert bot_manager.running_bots == {}
+        assert bot_manager._by_pid == {}
+        assert bot_manager._exit_watches == {}
+    finally:
+        await bot_manager.shutdown()
+
+
+class TestSpawnBot:
+    """Test launching bot processes"""
+
+    @pytest.mark.asyncio
+    async def test_output_goes_to_log_file(self, bot_manager, tmp_path):
+        """Test that stdout and stderr are copied into the bot log"""
+        log_file = tmp_path / "bot.log"
+        code = "import sys; print('out'); sys.stdout.flush(); print('err', file=sys.stderr)"
+
+        process, _ = bot_manager._spawn_bot([sys.executable, "-c", code])
+        sink = _RotatingLogSink(process.stdout, log_file, max_bytes=1024)
+        await asyncio.wait_for(sink.closed.wait(), timeout=5)
+        process.wait()
+
+        assert log_file.read_text() == "out\nerr\n"
+
+    def test_bots_share_a_process_group(self, bot_manager):
+        """Test that later bots join the group led by the first bot"""
+        first, first_pgid = bot_manager._spawn_bot([sys.executable, "-c", "import time; time.sleep(30)"])
+        second, second_pgid = bot_manager._spawn_bot(
+            [sys.executable, "-c", "import time; time.sleep(30)"], first_pgid
+        )
+        try:
+            assert first_pgid == second_pgid == first.pid
+            assert os.getpgid(second.pid) == first.pid
+            assert os.getpgid(first.pid) != os.getpgrp()
+        finally:
+            for process in (first, second):
+                process.kill()
+                process.wait()
+                process.stdout.close()
+
+    def test_new_group_after_all_bots_exit(self, bot_manager):
+        """Test that a stale shared group is replaced instead of failing the spawn"""
+        first, first_pgid = bot_manager._spawn_bot([sys.executable, "-c", "pass"])
+        first.wait()
+        first.stdout.close()
+
+        second, pgid = bot_manager._spawn_bot([sys.executable, "-c", "pass"], first_pgid)
+        second.wait()
+        second.stdout.close()
+
+        assert pgid == second.pid
+
+
+class TestWaitForExit:
+    """Test waiting for bot processes to exit"""
+
+    @pytest.mark.asyncio
+    async def test_returns_when_process_exits(self, bot_manager):
+        """Test that waiting returns once the child exits and reaps it"""
+        process = _spawn("import time; time.sleep(0.2)")
+
+        await asyncio.wait_for(bot_manager._wait_for_exit(process), timeout=5)
+
+        assert process.returncode == 0
+
+    @pytest.mark.asyncio
+    async def test_already_exited_process(self, bot_manager):
+        """Test that an already reaped process returns immediately"""
+        process = _spawn("raise SystemExit(3)")
+        process.wait()
+
+        await asyncio.wait_for(bot_manager._wait_for_exit(process), timeout=1)
+
+        assert process.returncode == 3
+
+    @pytest.mark.asyncio
+    async def test_polling_fallback_backs_off(self, bot_manager, monkeypatch):
+        """Test that without exit notification the poll interval grows to its cap"""
+        monkeypatch.setattr(bot_manager_module, "_open_exit_notifier", lambda pid: None)
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr(bot_manager_module.asyncio, "sleep", record_sleep)
+        process = MagicMock(spec=subprocess.Popen)
+        process.pid = 4242
+        process.poll.side_effect = [None] * 15 + [0]
+
+        await bot_manager._wait_for_exit(process)
+
+        assert delays[0] == pytest.approx(0.01)
+        assert delays[1] == pytest.approx(0.015)
+        assert delays == sorted(delays)
+        assert delays[-1] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_cancel_leaves_process_running(self, bot_manager):
+        """Test that a timed-out wait cleans up without touching the child"""
+        process = _spawn("import time; time.sleep(30)")
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(bot_manager._wait_for_exit(process), timeout=0.2)
+            assert process.poll() is None
+        finally:
+            process.kill()
+            process.wait()
+
+
+class TestWaitForStartup:
+    """Test detection of bot startup from its log file"""
+
+    @pytest.mark.asyncio
+    async def test_success_marker_marks_running(self, bot_manager, tmp_path):
+        """Test that a success line appended later completes startup"""
+        bot = _bot(tmp_path, "time.sleep(0.2)\nlog.write('Connected to MCP server\\n')\ntime.sleep(30)")
+        try:
+            await asyncio.wait_for(bot_manager._wait_for_startup(bot), timeout=5)
+            assert bot.status == "running"
+        finally:
+            bot.process.kill()
+            bot.process.wait()
+
+    @pytest.mark.asyncio
+    async def test_marker_split_across_reads(self, bot_manager, tmp_path, monkeypatch):
+        """Test that a marker straddling two chunk reads is still found"""
+        monkeypatch.setattr(bot_manager_module, "LOG_SCAN_CHUNK_SIZE", 7)
+        bot = _bot(tmp_path, "log.write('Bot started successfully\\n')\ntime.sleep(30)")
+        try:
+            await asyncio.wait_for(bot_manager._wait_for_startup(bot), timeout=5)
+            assert bot.status == "running"
+        finally:
+            bot.process.kill()
+            bot.process.wait()
+
+    @pytest.mark.asyncio
+    async def test_failure_marker_raises(self, bot_manager, tmp_path):
+        """Test that an error line fails startup"""
+        bot = _bot(tmp_path, "log.write('FATAL: no homeserver\\n')\ntime.sleep(30)")
+        try:
+            with pytest.raises(Exception, match="startup failed"):
+                await asyncio.wait_for(bot_manager._wait_for_startup(bot), timeout=5)
+        finally:
+            bot.process.kill()
+            bot.process.wait()
+
+    @pytest.mark.asyncio
+    async def test_times_out_on_deadline(self, bot_manager, tmp_path):
+        """Test that a silent bot fails startup once the timeout elapses"""
+        bot_manager.startup_timeout = 0.3
+        bot = _bot(tmp_path, "time.sleep(30)")
+        try:
+            with pytest.raises(Exception, match="startup timeout"):
+                await asyncio.wait_for(bot_manager._wait_for_startup(bot), timeout=5)
+            assert bot.status == "startup_timeout"
+        finally:
+            bot.process.kill()
+            bot.process.wait()
+
+    @pytest.mark.asyncio
+    async def test_exit_during_startup_raises(self, bot_manager, tmp_path):
+        """Test that a child exiting before connecting fails startup"""
+        bot = _bot(tmp_path, "raise SystemExit(1)")
+
+        with pytest.raises(Exception, match="exited during startup"):
+            await asyncio.wait_for(bot_manager._wait_for_startup(bot), timeout=5)
+
+
+class TestScanStartupLog:
+    """Test the incremental startup log scanner"""
+
+    def test_resumes_from_previous_offset(self, tmp_path):
+        """Test that a second scan only looks at bytes appended since the first"""
+        log_file = tmp_path / "bot.log"
+        log_file.write_bytes(b"booting\n")
+
+        started, offset, carry = _scan_startup_log(log_file, 0, b"")
+        assert (started, offset) == (None, 8)
+
+        with open(log_file, "ab") as f:
+            f.write(b"Connected to MCP server\n")
+        assert _scan_startup_log(log_file, offset, carry)[0] is True
+
+    def test_failure_marker(self, tmp_path):
+        """Test that an error line is reported as a failed startup"""
+        log_file = tmp_path / "bot.log"
+        log_file.write_bytes(b"ERROR: bad token\n")
+
+        assert _scan_startup_log(log_file, 0, b"")[0] is False
+
+class TestExitMonitoring:
+    """Test removal of bots that exit on their own"""
+
+    @pytest.mark.asyncio
+    async def test_exit_watch_removes_exited_bot(self, bot_manager, tmp_path):
+        """Test that a bot exiting unprompted is dropped without waiting for a sweep"""
+        await _assert_exit_reaped(bot_manager, tmp_path)
+
+    def test_exit_watch_works_under_uvloop(self, bot_manager, tmp_path):
+        """Test that exits are still reaped promptly on uvloop, which refuses SIGCHLD handlers"""
+        uvloop = pytest.importorskip("uvloop")
+
+        uvloop.run(_assert_exit_reaped(bot_manager, tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_exit_watch_ignores_bot_being_stopped(self, bot_manager, tmp_path):
+        """Test that stop_bot keeps ownership of a bot it is stopping"""
+        bot = _bot(tmp_path, "raise SystemExit(0)")
+        bot.process.wait()
+        bot.status = "stopping"
+        bot_manager.running_bots[bot.persona_id] = bot
+        bot_manager._by_pid[bot.process.pid] = bot
+
+        bot_manager._on_bot_exit(bot)
+
+        assert bot_manager.running_bots == {bot.persona_id: bot}
+
+    def test_reaping_last_bot_clears_process_group(self, bot_manager, tmp_path):
+        """Test that a later bot does not join a group number left behind by exited bots"""
+        bot = _bot(tmp_path, "raise SystemExit(0)")
+        bot.process.wait()
+        bot.status = "running"
+        bot_manager.running_bots[bot.persona_id] = bot
+        bot_manager._by_pid[bot.process.pid] = bot
+        bot_manager._bot_pgid = bot.process.pid
+
+        bot_manager._on_bot_exit(bot)
+
+        assert bot_manager.running_bots == {}
+        assert bot_manager._bot_pgid is None
+
+
+class TestPollTiers:
+    """Test age-based polling cadence for bot status"""
+
+    def test_tier_follows_bot_age(self, bot_manager, tmp_path):
+        """Test that older bots are moved to slower poll tiers"""
+        bot = _bot(tmp_path, "time.sleep(30)")
+        try:
+            now = bot.started_mono
+            assert bot_manager._poll_bot(bot, now + 1) is None
+            assert (bot.tier, bot.next_check_mono) == ("hot", now + 2)
+
+            bot_manager._poll_bot(bot, now + 120)
+            assert (bot.tier, bot.next_check_mono) == ("warm", now + 130)
+
+            bot_manager._poll_bot(bot, now + 900)
+            assert (bot.tier, bot.next_check_mono) == ("cold", now + 960)
+        finally:
+            bot.process.kill()
+            bot.process.wait()
+
+    def test_status_cached_until_due(self, bot_manager, tmp_path):
+        """Test that get_bot_status only polls bots whose check is due"""
+        process = MagicMock(spec=subprocess.Popen)
+        process.pid = 4242
+        process.poll.return_value = 2
+        bot = BotProcess(
+            persona_id="persona-1",
+            persona_name="Aria",
+            process=process,
+            log_file=tmp_path / "bot.log",
+            start_time=datetime.now(timezone.utc),
+            next_check_mono=float("inf")
+        )
+        bot_manager.running_bots[bot.persona_id] = bot
+
+        assert bot_manager.get_bot_status()[0]["status"] == "running"
+        process.poll.assert_not_called()
+
+        bot.next_check_mono = 0.0
+        assert bot_manager.get_bot_status()[0]["status"] == "exited (2)"
+        process.poll.assert_called_once()
+
+
+class TestStatusBytes:
+    """Test the cached JSON encoding of bot status"""
+
+    def _mock_bot(self, tmp_path, poll_result=None):
+        process = MagicMock(spec=subprocess.Popen)
+        process.pid = 4242
+        process.poll.return_value = poll_result
+        return BotProcess(
+            persona_id="persona-1",
+            persona_name="Aria",
+            process=process,
+            log_file=tmp_path / "bot.log",
+            start_time=datetime.now(timezone.utc),
+            next_check_mono=float("inf")
+        )
+
+    def test_matches_status_list(self, bot_manager, tmp_path):
+        """Test that the encoded payload decodes to get_bot_status()"""
+        bot = self._mock_bot(tmp_path)
+        bot_manager.running_bots[bot.persona_id] = bot
+
+        assert json.loads(bot_manager.get_bot_status_bytes()) == bot_manager.get_bot_status()
+
+    def test_reused_until_state_changes(self, bot_manager, tmp_path):
+        """Test that repeat polls return the same bytes until a bot exits"""
+        bot = self._mock_bot(tmp_path)
+        bot_manager.running_bots[bot.persona_id] = bot
+
+        first = bot_manager.get_bot_status_bytes()
+        assert bot_manager.get_bot_status_bytes() is first
+
+        bot.process.poll.return_value = 1
+        bot.next_check_mono = 0.0
+        changed = bot_manager.get_bot_status_bytes()
+
+        assert changed is not first
+        assert json.loads(changed)[0]["status"] == "exited (1)"
+
+    def test_status_list_built_once_between_changes(self, bot_manager, tmp_path, monkeypatch):
+        """Test that repeat get_bot_status() calls reuse the snapshot until a bot changes"""
+        bot = self._mock_bot(tmp_path)
+        bot_manager.running_bots[bot.persona_id] = bot
+        builds = []
+        build = bot_manager._build_bot_status
+        monkeypatch.setattr(bot_manager, "_build_bot_status", lambda: builds.append(1) or build())
+
+        bot_manager.get_bot_status()
+        bot_manager.get_bot_status()
+        bot_manager.get_bot_status_bytes()
+
+        assert len(builds) == 1
+
+    def test_forgetting_a_bot_drops_the_cache(self, bot_manager, tmp_path):
+        """Test that removing a bot is reflected in the next payload"""
+        bot = self._mock_bot(tmp_path)
+        bot_manager.running_bots[bot.persona_id] = bot
+        bot_manager.get_bot_status_bytes()
+
+        bot_manager._forget(bot)
+
+        assert json.loads(bot_manager.get_bot_status_bytes()) == []
+
+
+class TestLogTail:
+    """Test reading the end of bot log files"""
+
+    def test_returns_last_lines(self, tmp_path):
+        """Test that only the requested trailing lines are returned"""
+        log_file = tmp_path / "bot.log"
+        log_file.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+        assert _tail_lines(log_file, 3) == ["line 997\n", "line 998\n", "line 999\n"]
+
+    def test_grows_window_for_long_lines(self, tmp_path):
+        """Test that lines longer than the initial window are still returned whole"""
+        log_file = tmp_path / "bot.log"
+        long_line = "x" * 2000 + "\n"
+        log_file.write_text("head\n" + long_line * 3)
+
+        assert _tail_lines(log_file, 2) == [long_line, long_line]
+
+    def test_short_file_returns_everything(self, tmp_path):
+        """Test that asking for more lines than exist returns the whole file"""
+        log_file = tmp_path / "bot.log"
+        log_file.write_text("one\ntwo")
+
+        assert _tail_lines(log_file, 100) == ["one\n", "two"]
+
+    @pytest.mark.asyncio
+    async def test_get_bot_logs(self, bot_manager, tmp_path):
+        """Test that get_bot_logs tails the bot's log file"""
+        bot = _bot(tmp_path, "raise SystemExit(0)")
+        bot.process.wait()
+        bot_manager.running_bots[bot.persona_id] = bot
+
+        assert await bot_manager.get_bot_logs(bot.persona_id, lines=1) == ["starting up\n"]
+
+
+class TestLogRotation:
+    """Test size-capped bot log files"""
+
+    @pytest.mark.asyncio
+    async def test_rotates_when_cap_reached(self, tmp_path):
+        """Test that output past max_bytes rolls into numbered backups"""
+        log_file = tmp_path / "bot.log"
+        code = (
+            "import sys, time\n"
+            "for i in range(6):\n"
+            "    sys.stdout.write(f'chunk {i} ' + 'x' * 90 + '\\n'); sys.stdout.flush(); time.sleep(0.02)\n"
+        )
+        process = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE)
+        sink = _RotatingLogSink(process.stdout, log_file, max_bytes=250, backup_count=2)
+        await asyncio.wait_for(sink.closed.wait(), timeout=5)
+        process.wait()
+
+        current = log_file.read_text()
+        assert current.startswith("chunk 4") and "chunk 5" in current
+        assert log_file.with_name("bot.log.1").read_text().startswith("chunk 2")
+        assert log_file.with_name("bot.log.2").read_text().startswith("chunk 0")
+        assert not log_file.with_name("bot.log.3").exists()
+        assert all(p.stat().st_size <= 250 for p in tmp_path.glob("bot.log*"))
+
+    @pytest.mark.asyncio
+    async def test_no_rotation_while_held(self, tmp_path):
+        """Test that the log is not swapped out while the startup scan is reading it"""
+        log_file = tmp_path / "bot.log"
+        code = "import sys\nfor i in range(6):\n    sys.stdout.write('x' * 99 + '\\n'); sys.stdout.flush()\n"
+        process = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE)
+        sink = _RotatingLogSink(process.stdout, log_file, max_bytes=250)
+        sink.hold_rotation = True
+        await asyncio.wait_for(sink.closed.wait(), timeout=5)
+        process.wait()
+
+        assert log_file.stat().st_size == 600
+        assert not log_file.with_name("bot.log.1").exists()
+
+    @pytest.mark.asyncio
+    async def test_write_error_keeps_the_bot_running(self, tmp_path, monkeypatch):
+        """Test that a failing disk write drops output but keeps the pipe drained"""
+        write = _RotatingLogSink._write
+        failures = []
+
+        def disk_full_once(self, chunks):
+            if not failures:
+                failures.append(chunks)
+                raise OSError(28, "No space left on device")
+            write(self, chunks)
+
+        monkeypatch.setattr(_RotatingLogSink, "_write", disk_full_once)
+        log_file = tmp_path / "bot.log"
+        process = subprocess.Popen(
+            [sys.executable, "-c",
+             "import time; print('lost', flush=True); time.sleep(0.2); print('kept', flush=True)"],
+            stdout=subprocess.PIPE
+        )
+        sink = _RotatingLogSink(process.stdout, log_file, max_bytes=1024)
+        await asyncio.wait_for(sink.closed.wait(), timeout=5)
+
+        assert process.wait(timeout=5) == 0
+        assert failures
+        logged = log_file.read_text()
+        assert "lost" not in logged and "kept" in logged
+
+
+class TestStopAllBots:
+    """Test stopping every running bot"""
+
+    @pytest.mark.asyncio
+    async def test_stops_every_bot(self, bot_manager, tmp_path):
+        """Test that all bots are terminated and the tables emptied"""
+        bots = []
+        for i in range(3):
+            process = _spawn("import time; time.sleep(30)")
+            bot = BotProcess(
+                persona_id=f"persona-{i}",
+                persona_name=f"Bot{i}",
+                process=process,
+                log_file=tmp_path / f"bot{i}.log",
+                start_time=datetime.now(timezone.utc)
+            )
+            bot_manager.running_bots[bot.persona_id] = bot
+            bot_manager._by_pid[process.pid] = bot
+            bots.append(bot)
+
+        await asyncio.wait_for(bot_manager.stop_all_bots(), timeout=5)
+
+        assert all(bot.process.returncode is not None for bot in bots)
+        assert bot_manager.running_bots == {}
+        assert bot_manager._by_pid == {}
+
+    @pytest.mark.asyncio
+    async def test_signals_shared_group_once(self, bot_manager, tmp_path, monkeypatch):
+        """Test that bots in one group get a single killpg and a stubborn bot is killed"""
+        bot_manager.shutdown_timeout = 0.5
+        stubborn = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(30)"
+        bots = []
+        pgid = None
+        for i, code in enumerate(("import time; time.sleep(30)", stubborn)):
+            process, pgid = bot_manager._spawn_bot([sys.executable, "-c", code], pgid)
+            bot = BotProcess(
+                persona_id=f"persona-{i}",
+                persona_name=f"Bot{i}",
+                process=process,
+                log_file=tmp_path / f"bot{i}.log",
+                start_time=datetime.now(timezone.utc),
+                pgid=pgid
+            )
+            bot_manager.running_bots[bot.persona_id] = bot
+            bots.append(bot)
+        await asyncio.sleep(0.3)  # let the stubborn bot install its handler
+
+        killpg_calls = []
+        real_killpg = os.killpg
+
+        def record_killpg(pgid, sig):
+            killpg_calls.append((pgid, sig))
+            real_killpg(pgid, sig)
+
+        monkeypatch.setattr(bot_manager_module.os, "killpg", record_killpg)
+        await asyncio.wait_for(bot_manager.stop_all_bots(), timeout=5)
+
+        pgid = bots[0].pgid
+        assert killpg_calls == [(pgid, signal.SIGTERM), (pgid, signal.SIGKILL)]
+        assert bots[0].process.returncode == -signal.SIGTERM
+        assert bots[1].process.returncode == -signal.SIGKILL
+        for bot in bots:
+            bot.process.stdout.close()
+
+    def test_skips_group_of_reaped_bot(self, bot_manager, tmp_path, monkeypatch):
+        """Test that a group whose bots were all reaped is not signalled"""
+        process, pgid = bot_manager._spawn_bot([sys.executable, "-c", "pass"])
+        process.wait()
+        process.stdout.close()
+        bot = BotProcess(
+            persona_id="persona-1",
+            persona_name="Bot1",
+            process=process,
+            log_file=tmp_path / "bot.log",
+            start_time=datetime.now(timezone.utc),
+            pgid=pgid
+        )
+        killpg = MagicMock()
+        monkeypatch.setattr(bot_manager_module.os, "killpg", killpg)
+
+        bot_manager._signal_bots([bot], signal.SIGTERM)
+
+        killpg.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_during_stop_gets_fresh_group(self, bot_manager, monkeypatch):
+        """Test that a bot spawned into a group being stopped is restarted in its own group"""
+        leader, old_pgid = bot_manager._spawn_bot([sys.executable, "-c", "import time; time.sleep(30)"])
+        bot_manager._bot_pgid = old_pgid
+        spawned = []
+        real_spawn = bot_manager._spawn_bot
+
+        def spawn_racing_stop(command, pgid=None):
+            process, pgid = real_spawn([sys.executable, "-c", "import time; time.sleep(30)"], pgid)
+            spawned.append(process)
+            if len(spawned) == 1:
+                # stop_all_bots retires the group while this spawn is in flight
+                bot_manager._bot_pgid = None
+                bot_manager._bot_group_generation += 1
+            return process, pgid
+
+        async def started(bot_process):
+            bot_process.status = "running"
+
+        monkeypatch.setattr(bot_manager, "_spawn_bot", spawn_racing_stop)
+        monkeypatch.setattr(bot_manager, "_wait_for_startup", started)
+        try:
+            bot = await bot_manager.start_bot("persona-1", "Aria")
+
+            assert len(spawned) == 2
+            assert spawned[0].returncode is not None
+            assert bot.process is spawned[1]
+            assert bot.pgid == bot.process.pid != old_pgid
+            assert bot_manager._bot_pgid == bot.pgid
+        finally:
+            for process in spawned + [leader]:
+                process.kill()
+                process.wait()
+                process.stdout.close()
+            await bot_manager.stop_all_bots()
@@ -114,6 +114,26 @@ class TestConnectionPoolInitialization:
             assert result[0].upper() == "WAL"
         
         await pool.close_all()
+    
+    @pytest.mark.asyncio
+    async def test_connections_use_larger_statement_cache(self, temp_db, monkeypatch):
+        """Test that pooled connections are opened with the enlarged statement cache"""
+        from persona_mcp.persistence import connection_pool as pool_module
+        
+        calls = []
+        real_connect = aiosqlite.connect
+        
+        def connect(*args, **kwargs):
+            calls.append(kwargs)
+            return real_connect(*args, **kwargs)
+        
+        monkeypatch.setattr(pool_module.aiosqlite, "connect", connect)
+        pool = SQLiteConnectionPool(db_path=temp_db, pool_size=2)
+        await pool.initialize()
+        
+        assert [c["cached_statements"] for c in calls] == [pool_module.STATEMENT_CACHE_SIZE] * 2
+        
+        await pool.close_all()
 
 
 class TestConnectionCheckout:
@@ -34,6 +34,12 @@ class TestConfigManagerInitialization:
             config_manager = ConfigManager()
             
             mock_logger.info.assert_called_with("ConfigManager initialized")
+    
+    def test_config_manager_uses_slots(self):
+        """Test that ConfigManager instances carry no per-instance __dict__"""
+        config_manager = ConfigManager()
+        
+        assert not hasattr(config_manager, '__dict__')
 
 
 class TestServerConfiguration:
@@ -493,6 +499,7 @@ class TestConfigurationUpdates:
         with patch.object(ConfigManager, '__init__', return_value=None):
             config_manager = ConfigManager()
             config_manager.logger = MagicMock()
+            config_manager._cache = {}
             
             # Mock config object with server section
             mock_server_section = MagicMock()
@@ -513,6 +520,7 @@ class TestConfigurationUpdates:
         with patch.object(ConfigManager, '__init__', return_value=None):
             config_manager = ConfigManager()
             config_manager.logger = MagicMock()
+            config_manager._cache = {}
             
             # Mock config object with server section
             mock_server_section = MagicMock()
@@ -529,6 +537,7 @@ class TestConfigurationUpdates:
         with patch.object(ConfigManager, '__init__', return_value=None):
             config_manager = ConfigManager()
             config_manager.logger = MagicMock()
+            config_manager._cache = {}
             
             # Mock config to raise an exception during hasattr check
             config_manager.config = MagicMock()
@@ -543,6 +552,49 @@ class TestConfigurationUpdates:
                 config_manager.logger.error.assert_called()
 
 
+class TestConfigCache:
+    """Test prewarmed read-only config views"""
+    
+    def test_prewarm_populates_all_sections(self):
+        """Test prewarm caches every section as a read-only mapping"""
+        config_manager = ConfigManager()
+        config_manager.prewarm()
+        
+        all_config = config_manager.get_all_config()
+        for section, values in all_config.items():
+            view = config_manager.get_cached(section)
+            assert dict(view) == values
+            with pytest.raises(TypeError):
+                view["new_key"] = "value"
+    
+    def test_get_cached_returns_same_view(self):
+        """Test repeated lookups reuse the cached view"""
+        config_manager = ConfigManager()
+        
+        assert config_manager.get_cached("server") is config_manager.get_cached("server")
+    
+    def test_get_cached_unknown_section(self):
+        """Test unknown sections are rejected"""
+        config_manager = ConfigManager()
+        
+        with pytest.raises(KeyError):
+            config_manager.get_cached("nonexistent_section")
+    
+    def test_update_config_invalidates_cache(self):
+        """Test runtime updates are visible through the cache"""
+        config_manager = ConfigManager()
+        mock_server_section = MagicMock()
+        mock_server_section.host = "localhost"
+        
+        with patch.object(config_manager.config, "server", mock_server_section):
+            config_manager.prewarm()
+            assert config_manager.get_cached("server")["host"] == "localhost"
+            
+            config_manager.update_config("server", {"host": "0.0.0.0"})
+            
+            assert config_manager.get_cached("server")["host"] == "0.0.0.0"
+
+
 class TestConfigManagerIntegration:
     """Test ConfigManager integration with original config system"""
     
@@ -565,6 +617,7 @@ class TestConfigManagerIntegration:
         with patch.object(ConfigManager, '__init__', return_value=None):
             config_manager = ConfigManager()
             config_manager.logger = MagicMock()
+            config_manager._cache = {}
             
             # Mock config with minimal attributes
             config_manager.config = MagicMock()
@@ -591,6 +644,7 @@ class TestConfigManagerEdgeCases:
         with patch.object(ConfigManager, '__init__', return_value=None):
             config_manager = ConfigManager()
             config_manager.logger = MagicMock()
+            config_manager._cache = {}
             
             # Mock config with None attributes
             config_manager.config = MagicMock()
@@ -605,6 +659,7 @@ class TestConfigManagerEdgeCases:
         with patch.object(ConfigManager, '__init__', return_value=None):
             config_manager = ConfigManager()
             config_manager.logger = MagicMock()
+            config_manager._cache = {}
             
             # Mock config with consistent host
             config_manager.config = MagicMock()
@@ -627,6 +682,7 @@ class TestConfigManagerEdgeCases:
         with patch.object(ConfigManager, '__init__', return_value=None):
             config_manager = ConfigManager()
             config_manager.logger = MagicMock()
+            config_manager._cache = {}
             
             # Mock config with all required attributes
             config_manager.config = MagicMock()
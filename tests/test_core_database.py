@@ -12,8 +12,8 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any
 
-from persona_mcp.core.database import DatabaseManager
-from persona_mcp.core.models import Persona, Memory, Relationship, RelationshipType, EmotionalState
+from persona_mcp.core.database import DatabaseManager, ENGINE_POOL_OPTIONS
+from persona_mcp.core.models import Persona, Memory, MemoryView, Relationship, RelationshipType, EmotionalState
 from persona_mcp.persistence.sqlite_manager import SQLiteManager
 from persona_mcp.persistence.vector_memory import VectorMemoryManager
 
@@ -41,6 +41,55 @@ class TestDatabaseManagerInitialization:
         
         assert db_manager.sqlite is mock_sqlite
         assert db_manager.vector is mock_vector
+    
+    @pytest.mark.asyncio
+    async def test_engine_is_shared_per_database_file(self):
+        """Test that managers on the same file share one engine until the last closes"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_sqlite.db_path = Path("/test/path/shared-engine.db")
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        
+        first = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        second = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        engine = first.engine
+        
+        assert second.engine is engine
+        assert second.async_session is first.async_session
+        
+        with patch.object(type(engine), "dispose", new_callable=AsyncMock) as mock_dispose:
+            await first.close()
+            mock_dispose.assert_not_called()
+            
+            await second.close()
+            mock_dispose.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_engine_uses_tuned_pool(self):
+        """Test that the shared engine is built with the configured pool profile"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_sqlite.db_path = Path("/test/path/pooled-engine.db")
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        pool = db_manager.engine.pool
+        
+        assert pool.size() == ENGINE_POOL_OPTIONS["pool_size"]
+        assert pool._max_overflow == ENGINE_POOL_OPTIONS["max_overflow"]
+        assert pool._recycle == ENGINE_POOL_OPTIONS["pool_recycle"]
+        
+        await db_manager.close()
+    
+    def test_database_manager_uses_slots(self):
+        """Test that DatabaseManager instances carry no per-instance __dict__"""
+        mock_sqlite = MagicMock(spec=SQLiteManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        mock_vector = MagicMock(spec=VectorMemoryManager)
+        
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        
+        assert not hasattr(db_manager, "__dict__")
+        with pytest.raises(AttributeError):
+            db_manager.unexpected_attribute = True
 
 
 class TestDatabaseManagerLifecycle:
@@ -79,6 +128,10 @@ class TestDatabaseManagerLifecycle:
         
         # Only vector close is called in the actual implementation
         mock_vector.close.assert_called_once()
+        assert db_manager.engine is None
+        
+        # A second close is a no-op for the already disposed engine
+        await db_manager.close()
 
 
 class TestDatabaseManagerHealthCheck:
@@ -125,6 +178,31 @@ class TestDatabaseManagerHealthCheck:
         assert health["vector"]["healthy"] is True
 
 
+    @pytest.mark.asyncio
+    async def test_concurrent_health_checks_are_coalesced(self):
+        """Test that concurrent and back-to-back probes share one backend check"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        
+        async def slow_list_personas():
+            await asyncio.sleep(0.01)
+            return []
+        
+        mock_sqlite.list_personas = AsyncMock(side_effect=slow_list_personas)
+        mock_vector.get_shared_memory_stats = AsyncMock(return_value={"total_memories": 1})
+        
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        
+        results = await asyncio.gather(*(db_manager.health_check() for _ in range(5)))
+        cached = await db_manager.health_check()
+        
+        assert all(r["overall"] is True for r in results)
+        assert cached is results[0]
+        mock_sqlite.list_personas.assert_called_once()
+        mock_vector.get_shared_memory_stats.assert_called_once()
+
+
 class TestDatabaseManagerPersonaOperations:
     """Test DatabaseManager persona CRUD operations"""
     
@@ -178,6 +256,129 @@ class TestDatabaseManagerPersonaOperations:
         assert result is not None
         assert result.name == "TestPersona"
     
+    @pytest.mark.asyncio
+    async def test_get_persona_is_cached(self):
+        """Test that repeated persona lookups are served from the cache"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        
+        mock_sqlite.get_persona = AsyncMock(return_value={
+            "id": "cached-id", "name": "Cached", "description": "A cached persona"
+        })
+        mock_sqlite.get_persona_by_name = AsyncMock()
+        mock_sqlite.update_persona = AsyncMock(return_value=True)
+        
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        
+        first = await db_manager.get_persona("cached-id")
+        second = await db_manager.get_persona("cached-id")
+        by_name = await db_manager.get_persona_by_name("Cached")
+        
+        assert first is second is by_name
+        mock_sqlite.get_persona.assert_called_once_with("cached-id")
+        mock_sqlite.get_persona_by_name.assert_not_called()
+        
+        # Updates evict the cached entry
+        await db_manager.update_persona("cached-id", {"description": "Changed"})
+        await db_manager.get_persona("cached-id")
+        assert mock_sqlite.get_persona.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_update_persona_evicts_reads_made_during_write(self):
+        """Test that a lookup racing the write cannot leave the old row cached"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        mock_sqlite.get_persona = AsyncMock(return_value={
+            "id": "racy-id", "name": "Racy", "description": "Old description"
+        })
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+
+        async def slow_update(persona_id, updates):
+            # A concurrent read lands while the write is in flight
+            await db_manager.get_persona(persona_id)
+            return True
+
+        mock_sqlite.update_persona = AsyncMock(side_effect=slow_update)
+
+        await db_manager.update_persona("racy-id", {"description": "New description"})
+
+        assert "racy-id" not in db_manager._persona_cache
+        assert "Racy" not in db_manager._name_cache
+
+    @staticmethod
+    def _stalled_reads(mock_sqlite):
+        """Make SQLite reads return the old row only once released"""
+        release = asyncio.Event()
+        row = {"id": "stale-id", "name": "Stale", "description": "Old description"}
+
+        async def stalled_read(key):
+            await release.wait()
+            return row
+
+        mock_sqlite.get_persona = AsyncMock(side_effect=stalled_read)
+        mock_sqlite.get_persona_by_name = AsyncMock(side_effect=stalled_read)
+        return release
+
+    @pytest.mark.asyncio
+    async def test_read_finishing_after_update_is_not_cached(self):
+        """Test that a lookup that read the old row before an update never caches it"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        mock_sqlite.update_persona = AsyncMock(return_value=True)
+        release = self._stalled_reads(mock_sqlite)
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+
+        reads = [
+            asyncio.create_task(db_manager.get_persona("stale-id")),
+            asyncio.create_task(db_manager.get_persona_by_name("Stale"))
+        ]
+        await asyncio.sleep(0)
+        await db_manager.update_persona("stale-id", {"description": "New description"})
+        release.set()
+        await asyncio.gather(*reads)
+
+        assert "stale-id" not in db_manager._persona_cache
+        assert "Stale" not in db_manager._name_cache
+
+    @pytest.mark.asyncio
+    async def test_read_finishing_after_delete_is_not_cached(self):
+        """Test that a lookup racing a delete cannot re-cache the deleted persona"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        mock_sqlite.delete_persona = AsyncMock(return_value=True)
+        mock_vector.delete_persona_memories = AsyncMock(return_value=True)
+        release = self._stalled_reads(mock_sqlite)
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+
+        read = asyncio.create_task(db_manager.get_persona("stale-id"))
+        await asyncio.sleep(0)
+        await db_manager.delete_persona("stale-id")
+        release.set()
+        await read
+
+        assert "stale-id" not in db_manager._persona_cache
+        assert "Stale" not in db_manager._name_cache
+
+    @pytest.mark.asyncio
+    async def test_evict_drops_name_entry_without_id_entry(self):
+        """Test that a name entry is evicted even after its id entry was LRU-evicted"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        mock_sqlite.update_persona = AsyncMock(return_value=True)
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+
+        persona = Persona(id="lru-id", name="Lru", description="Cached by name only")
+        db_manager._name_cache.set(persona.name, persona)
+
+        await db_manager.update_persona("lru-id", {"name": "Renamed"})
+
+        assert "Lru" not in db_manager._name_cache
+
     @pytest.mark.asyncio
     async def test_list_personas(self):
         """Test listing all personas"""
@@ -237,6 +438,27 @@ class TestDatabaseManagerPersonaOperations:
         
         mock_sqlite.delete_persona.assert_called_once_with(persona_id)
         assert result is True
+    
+    @pytest.mark.asyncio
+    async def test_delete_persona_retries_failed_vector_cleanup(self):
+        """Test that a vector deletion failure is retried in the background"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        
+        mock_sqlite.delete_persona.return_value = True
+        mock_vector.delete_persona_memories.side_effect = [Exception("ChromaDB busy"), True]
+        
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        
+        with patch("persona_mcp.core.database.VECTOR_CLEANUP_BACKOFF_SECONDS", 0):
+            result = await db_manager.delete_persona("test-persona-id")
+            
+            assert result is True
+            assert len(db_manager._cleanup_tasks) == 1
+            await asyncio.gather(*db_manager._cleanup_tasks)
+        
+        assert mock_vector.delete_persona_memories.call_count == 2
 
 
 class TestDatabaseManagerMemoryOperations:
@@ -312,6 +534,48 @@ class TestDatabaseManagerMemoryOperations:
         )
         assert len(result) == 2
         assert all(isinstance(m, Memory) for m in result)
+
+    @pytest.mark.asyncio
+    async def test_search_memories_drops_unknown_metadata_keys(self):
+        """Test that vector metadata keys outside the Memory model are not projected"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        
+        mock_vector.search_memories = AsyncMock(return_value=[
+            {
+                "id": "1",
+                "content": "Memory 1",
+                "metadata": {"persona_id": "p", "importance": 0.7, "chroma_extra": "x"}
+            }
+        ])
+        
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        
+        result = await db_manager.search_memories("p", "query")
+        
+        assert result[0].importance == 0.7
+        assert "chroma_extra" not in result[0].__dict__
+    
+    @pytest.mark.asyncio
+    async def test_iter_memories_as_view(self):
+        """Test streaming memory search hits as lightweight views"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        
+        mock_vector.search_memories = AsyncMock(return_value=[
+            {"id": "1", "content": "Memory 1", "metadata": {"importance": 0.9}}
+        ])
+        
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        
+        result = [m async for m in db_manager.iter_memories("p", "query", as_view=True)]
+        
+        assert len(result) == 1
+        assert isinstance(result[0], MemoryView)
+        assert result[0].content == "Memory 1"
+        assert result[0].importance == 0.9
     
     @pytest.mark.asyncio
     async def test_get_memory_stats(self):
@@ -443,6 +707,26 @@ class TestDatabaseManagerRelationshipOperations:
         assert len(result) == 2
         assert all(isinstance(r, Relationship) for r in result)
 
+    @pytest.mark.asyncio
+    async def test_list_relationships_untrusted_rows_are_validated(self):
+        """Test that trust_db=False runs full model validation"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+        
+        mock_sqlite.get_persona_relationships = AsyncMock(return_value=[
+            {"persona1_id": "a", "persona2_id": "b", "affinity": 5.0}
+        ])
+        
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+        
+        # Trusted rows skip validation entirely
+        result = await db_manager.list_relationships("a")
+        assert result[0].affinity == 5.0
+        
+        with pytest.raises(ValueError):
+            await db_manager.list_relationships("a", trust_db=False)
+
 
 class TestDatabaseManagerSessionManagement:
     """Test DatabaseManager async session management"""
@@ -526,6 +810,40 @@ class TestDatabaseManagerEdgeCases:
         assert result is False
 
 
+    @pytest.mark.asyncio
+    async def test_system_stats_queries_backends_concurrently(self):
+        """Test that SQLite and vector stats are fetched concurrently"""
+        mock_sqlite = AsyncMock(spec=SQLiteManager)
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_sqlite.db_path = Path("/test/path/test.db")
+
+        vector_started = asyncio.Event()
+
+        async def sqlite_stats():
+            # Only completes if the vector call is already in flight
+            await vector_started.wait()
+            return {"personas": 3, "relationships": 2, "size_mb": 1.5}
+
+        async def vector_stats():
+            vector_started.set()
+            return {"total_memories": 40, "collections": 3}
+
+        mock_sqlite.get_stats = sqlite_stats
+        mock_vector.get_stats = vector_stats
+
+        db_manager = DatabaseManager(sqlite_manager=mock_sqlite, vector_manager=mock_vector)
+
+        stats = await asyncio.wait_for(db_manager.get_system_stats(), timeout=1)
+
+        assert stats == {
+            "personas": 3,
+            "memories": 40,
+            "relationships": 2,
+            "database_size": 1.5,
+            "vector_collections": 3
+        }
+
+
 class TestDatabaseManagerIntegration:
     """Integration tests for DatabaseManager with real components"""
     
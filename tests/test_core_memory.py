@@ -6,6 +6,7 @@ for both MCP server and PersonaAPI server to ensure operational parity.
 """
 
 import pytest
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any, List
@@ -42,6 +43,22 @@ class TestMemoryManagerInitialization:
         assert memory_manager.decay_system is not None
         assert memory_manager.pruning_system is not None
 
+    @pytest.mark.asyncio
+    async def test_ef_search_configures_hnsw_collections(self, tmp_path):
+        """Test that ef_search reaches the HNSW config of persona collections"""
+        vector = VectorMemoryManager(str(tmp_path / "vectors"), ef_search=48)
+        memory_manager = MemoryManager(vector_manager=vector)
+
+        assert await memory_manager.vector_manager.initialize_persona_memory("persona-1")
+        hnsw = vector.collections["persona-1"].configuration["hnsw"]
+        assert hnsw["space"] == "cosine"
+        assert hnsw["ef_search"] == 48
+
+        # Reloading with a different ef_search retunes the existing collection
+        reloaded = VectorMemoryManager(str(tmp_path / "vectors"), ef_search=96)
+        assert await reloaded.initialize_persona_memory("persona-1")
+        assert reloaded.collections["persona-1"].configuration["hnsw"]["ef_search"] == 96
+
 
 class TestMemoryManagerLifecycle:
     """Test MemoryManager lifecycle methods"""
@@ -136,7 +153,7 @@ class TestMemoryManagerStorage:
         assert result.importance == 0.8
         assert result.emotional_valence == 0.5
         
-        mock_vector.store_memory.assert_called_once()
+        mock_vector.store_memory.assert_called_once_with(result)
     
     @pytest.mark.asyncio
     async def test_store_memory_with_auto_importance_scoring(self):
@@ -354,6 +371,26 @@ class TestMemoryManagerStatistics:
             assert stats["decay_system"] == {"decay": "stats"}
             assert stats["pruning_system"] == {"pruning": "stats"}
 
+    @pytest.mark.asyncio
+    async def test_get_system_stats_isolates_vector_failure(self):
+        """Test that a failing vector backend doesn't hide the other sections"""
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_vector.get_stats = AsyncMock(side_effect=ConnectionError("backend down"))
+
+        memory_manager = MemoryManager(vector_manager=mock_vector)
+
+        with patch.object(memory_manager.decay_system, 'get_decay_stats') as mock_decay, \
+             patch.object(memory_manager.pruning_system, 'get_pruning_stats') as mock_pruning:
+
+            mock_decay.return_value = {"decay": "stats"}
+            mock_pruning.return_value = {"pruning": "stats"}
+
+            stats = await memory_manager.get_system_stats()
+
+            assert stats["vector_memory"] == {"healthy": False, "details": "Error: backend down"}
+            assert stats["decay_system"] == {"decay": "stats"}
+            assert stats["pruning_system"] == {"pruning": "stats"}
+
 
 class TestMemoryManagerPruning:
     """Test MemoryManager pruning operations"""
@@ -398,6 +435,36 @@ class TestMemoryManagerPruning:
             assert result == expected_result
             mock_prune.assert_called_once_with()
     
+    @pytest.mark.asyncio
+    async def test_prune_all_memories_runs_personas_concurrently(self):
+        """Test that global pruning overlaps personas up to the configured limit"""
+        from persona_mcp.memory.pruning_system import PruningMetrics
+
+        mock_vector = AsyncMock(spec=VectorMemoryManager)
+        mock_vector.collections = {f"persona-{i}": MagicMock() for i in range(6)}
+        memory_manager = MemoryManager(vector_manager=mock_vector)
+        pruning = memory_manager.pruning_system
+        pruning.config.max_concurrent_personas = 3
+
+        active = 0
+        peak = 0
+
+        async def prune_one(persona_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return PruningMetrics(memories_pruned=2, personas_processed=1)
+
+        with patch.object(pruning, 'should_prune_persona', new=AsyncMock(return_value=True)), \
+             patch.object(pruning, 'prune_persona_memories', side_effect=prune_one):
+            metrics = await memory_manager.prune_all_memories()
+
+        assert peak == 3
+        assert metrics.personas_processed == 6
+        assert metrics.memories_pruned == 12
+    
     @pytest.mark.asyncio
     async def test_get_pruning_recommendations(self):
         """Test getting pruning recommendations"""
@@ -14,7 +14,7 @@ from persona_mcp.core.models import (
     Priority, PersonaBase, PersonaInteractionState, Persona,
     Memory, RelationshipType, EmotionalState, Relationship,
     ConversationContext, ConversationTurn, MCPRequest, MCPResponse,
-    MCPError, SimulationState
+    MCPError, SimulationState, _time_ordered_id
 )
 
 
@@ -37,6 +37,51 @@ class TestPriorityEnum:
         assert Priority.NONE == "none"
 
 
+class TestTimeOrderedIds:
+    """Test default id generation"""
+
+    def test_ids_are_uuid7_and_sortable(self):
+        """Test that default ids are valid UUIDv7 strings in creation order"""
+        import uuid
+
+        ids = [Memory(persona_id="test", content=str(i)).id for i in range(50)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        for memory_id in ids:
+            parsed = uuid.UUID(memory_id)
+            assert parsed.version == 7
+            assert str(parsed) == memory_id
+
+    def test_ids_stay_ordered_across_sequence_overflow(self, monkeypatch):
+        """Test that ids keep sorting upward when one millisecond runs out of sequence numbers"""
+        monkeypatch.setattr("persona_mcp.core.models._id_state", [0, 0])
+        frozen_ns = 1_700_000_000_000 * 1_000_000
+        with patch("persona_mcp.core.models.time.time_ns", return_value=frozen_ns):
+            ids = [_time_ordered_id() for _ in range(0x1000 + 10)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert ids[-1][:13] > ids[0][:13]
+
+    def test_ids_stay_ordered_when_clock_steps_back(self, monkeypatch):
+        """Test that a backwards clock step does not produce lower ids"""
+        monkeypatch.setattr("persona_mcp.core.models._id_state", [0, 0])
+        base_ns = 1_800_000_000_000 * 1_000_000
+        with patch("persona_mcp.core.models.time.time_ns", return_value=base_ns):
+            before = _time_ordered_id()
+        with patch("persona_mcp.core.models.time.time_ns", return_value=base_ns - 5_000_000):
+            after = _time_ordered_id()
+
+        assert after > before
+
+    def test_many_ids_are_ordered(self):
+        """Test that a long run of ids is strictly increasing"""
+        ids = [_time_ordered_id() for _ in range(20_000)]
+
+        assert all(a < b for a, b in zip(ids, ids[1:]))
+
+
 class TestPersonaBase:
     """Test PersonaBase model"""
     
@@ -225,6 +270,40 @@ class TestPersona:
         assert persona.interaction_state.interest_level == 75
         assert persona.interaction_state.persona_id == "custom-id"
 
+    def test_persona_model_construct_adds_interaction_state(self):
+        """Test that unvalidated construction still provides an interaction state"""
+        persona = Persona.model_construct(
+            id="db-id",
+            name="Stored Persona",
+            description="Loaded from the database"
+        )
+        
+        assert persona.interaction_state is not None
+        assert persona.interaction_state.persona_id == "db-id"
+    
+    def test_persona_model_construct_maps_priority_string(self):
+        """Test that unvalidated construction turns raw priority strings into enums"""
+        persona = Persona.model_construct(
+            name="Test", description="Test",
+            interaction_state={"persona_id": "p1", "current_priority": "urgent"}
+        )
+        assert persona.interaction_state.current_priority is Priority.URGENT
+
+        state = PersonaInteractionState.model_construct(persona_id="p1", current_priority="bogus")
+        assert state.current_priority is Priority.NONE
+
+    def test_persona_model_construct_hydrates_state_dict(self):
+        """Test that a stored interaction state dict becomes a model"""
+        persona = Persona.model_construct(
+            id="db-id",
+            name="Stored Persona",
+            description="Loaded from the database",
+            interaction_state={"persona_id": "db-id", "interest_level": 80}
+        )
+        
+        assert isinstance(persona.interaction_state, PersonaInteractionState)
+        assert persona.interaction_state.interest_level == 80
+
 
 class TestMemory:
     """Test Memory model"""
@@ -307,6 +386,38 @@ class TestMemory:
         
         assert memory.accessed_count == 2
 
+    def test_memory_last_accessed_round_trip(self):
+        """Test that last_accessed survives serialization and unvalidated construction"""
+        accessed = datetime(2025, 6, 1, 12, 30, tzinfo=timezone.utc)
+        memory = Memory(persona_id="test", content="test", last_accessed=accessed)
+
+        assert memory.last_accessed == accessed
+        dumped = memory.model_dump()
+        assert dumped["last_accessed"] == accessed
+        assert "last_accessed_ns" not in dumped
+
+        assert Memory.model_validate(dumped).last_accessed == accessed
+        assert Memory.model_validate_json(memory.model_dump_json()).last_accessed == accessed
+        assert Memory.model_construct(
+            persona_id="test", content="test", last_accessed=accessed.isoformat()
+        ).last_accessed == accessed
+
+    def test_memory_last_accessed_from_epoch_and_naive_values(self):
+        """Test that epoch seconds from the vector store and naive times are read as UTC"""
+        accessed = datetime(2025, 6, 1, 12, 30, tzinfo=timezone.utc)
+        epoch = accessed.timestamp()
+
+        assert Memory(persona_id="test", content="test", last_accessed=epoch).last_accessed == accessed
+        assert Memory.model_construct(
+            persona_id="test", content="test", last_accessed=epoch
+        ).last_accessed == accessed
+        assert Memory(
+            persona_id="test", content="test", last_accessed=accessed.replace(tzinfo=None)
+        ).last_accessed == accessed
+        assert Memory(
+            persona_id="test", content="test", last_accessed="2025-06-01T12:30:00"
+        ).last_accessed == accessed
+
 
 class TestRelationshipType:
     """Test RelationshipType enumeration"""
@@ -438,6 +549,41 @@ class TestRelationship:
         assert 0.0 <= score <= 1.0
         assert score > 0.5  # Should be high with positive values
     
+    def test_model_construct_maps_relationship_type_string(self):
+        """Test that unvalidated construction turns raw type strings into enums"""
+        relationship = Relationship.model_construct(
+            persona1_id="alice", persona2_id="bob", relationship_type="close_friend"
+        )
+        assert relationship.relationship_type is RelationshipType.CLOSE_FRIEND
+
+        unknown = Relationship.model_construct(
+            persona1_id="alice", persona2_id="bob", relationship_type="nemesis"
+        )
+        assert unknown.relationship_type is RelationshipType.STRANGER
+
+    def test_cached_scores_refresh_on_dimension_change(self):
+        """Test that cached scores are recomputed after a dimension changes"""
+        relationship = Relationship(
+            persona1_id="alice",
+            persona2_id="bob",
+            affinity=0.5,
+            trust=0.5
+        )
+
+        assert relationship.get_relationship_strength() == pytest.approx(0.35)
+        assert relationship.get_compatibility_score() == pytest.approx(0.33)
+
+        relationship.affinity = -0.5
+        assert relationship.get_relationship_strength() == pytest.approx(-0.05)
+        assert relationship.get_compatibility_score() == pytest.approx(0.275)
+
+        copied = relationship.model_copy(update={"affinity": 0.5})
+        assert copied.get_relationship_strength() == pytest.approx(0.35)
+
+        strength = relationship.get_relationship_strength()
+        relationship.update_from_interaction(interaction_quality=0.9, duration_minutes=30.0)
+        assert relationship.get_relationship_strength() > strength
+
     def test_get_relationship_strength(self):
         """Test relationship strength calculation"""
         relationship = Relationship(
@@ -522,6 +668,25 @@ class TestRelationship:
         
         assert relationship.affinity < 0.3  # Should decrease
         assert relationship.interaction_count == 1
+
+    def test_update_from_interaction_clamps_dimensions(self):
+        """Test that repeated strong interactions stay within dimension bounds"""
+        relationship = Relationship(
+            persona1_id="alice",
+            persona2_id="bob",
+            affinity=0.99,
+            trust=0.99,
+            respect=0.99,
+            intimacy=0.99
+        )
+
+        relationship.update_from_interaction(interaction_quality=1.0, duration_minutes=60.0)
+
+        assert relationship.affinity == 1.0
+        assert relationship.trust == 1.0
+        assert relationship.respect == 1.0
+        assert relationship.intimacy == 1.0
+        assert relationship.memorable_moments[0]["timestamp"] == relationship.last_interaction.isoformat()
     
     def test_get_interaction_modifier(self):
         """Test interaction modifier calculation"""
@@ -0,0 +1,114 @@
+"""
+Unit tests for persona_mcp.logging module
+
+Tests the structured JSON and console formatters and correlation ID scoping.
+"""
+
+import json
+import logging
+import sys
+
+from persona_mcp.logging import ConsoleFormatter, StructuredFormatter, correlation_id, with_connection_id
+
+
+def make_record(msg="hello %s", args=("world",), level=logging.INFO, exc_info=None, **extra):
+    """Build a LogRecord as a logger call would"""
+    record = logging.LogRecord("persona_mcp.test", level, "/src/mod.py", 42, msg, args, exc_info, func="fn")
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class TestStructuredFormatter:
+    """Test JSON structured formatting"""
+
+    def test_core_fields(self):
+        """Test that the standard fields are emitted as one JSON object"""
+        entry = json.loads(StructuredFormatter().format(make_record(correlation_id="abc")))
+
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "persona_mcp.test"
+        assert entry["message"] == "hello world"
+        assert entry["module"] == "mod"
+        assert entry["function"] == "fn"
+        assert entry["line"] == 42
+        assert entry["correlation_id"] == "abc"
+        assert entry["timestamp"].endswith("Z")
+
+    def test_timestamp_comes_from_record(self):
+        """Test that the timestamp is the record's creation time in UTC, not format time"""
+        formatter = StructuredFormatter()
+        record = make_record()
+        record.created = 1700000000.25
+
+        assert json.loads(formatter.format(record))["timestamp"] == "2023-11-14T22:13:20.250000Z"
+
+        record.created = 1700000001.5
+        assert json.loads(formatter.format(record))["timestamp"] == "2023-11-14T22:13:21.500000Z"
+
+    def test_extra_fields_are_included(self):
+        """Test that fields passed via extra= appear and record internals do not"""
+        entry = json.loads(StructuredFormatter().format(make_record(persona_id="p1", tokens=12)))
+
+        assert entry["persona_id"] == "p1"
+        assert entry["tokens"] == 12
+        assert "msg" not in entry
+        assert "args" not in entry
+        assert entry["correlation_id"] == "none"
+
+    def test_extras_orjson_rejects_still_format(self):
+        """Test that non-str dict keys and very wide ints in extras do not drop the record"""
+        line = StructuredFormatter().format(make_record(counts={1: 2}, big=2 ** 70))
+        entry = json.loads(line)
+
+        assert entry["counts"] == {"1": 2}
+        assert entry["big"] == 2 ** 70
+
+    def test_exception_is_formatted(self):
+        """Test that exc_info is rendered into an exception field"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+
+        entry = json.loads(StructuredFormatter().format(record))
+
+        assert "ValueError: boom" in entry["exception"]
+
+
+class TestConnectionId:
+    """Test correlation ID scoping"""
+
+    def test_nested_blocks_restore_outer_id(self):
+        """Test that leaving an inner block restores the outer connection's ID"""
+        with with_connection_id("outer"):
+            with with_connection_id("inner"):
+                assert correlation_id.get() == "inner"
+            assert correlation_id.get() == "outer"
+        assert correlation_id.get() is None
+
+    def test_id_is_restored_after_exception(self):
+        """Test that an exception inside the block still restores the previous ID"""
+        try:
+            with with_connection_id("conn-1"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert correlation_id.get() is None
+
+
+class TestConsoleFormatter:
+    """Test human-readable console formatting"""
+
+    def test_level_is_colored_and_padded(self):
+        """Test that known levels get their color and unknown ones are padded plainly"""
+        formatter = ConsoleFormatter()
+
+        line = formatter.format(make_record(level=logging.WARNING))
+        assert "\033[33mWARNING \033[0m persona_mcp.test" in line
+        assert line.endswith(" hello world")
+
+        record = make_record()
+        record.levelname = "TRACE"
+        assert " TRACE   \033[0m " in formatter.format(record)
@@ -0,0 +1,113 @@
+"""
+Unit tests for persona_mcp.dashboard.cache module
+
+Tests read-through caching, request coalescing and invalidation of MCP results.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+
+from persona_mcp.dashboard.cache import MCPCache
+
+
+class TestMCPCache:
+    """Test MCPCache behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_from_cache(self):
+        """Test that a repeated key does not call MCP again"""
+        cache = MCPCache()
+        fetch = AsyncMock(return_value=["persona"])
+
+        assert await cache.get_or_fetch(("persona.list",), fetch) == ["persona"]
+        assert await cache.get_or_fetch(("persona.list",), fetch) == ["persona"]
+
+        fetch.assert_awaited_once()
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Test that simultaneous misses for one key wait on a single MCP call"""
+        cache = MCPCache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"total": 3}
+
+        results = await asyncio.gather(*[
+            cache.get_or_fetch(("memory.stats", "p1"), fetch) for _ in range(5)
+        ])
+
+        assert results == [{"total": 3}] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self):
+        """Test that an MCP error propagates and the next read retries"""
+        cache = MCPCache()
+        fetch = AsyncMock(side_effect=[Exception("MCP call timeout"), ["persona"]])
+
+        with pytest.raises(Exception, match="timeout"):
+            await cache.get_or_fetch(("persona.list",), fetch)
+        assert await cache.get_or_fetch(("persona.list",), fetch) == ["persona"]
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_not_cached(self):
+        """Test that a None from a swallowed MCP failure does not stick as a 404"""
+        cache = MCPCache()
+        fetch = AsyncMock(side_effect=[None, {"id": "p1"}])
+
+        assert await cache.get_or_fetch(("persona.get", "p1"), fetch) is None
+        assert await cache.get_or_fetch(("persona.get", "p1"), fetch) == {"id": "p1"}
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_method_and_persona(self):
+        """Test that invalidation drops matching methods and persona-scoped keys"""
+        cache = MCPCache()
+        for key in [("persona.list",), ("persona.get", "p1"), ("memory.stats", "p1"),
+                    ("memory.stats", "p2"), ("system.status",)]:
+            await cache.get_or_fetch(key, AsyncMock(return_value=key))
+
+        cache.invalidate(["persona.list"], persona_id="p1")
+
+        fetch = AsyncMock(return_value="fresh")
+        assert await cache.get_or_fetch(("persona.list",), fetch) == "fresh"
+        assert await cache.get_or_fetch(("persona.get", "p1"), fetch) == "fresh"
+        assert await cache.get_or_fetch(("memory.stats", "p1"), fetch) == "fresh"
+        assert await cache.get_or_fetch(("memory.stats", "p2"), fetch) == ("memory.stats", "p2")
+        assert await cache.get_or_fetch(("system.status",), fetch) == ("system.status",)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch_skips_store(self):
+        """Test that a result fetched across an invalidation is not cached"""
+        cache = MCPCache()
+        release = asyncio.Event()
+
+        async def slow_fetch():
+            await release.wait()
+            return "stale"
+
+        pending = asyncio.create_task(cache.get_or_fetch(("persona.list",), slow_fetch))
+        await asyncio.sleep(0)
+        cache.invalidate(["persona.list"])
+        release.set()
+
+        assert await pending == "stale"
+        assert await cache.get_or_fetch(("persona.list",), AsyncMock(return_value="fresh")) == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are fetched again"""
+        cache = MCPCache(ttl=0.0)
+        fetch = AsyncMock(return_value=1)
+
+        await cache.get_or_fetch(("system.status",), fetch)
+        await cache.get_or_fetch(("system.status",), fetch)
+
+        assert fetch.await_count == 2
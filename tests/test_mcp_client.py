@@ -0,0 +1,308 @@
+"""
+Unit tests for persona_mcp.dashboard.mcp_client module
+
+Tests the dashboard's JSON-RPC client against an in-memory WebSocket.
+"""
+
+import pytest
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import websockets
+
+from persona_mcp.dashboard import mcp_client as mcp_client_module
+from persona_mcp.dashboard.mcp_client import MCPClient
+
+
+class FakeWebSocket:
+    """In-memory WebSocket that answers each request via a handler"""
+
+    def __init__(self, handler=None):
+        self.handler = handler or (lambda request: {"status": "ok", "method": request["method"]})
+        self.sent = []
+        self.closed = False
+        self._incoming = asyncio.Queue()
+
+    async def send(self, message):
+        self.sent.append(message)
+        request = json.loads(message)
+        result = self.handler(request)
+        if result is not None:
+            self._incoming.put_nowait(json.dumps(
+                {"jsonrpc": "2.0", "result": result, "id": request["id"]}
+            ))
+
+    async def close(self):
+        self.closed = True
+        self._incoming.put_nowait(None)
+
+    def drop(self):
+        """Simulate the server going away"""
+        self._incoming.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self._incoming.get()
+        if message is None:
+            raise websockets.exceptions.ConnectionClosed(None, None)
+        return message
+
+
+@pytest.fixture
+def sockets(monkeypatch):
+    """Patch websockets.connect to hand out FakeWebSockets"""
+    created = []
+
+    async def connect(uri, **kwargs):
+        await asyncio.sleep(0)  # yield like a real handshake would
+        websocket = FakeWebSocket()
+        created.append(websocket)
+        return websocket
+
+    monkeypatch.setattr(mcp_client_module.websockets, "connect", AsyncMock(side_effect=connect))
+    return created
+
+
+@pytest.fixture
+def client():
+    """Create an MCPClient pointed at a dummy URI"""
+    return MCPClient("ws://mcp.invalid/mcp")
+
+
+class TestCall:
+    """Test request/response matching"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_connection(self, client, sockets):
+        """Test that concurrent calls are multiplexed over one socket"""
+        await client.connect()
+
+        results = await asyncio.gather(*[
+            client.call(method) for method in ("persona.list", "system.status", "memory.stats")
+        ])
+
+        assert [r["method"] for r in results] == ["persona.list", "system.status", "memory.stats"]
+        assert len(sockets) == 1
+        assert [json.loads(m)["id"] for m in sockets[0].sent] == ["1", "2", "3"]
+        assert client.pending_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_connect_once(self, client, sockets):
+        """Test that a burst of calls on a cold client opens one connection"""
+        results = await asyncio.gather(*[client.call("persona.list") for _ in range(5)])
+
+        assert len(results) == 5
+        assert len(sockets) == 1
+        assert len(sockets[0].sent) == 5
+
+    @pytest.mark.asyncio
+    async def test_connect_disables_compression(self, client, sockets):
+        """Test that the connection is opened without permessage-deflate"""
+        await client.connect()
+
+        kwargs = mcp_client_module.websockets.connect.call_args.kwargs
+        assert kwargs["compression"] is None
+        assert kwargs["max_queue"] == 256
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_connection_drop(self, client, sockets):
+        """Test that a call after the server drops opens a fresh connection"""
+        await client.connect()
+        sockets[0].drop()
+        await asyncio.sleep(0)
+
+        result = await client.call("system.status")
+
+        assert result["status"] == "ok"
+        assert len(sockets) == 2
+
+    @pytest.mark.asyncio
+    async def test_connection_context_reuses_open_socket(self, client, sockets):
+        """Test that connection() borrows an existing socket and leaves it open"""
+        await client.connect()
+
+        async with client.connection():
+            await client.call("system.status")
+
+        assert len(sockets) == 1
+        assert client.websocket is sockets[0]
+        assert not sockets[0].closed
+
+    @pytest.mark.asyncio
+    async def test_connection_context_opens_and_closes_when_cold(self, client, sockets):
+        """Test that connection() on a cold client holds a socket only for the block"""
+        async with client.connection():
+            await client.call("system.status")
+
+        assert len(sockets) == 1
+        assert sockets[0].closed
+        assert client.websocket is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_connections_share_one_socket(self, client, sockets):
+        """Test that overlapping cold blocks share a socket closed only by the last to leave"""
+        first_inside = asyncio.Event()
+        release_first = asyncio.Event()
+
+        async def short_block():
+            async with client.connection():
+                first_inside.set()
+                await release_first.wait()
+
+        async def long_block():
+            await first_inside.wait()
+            async with client.connection():
+                release_first.set()
+                await asyncio.sleep(0.01)
+                return await client.call("system.status")
+
+        _, result = await asyncio.gather(short_block(), long_block())
+
+        assert result["status"] == "ok"
+        assert len(sockets) == 1
+        assert sockets[0].closed
+        assert client.websocket is None
+
+    @pytest.mark.asyncio
+    async def test_search_memories_batch(self, client, sockets):
+        """Test that batched searches go out as one memory.search_batch call"""
+        await client.connect()
+        sockets[0].handler = lambda request: {
+            "results": [{"memories": [], "query": s["query"]} for s in request["params"]["searches"]]
+        }
+
+        results = await client.search_memories_batch([
+            {"persona_id": "p1", "query": "a"}, {"persona_id": "p2", "query": "b"}
+        ])
+
+        assert [r["query"] for r in results] == ["a", "b"]
+        assert len(sockets[0].sent) == 1
+        assert json.loads(sockets[0].sent[0])["method"] == "memory.search_batch"
+
+
+class TestDisconnect:
+    """Test cleanup of in-flight calls when the connection goes away"""
+
+    @pytest.mark.asyncio
+    async def test_connection_drop_fails_pending_calls(self, client, sockets):
+        """Test that calls waiting on a dropped socket fail immediately"""
+        await client.connect()
+        sockets[0].handler = lambda request: None
+
+        call = asyncio.create_task(client.call("memory.search"))
+        await asyncio.sleep(0)
+        sockets[0].drop()
+
+        with pytest.raises(Exception, match="MCP disconnected"):
+            await asyncio.wait_for(call, timeout=1)
+        assert client.pending_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_disconnect_fails_pending_calls(self, client, sockets):
+        """Test that disconnect() releases callers still waiting for replies"""
+        await client.connect()
+        sockets[0].handler = lambda request: None
+
+        call = asyncio.create_task(client.call("memory.search"))
+        await asyncio.sleep(0)
+        await client.disconnect()
+
+        with pytest.raises(Exception, match="MCP disconnected"):
+            await asyncio.wait_for(call, timeout=1)
+        assert sockets[0].closed
+
+    @pytest.mark.asyncio
+    async def test_old_reader_leaves_new_connection_alone(self, client, sockets):
+        """Test that a stale reader exiting does not fail calls on a new socket"""
+        await client.connect()
+        first_reader = client._response_task
+        sockets[0].drop()
+        await first_reader
+
+        result = await client.call("system.status")
+
+        assert result["status"] == "ok"
+        assert client.websocket is sockets[1]
+
+class TestHealthCheck:
+    """Test health check caching and coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_recent_success_is_reused(self, client, sockets):
+        """Test that a second check inside the TTL does not hit the server"""
+        assert await client.health_check() is True
+        assert await client.health_check() is True
+
+        assert len(sockets[0].sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_checks_again(self, client, sockets):
+        """Test that the server is asked again once the TTL has passed"""
+        client._health_ttl = 0.0
+
+        await client.health_check()
+        await client.health_check()
+
+        assert len(sockets[0].sent) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_request(self, client, sockets):
+        """Test that simultaneous callers wait on a single system.status"""
+        await client.connect()
+
+        results = await asyncio.gather(*[client.health_check() for _ in range(5)])
+
+        assert results == [True] * 5
+        assert len(sockets[0].sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_cached(self, client, sockets):
+        """Test that a failed check is retried on the next call"""
+        await client.connect()
+        client.call = AsyncMock(side_effect=Exception("MCP call timeout: system.status"))
+
+        assert await client.health_check() is False
+        assert await client.health_check() is False
+        assert client.call.await_count == 2
+
+
+class TestFraming:
+    """Test JSON encoding of requests and responses"""
+
+    @pytest.mark.asyncio
+    async def test_requests_sent_as_text_frames(self, client, sockets):
+        """Test that requests go out as str so the server sees TEXT frames"""
+        await client.call("persona.get", {"persona_id": "p1"})
+
+        sent = sockets[0].sent[0]
+        assert isinstance(sent, str)
+        assert json.loads(sent) == {
+            "jsonrpc": "2.0", "method": "persona.get", "params": {"persona_id": "p1"}, "id": "1"
+        }
+
+    @pytest.mark.asyncio
+    async def test_parameterless_calls_use_cached_envelope(self, client, sockets):
+        """Test that bare calls reuse one envelope and still encode valid requests"""
+        await client.list_personas()
+        await client.get_system_status()
+        await client.call("system.status")
+
+        assert [json.loads(m) for m in sockets[0].sent] == [
+            {"jsonrpc": "2.0", "method": "persona.list", "params": {}, "id": "1"},
+            {"jsonrpc": "2.0", "method": "system.status", "params": {}, "id": "2"},
+            {"jsonrpc": "2.0", "method": "system.status", "params": {}, "id": "3"},
+        ]
+        assert set(client._bare_request_prefixes) == {"persona.list", "system.status"}
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_is_skipped(self, client, sockets):
+        """Test that an unparseable frame does not kill the response reader"""
+        await client.connect()
+        sockets[0]._incoming.put_nowait("{not json")
+
+        result = await client.call("system.status")
+
+        assert result["status"] == "ok"
@@ -280,5 +280,62 @@ class TestSystemOperations:
         assert result["provider"] == "ollama"
 
 
+class TestMemoryOperations:
+    """Test memory-related MCP operations"""
+    
+    @pytest.fixture
+    def memory_handlers(self, mock_components):
+        """Create MCP handlers backed by a shared-MemoryManager-shaped mock"""
+        
+        from persona_mcp.mcp.session import MCPSessionManager
+        
+        db_manager, _, llm_manager, conversation_engine = mock_components
+        memory_manager = MagicMock()
+        memory_manager.search_memories = AsyncMock(return_value=[])
+        
+        handlers = MCPHandlers(
+            conversation_engine,
+            db_manager,
+            memory_manager,
+            llm_manager,
+            MCPSessionManager()
+        )
+        return handlers, memory_manager
+    
+    @pytest.mark.asyncio
+    async def test_memory_search_batch(self, memory_handlers):
+        """Test batched search returns results in order with per-search errors"""
+        
+        mcp_handlers, memory_manager = memory_handlers
+        
+        result = await mcp_handlers.handle_memory_search_batch({
+            "searches": [
+                {"persona_id": "p1", "query": "dragons"},
+                {"persona_id": "p2"},
+                {"persona_id": "p3", "query": "taverns", "n_results": 3}
+            ]
+        })
+        
+        results = result["results"]
+        assert len(results) == 3
+        assert results[0]["query"] == "dragons"
+        assert results[1] == {"error": "query is required"}
+        assert results[2]["query"] == "taverns"
+        assert memory_manager.search_memories.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_memory_search_batch_rejects_oversized_batch(self, memory_handlers):
+        """Test that batches over the limit are rejected outright"""
+        
+        mcp_handlers, _ = memory_handlers
+        
+        from persona_mcp.mcp.handlers import MAX_SEARCH_BATCH_SIZE
+        
+        searches = [{"persona_id": "p1", "query": "q"}] * (MAX_SEARCH_BATCH_SIZE + 1)
+        
+        with pytest.raises(ValueError):
+            await mcp_handlers.handle_memory_search_batch({"searches": searches})
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
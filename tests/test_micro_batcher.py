@@ -0,0 +1,63 @@
+"""
+Unit tests for persona_mcp.dashboard.batching module
+
+Tests collection of concurrent submissions into batched MCP calls.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+
+from persona_mcp.dashboard.batching import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Test MicroBatcher behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_one_dispatch(self):
+        """Test that submissions inside the window go out as one batch"""
+        handler = AsyncMock(side_effect=lambda items: [item * 2 for item in items])
+        batcher = MicroBatcher(handler, timeout=0.01)
+
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(5)])
+
+        assert results == [0, 2, 4, 6, 8]
+        handler.assert_awaited_once_with([0, 1, 2, 3, 4])
+        assert batcher.get_stats()["avg_batch_size"] == 5
+
+    @pytest.mark.asyncio
+    async def test_full_batch_dispatches_without_waiting(self):
+        """Test that reaching max_size flushes before the timeout"""
+        handler = AsyncMock(side_effect=lambda items: items)
+        batcher = MicroBatcher(handler, max_size=2, timeout=60)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*[batcher.submit(i) for i in range(4)]), timeout=1
+        )
+
+        assert results == [0, 1, 2, 3]
+        assert handler.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_handler_failure_fails_every_waiter(self):
+        """Test that a failed batch call propagates to each submitter"""
+        handler = AsyncMock(side_effect=Exception("MCP call timeout: memory.search_batch"))
+        batcher = MicroBatcher(handler, timeout=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, Exception) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_mismatched_result_count_is_an_error(self):
+        """Test that a handler returning the wrong number of results fails the batch"""
+        batcher = MicroBatcher(AsyncMock(return_value=["only one"]), timeout=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
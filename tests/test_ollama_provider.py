@@ -0,0 +1,358 @@
+"""
+Unit tests for persona_mcp.llm.ollama_provider module
+
+Tests Ollama streaming parsing, prompt building and batched generation
+without a live Ollama server.
+"""
+
+import pytest
+import asyncio
+import json
+import httpx
+
+from persona_mcp.llm import ollama_provider
+from persona_mcp.llm.ollama_provider import OllamaProvider, LLMManager
+from persona_mcp.models import Persona, ConversationContext
+
+
+def stream_transport(*pieces):
+    """Build a transport that streams the given byte pieces as the response body"""
+
+    async def body():
+        for piece in pieces:
+            yield piece
+
+    def handler(request):
+        return httpx.Response(200, content=body())
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def persona():
+    """Create a test persona"""
+    return Persona(name="Aria", description="A curious bard")
+
+
+@pytest.fixture
+def context():
+    """Create a test conversation context"""
+    return ConversationContext(participants=["user"])
+
+
+async def collect(provider, persona, context):
+    """Gather every streamed chunk into a list"""
+    return [chunk async for chunk in provider.generate_response_stream("hi", persona, context)]
+
+
+class TestStreaming:
+    """Test NDJSON parsing of streamed responses"""
+
+    @pytest.mark.asyncio
+    async def test_lines_split_across_reads(self, persona, context):
+        """Test that lines cut at arbitrary byte boundaries are reassembled"""
+        provider = OllamaProvider()
+        provider.client = httpx.AsyncClient(transport=stream_transport(
+            b'{"response": "Hel', b'lo"}\n{"respo', b'nse": " th\xc3', b'\xa9re"}\n',
+            b'{"response": "", "done": true}\n'
+        ))
+
+        assert await collect(provider, persona, context) == ["Hello", " thére"]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_done(self, persona, context):
+        """Test that nothing after the done chunk is yielded"""
+        provider = OllamaProvider()
+        provider.client = httpx.AsyncClient(transport=stream_transport(
+            b'{"response": "a"}\n{"response": "b", "done": true}\n{"response": "c"}\n'
+        ))
+
+        assert await collect(provider, persona, context) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_and_blank_lines_are_skipped(self, persona, context):
+        """Test that a bad line is logged and parsing carries on"""
+        provider = OllamaProvider()
+        provider.client = httpx.AsyncClient(transport=stream_transport(
+            b'{"response": "a"}\n\n{not json\n{"response": "b"}'
+        ))
+
+        assert await collect(provider, persona, context) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_truncated_lines_skip_the_parser(self, persona, context, monkeypatch):
+        """Test that lines not ending in a closing brace are never parsed"""
+        parsed = []
+        real_loads = ollama_provider.json.loads
+        monkeypatch.setattr(ollama_provider.json, "loads", lambda s: parsed.append(bytes(s)) or real_loads(s))
+        provider = OllamaProvider()
+        provider.client = httpx.AsyncClient(transport=stream_transport(
+            b'{"response": "a"}\n{"response": "tr\n{"response": "b", "done": true}  \n'
+        ))
+
+        assert await collect(provider, persona, context) == ["a", "b"]
+        assert parsed == [b'{"response": "a"}', b'{"response": "b", "done": true}']
+
+
+    @pytest.mark.asyncio
+    async def test_compact_token_lines_skip_the_parser(self, persona, context, monkeypatch):
+        """Test that plain token lines are read from bytes and only the rest is parsed"""
+        parsed = []
+        real_loads = ollama_provider.json.loads
+        monkeypatch.setattr(ollama_provider.json, "loads", lambda s: parsed.append(bytes(s)) or real_loads(s))
+        provider = OllamaProvider()
+        done_line = b'{"model":"m","response":"","done":true,"context":[1,2]}'
+        provider.client = httpx.AsyncClient(transport=stream_transport(
+            b'{"model":"m","created_at":"t","response":"Caf\xc3\xa9","done":false}\n',
+            b'{"model":"m","created_at":"t","response":" \\"hi\\"","done":false}\n',
+            done_line + b'\n'
+        ))
+
+        assert await collect(provider, persona, context) == ["Caf\u00e9", ' "hi"']
+        assert parsed == [b'" \\"hi\\""', done_line]
+
+    @pytest.mark.parametrize("raw, expected", [
+        (rb'{"response":"plain","done":false}', "plain"),
+        (rb'{"response":"line\nbreak","done":false}', "line\nbreak"),
+        (rb'{"response":"say \"hi\"","done":false}', 'say "hi"'),
+        (rb'{"response":"ends in \\","done":false}', "ends in \\"),
+        (rb'{"response":"\u00e9","done":false}', "\u00e9"),
+        (rb'{"done":false}', None),
+        (rb'{"response":"unterminated', None),
+    ])
+    def test_fast_extract_response(self, raw, expected):
+        """Test byte-level extraction of the response field, honoring escapes"""
+        assert ollama_provider._fast_extract_response(bytearray(raw)) == expected
+
+
+class TestAvailability:
+    """Test cached availability probes"""
+
+    @pytest.mark.asyncio
+    async def test_probe_is_reused_within_ttl(self):
+        """Test that repeated checks inside the TTL do not hit Ollama again"""
+        probes = []
+        provider = OllamaProvider()
+        provider.client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: probes.append(request) or httpx.Response(200, content=b'{"models": []}')
+        ))
+
+        assert await provider.is_available() is True
+        assert await provider.is_available() is True
+        assert len(probes) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_probe(self):
+        """Test that simultaneous callers wait on a single request"""
+        probes = []
+        provider = OllamaProvider()
+        provider.client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: probes.append(request) or httpx.Response(200)
+        ))
+
+        assert await asyncio.gather(*[provider.is_available() for _ in range(5)]) == [True] * 5
+        assert len(probes) == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_expires_sooner(self):
+        """Test that a failed probe is cached for the shorter failure TTL"""
+        provider = OllamaProvider()
+        provider.client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+        now = ollama_provider.time.monotonic()
+
+        assert await provider.is_available() is False
+        expires_at, available = provider._avail_cache
+        assert available is False
+        assert expires_at - now <= ollama_provider.AVAILABILITY_FAILURE_TTL + 0.5
+
+
+class TestManager:
+    """Test LLMManager setup"""
+
+    @pytest.mark.asyncio
+    async def test_initialize_warns_when_ollama_is_down(self):
+        """Test that an unreachable Ollama is reported rather than raising"""
+        manager = LLMManager()
+        manager.ollama.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+
+        assert await manager.initialize() is False
+
+
+class TestGenerationOptions:
+    """Test Ollama generation options"""
+
+    def test_unconstrained_calls_share_defaults(self):
+        """Test that calls without constraints return the default options unchanged"""
+        provider = OllamaProvider()
+
+        assert provider._get_generation_options() is provider._get_generation_options({})
+        assert provider._get_generation_options() == {
+            "temperature": 0.7, "top_p": 0.9, "top_k": 40, "num_predict": 150
+        }
+
+    def test_constraints_override_a_copy(self):
+        """Test that constraints adjust a copy and leave the defaults intact"""
+        provider = OllamaProvider()
+
+        options = provider._get_generation_options({"max_length": 50, "style": "concise", "creativity": 0.9})
+
+        assert options["temperature"] == 0.5
+        assert options["num_predict"] == 50
+        assert provider._get_generation_options()["num_predict"] == 150
+
+
+class TestTemplates:
+    """Test canned responses used without the LLM"""
+
+    def test_template_bucket_follows_state(self, persona, context):
+        """Test that template replies are drawn from the bucket matching the persona state"""
+        manager = LLMManager()
+
+        assert manager._generate_template_response(persona, context) in ollama_provider._NEUTRAL_TEMPLATES
+        persona.interaction_state.interaction_fatigue = 60
+        assert manager._generate_template_response(persona, context) in ollama_provider._FATIGUE_TEMPLATES
+        persona.interaction_state.social_energy = 10
+        assert manager._generate_template_response(persona, context) in ollama_provider._DRAINED_TEMPLATES
+
+    def test_fallback_response(self, persona, context):
+        """Test that the fallback reply comes from the canned set unless the persona is drained"""
+        provider = OllamaProvider()
+
+        assert provider._generate_fallback_response(persona, context) in ollama_provider._FALLBACKS
+        persona.interaction_state.social_energy = 10
+        assert provider._generate_fallback_response(persona, context) == (
+            "I'm feeling a bit drained from all this conversation."
+        )
+
+
+class TestBatch:
+    """Test concurrent batch generation"""
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_overlaps_calls(self, persona, context):
+        """Test that batch requests run concurrently and keep their order"""
+        manager = LLMManager()
+        in_flight = 0
+        peak = 0
+
+        async def generate_response(user_input, persona, context, constraints):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"re: {user_input}"
+
+        manager.ollama.generate_response = generate_response
+
+        results = await manager.generate_batch([
+            (90, "a", persona, context), (50, "b", persona, context), (70, "c", persona, context)
+        ])
+
+        assert results == [("re: a", "full_llm"), ("re: b", "constrained"), ("re: c", "full_llm")]
+        assert peak == 3
+
+
+class TestClient:
+    """Test HTTP client configuration"""
+
+    @pytest.mark.asyncio
+    async def test_client_keeps_connections_alive(self):
+        """Test that the client pools keep-alive connections and bounds connect time"""
+        provider = OllamaProvider()
+
+        assert provider.client.timeout.connect == 5.0
+        pool = provider.client._transport._pool
+        assert pool._max_keepalive_connections == 32
+        assert pool._keepalive_expiry == 30.0
+        await provider.close()
+
+
+class TestPromptBuilding:
+    """Test persona prompt assembly and caching"""
+
+    def test_prompt_layout(self, persona, context):
+        """Test the assembled prompt for a constrained turn on a topic"""
+        provider = OllamaProvider()
+        persona.personality_traits = {"wit": 0.8}
+        context.topic = "music"
+        context.turn_count = 2
+
+        prompt = provider._build_persona_prompt(
+            "hello", persona, context, {"max_length": 50, "prepare_exit": True}
+        )
+
+        assert prompt == (
+            "You are Aria. A curious bard\n\nYour personality traits:\n- wit: 0.8\n\n"
+            "Current situation:\n- Energy level: 100/200\n- Current priority: none\n"
+            "- Interest in conversation: 50/100\n- Available time: 300 seconds\n\n"
+            "Current topic: music\nThis is turn 3 in the conversation.\n\n"
+            "Response guidelines:\n- Keep response under 50 words\n"
+            "- Prepare to end the conversation politely\n\n"
+            "Respond to: hello\n\nResponse as Aria:"
+        )
+
+    def test_prefix_is_reused_until_state_changes(self, persona, context):
+        """Test that the persona block is cached and rebuilt when the state moves"""
+        provider = OllamaProvider()
+
+        first = provider._persona_prefix(persona)
+        assert provider._persona_prefix(persona) is first
+
+        persona.interaction_state.social_energy = 20
+        changed = provider._persona_prefix(persona)
+        assert changed is not first
+        assert "- Energy level: 20/200" in changed
+
+    @pytest.mark.asyncio
+    async def test_only_large_prompts_leave_the_event_loop(self, persona, context, monkeypatch):
+        """Test that prompts over the size threshold are built in a worker thread"""
+        offloaded = []
+
+        async def to_thread(func, *args):
+            offloaded.append(func)
+            return func(*args)
+
+        monkeypatch.setattr(ollama_provider.asyncio, "to_thread", to_thread)
+        provider = OllamaProvider()
+
+        small = await provider._prepare_prompt("hi", persona, context)
+        persona.description = "x" * (ollama_provider.PROMPT_OFFLOAD_THRESHOLD + 1)
+        large = await provider._prepare_prompt("hi", persona, context)
+
+        assert offloaded == [provider._build_persona_prompt]
+        assert small.startswith("You are Aria. A curious bard")
+        assert large == provider._build_persona_prompt("hi", persona, context)
+
+    def test_unhashable_traits_are_built_uncached(self, persona, context):
+        """Test that trait values that cannot be hashed still produce a prompt"""
+        provider = OllamaProvider()
+        persona.personality_traits = {"likes": ["tea", "maps"]}
+
+        assert "- likes: ['tea', 'maps']" in provider._persona_prefix(persona)
+        assert len(provider._prompt_cache) == 0
+
+
+class TestRequests:
+    """Test request encoding for non-streaming calls"""
+
+    @pytest.mark.asyncio
+    async def test_generate_posts_pre_encoded_json(self, persona, context):
+        """Test that the payload is sent as JSON content and the reply is decoded"""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, content=b'{"response": "  Hi there  ", "done": true}')
+
+        provider = OllamaProvider()
+        provider.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await provider.generate_response("hi", persona, context, {"model": "m"}) == "Hi there"
+        assert seen[0].headers["content-type"] == "application/json"
+        payload = json.loads(seen[0].content)
+        assert payload["model"] == "m"
+        assert payload["stream"] is False
+        assert payload["prompt"].endswith("Respond to: hi\n\nResponse as Aria:")
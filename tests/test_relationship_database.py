@@ -0,0 +1,143 @@
+"""
+Unit tests for persona_mcp.database module
+
+Tests pooled SQLite access for relationship tables and sessions.
+"""
+
+import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock
+
+from persona_mcp.persistence.sqlite_manager import SQLiteManager
+from persona_mcp.persistence.vector_memory import VectorMemoryManager
+from persona_mcp import database
+from persona_mcp.database import DatabaseManager, get_db_session
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path, monkeypatch):
+    """Initialize a DatabaseManager on a temporary SQLite file"""
+    sqlite_manager = SQLiteManager(str(tmp_path / "personas.db"))
+    manager = DatabaseManager(sqlite_manager, MagicMock(spec=VectorMemoryManager))
+    await manager.initialize()
+    monkeypatch.setattr(database, "_db_manager", manager)
+
+    yield manager
+
+    await manager.close()
+    await manager.engine.dispose()
+
+
+class TestRelationshipPool:
+    """Test connection reuse for relationship queries"""
+
+    @pytest.mark.asyncio
+    async def test_tables_created_through_pool(self, db_manager):
+        """Test that relationship tables exist after initialize()"""
+        async with get_db_session() as session:
+            rows = await session.fetchall(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name IN "
+                "('relationships', 'emotional_states', 'interaction_history')"
+            )
+
+        assert {row[0] for row in rows} == {"relationships", "emotional_states", "interaction_history"}
+
+    @pytest.mark.asyncio
+    async def test_sessions_reuse_connections(self, db_manager):
+        """Test that sequential sessions borrow pooled connections instead of opening new ones"""
+        seen = set()
+        for _ in range(5):
+            async with get_db_session() as session:
+                seen.add(id(session._connection))
+
+        assert len(seen) <= database.RELATIONSHIP_POOL_SIZE
+        stats = db_manager.pool.get_pool_stats()
+        assert stats["checked_out_connections"] == 0
+        assert stats["total_connections"] == database.RELATIONSHIP_POOL_SIZE
+
+    @pytest.mark.asyncio
+    async def test_connections_use_wal(self, db_manager):
+        """Test that pooled connections are opened in WAL mode"""
+        async with get_db_session() as session:
+            row = await session.fetchone("PRAGMA journal_mode")
+
+        assert row[0] == "wal"
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_work_is_rolled_back_on_release(self, db_manager):
+        """Test that a session's open transaction doesn't leak to the next borrower"""
+        async with get_db_session() as session:
+            await session.execute("CREATE TABLE scratch (value TEXT)")
+            await session.commit()
+            await session.execute("INSERT INTO scratch VALUES (?)", ["uncommitted"])
+
+        async with get_db_session() as session:
+            row = await session.fetchone("SELECT COUNT(*) FROM scratch")
+            assert not session._connection.in_transaction
+
+        assert row[0] == 0
+
+
+class TestRelationshipSchema:
+    """Test one-shot creation of the relationship schema"""
+
+    @pytest.mark.asyncio
+    async def test_schema_version_recorded(self, db_manager):
+        """Test that initialize() stamps the schema version"""
+        async with get_db_session() as session:
+            row = await session.fetchone("PRAGMA user_version")
+
+        assert row[0] == database.RELATIONSHIP_SCHEMA_VERSION
+
+    @pytest.mark.asyncio
+    async def test_current_schema_skips_ddl(self, db_manager):
+        """Test that a restart against an up-to-date database runs no DDL"""
+        async with get_db_session() as session:
+            await session.execute("DROP TABLE interaction_history")
+            await session.commit()
+
+        await db_manager._create_relationship_tables()
+
+        async with get_db_session() as session:
+            row = await session.fetchone(
+                "SELECT COUNT(*) FROM sqlite_master WHERE name = 'interaction_history'"
+            )
+        assert row[0] == 0
+
+    @pytest.mark.asyncio
+    async def test_symmetric_lookup_uses_indexes(self, db_manager):
+        """Test that a persona1-or-persona2 lookup is served by indexes, not a scan"""
+        async with get_db_session() as session:
+            # A real statement first, so a connection opened before the DDL reloads its schema
+            await session.fetchone("SELECT COUNT(*) FROM relationships")
+            plan = await session.fetchall(
+                "EXPLAIN QUERY PLAN SELECT * FROM relationships "
+                "WHERE persona1_id = ? OR persona2_id = ?", ["p1", "p1"]
+            )
+
+        details = " ".join(row[-1] for row in plan)
+        assert "SCAN relationships" not in details
+        assert "idx_relationships_reverse" in details
+
+    @pytest.mark.asyncio
+    async def test_older_schema_is_upgraded(self, db_manager):
+        """Test that a database stamped with an older version gets the new indexes"""
+        async with get_db_session() as session:
+            await session.execute("DROP INDEX idx_relationships_reverse")
+            await session.execute(
+                "CREATE INDEX idx_relationships_personas ON relationships (persona1_id, persona2_id)"
+            )
+            await session.execute("PRAGMA user_version = 1")
+            await session.commit()
+
+        await db_manager._create_relationship_tables()
+
+        async with get_db_session() as session:
+            rows = await session.fetchall(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+            )
+        assert {row[0] for row in rows} == {
+            "idx_relationships_reverse",
+            "idx_emotional_states_persona",
+            "idx_interaction_history_recent",
+        }
@@ -0,0 +1,79 @@
+"""
+Unit tests for persona_mcp.utils.ttl_cache module
+
+Tests LRU eviction and time-based expiry of the bounded read cache.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from persona_mcp.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour"""
+    
+    def test_set_and_get(self):
+        """Test storing and retrieving a value"""
+        cache = TTLCache(maxsize=4, ttl=30)
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+    
+    def test_miss_returns_default(self):
+        """Test that a missing key returns the default"""
+        cache = TTLCache()
+        
+        assert cache.get("missing") is None
+        assert cache.get("missing", 42) == 42
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full"""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+        
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+    
+    def test_entries_expire(self):
+        """Test that entries are dropped once their TTL has passed"""
+        cache = TTLCache(maxsize=4, ttl=10)
+        with patch("persona_mcp.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("persona_mcp.utils.ttl_cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") == 1
+        with patch("persona_mcp.utils.ttl_cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+    
+    def test_pop_and_clear(self):
+        """Test explicit removal of entries"""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert len(cache) == 0
+    
+    def test_keys_snapshot(self):
+        """Test that keys() can be iterated while entries are removed"""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        for key in cache.keys():
+            cache.pop(key)
+        assert len(cache) == 0
+    
+    def test_invalid_maxsize(self):
+        """Test that a non-positive maxsize is rejected"""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
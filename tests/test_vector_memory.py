@@ -0,0 +1,409 @@
+"""
+Unit tests for persona_mcp.persistence.vector_memory module
+
+Tests the ChromaDB-backed VectorMemoryManager write and search paths.
+"""
+
+import pytest
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+from persona_mcp.core.models import Memory
+from persona_mcp.persistence.vector_memory import VectorMemoryManager, get_embedding_function
+
+
+@pytest.fixture
+def vector_manager(tmp_path):
+    """Create a VectorMemoryManager backed by a temporary directory"""
+    return VectorMemoryManager(str(tmp_path / "vectors"), batch_window_ms=5)
+
+
+def _memory(persona_id: str, content: str) -> Memory:
+    return Memory(persona_id=persona_id, content=content)
+
+
+class TestStoreBatching:
+    """Test coalescing of concurrent store_memory calls"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stores_share_one_add(self, vector_manager):
+        """Test that stores within one window are added in a single call"""
+        collection = MagicMock()
+        vector_manager.collections["persona-1"] = collection
+
+        results = await asyncio.gather(*[
+            vector_manager.store_memory(_memory("persona-1", f"memory {i}"))
+            for i in range(3)
+        ])
+
+        assert results == [True, True, True]
+        collection.add.assert_called_once()
+        assert collection.add.call_args.kwargs["documents"] == [
+            "memory 0", "memory 1", "memory 2"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self, vector_manager):
+        """Test that reaching max_batch_size flushes immediately"""
+        vector_manager.max_batch_size = 2
+        vector_manager.batch_window_ms = 60_000
+        collection = MagicMock()
+        vector_manager.collections["persona-1"] = collection
+
+        results = await asyncio.wait_for(asyncio.gather(
+            vector_manager.store_memory(_memory("persona-1", "first")),
+            vector_manager.store_memory(_memory("persona-1", "second"))
+        ), timeout=5)
+
+        assert results == [True, True]
+        collection.add.assert_called_once()
+        assert not vector_manager._flush_tasks
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_fails_every_store(self, vector_manager):
+        """Test that a failed batch add reports failure to each caller"""
+        collection = MagicMock()
+        collection.add.side_effect = RuntimeError("add failed")
+        vector_manager.collections["persona-1"] = collection
+
+        results = await asyncio.gather(
+            vector_manager.store_memory(_memory("persona-1", "first")),
+            vector_manager.store_memory(_memory("persona-1", "second"))
+        )
+
+        assert results == [False, False]
+
+    @pytest.mark.asyncio
+    async def test_bad_write_only_fails_itself(self, vector_manager):
+        """Test that a failed batch is retried per item so good writes still land"""
+        collection = MagicMock()
+
+        def add(documents, metadatas, ids):
+            if "bad" in documents:
+                raise ValueError("bad metadata")
+
+        collection.add.side_effect = add
+        vector_manager.collections["persona-1"] = collection
+
+        results = await asyncio.gather(
+            vector_manager.store_memory(_memory("persona-1", "first")),
+            vector_manager.store_memory(_memory("persona-1", "bad")),
+            vector_manager.store_memory(_memory("persona-1", "third"))
+        )
+
+        assert results == [True, False, True]
+        assert collection.add.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_writes(self, vector_manager):
+        """Test that close writes out stores still inside a window"""
+        vector_manager.batch_window_ms = 60_000
+        collection = MagicMock()
+        vector_manager.collections["persona-1"] = collection
+
+        store_task = asyncio.create_task(
+            vector_manager.store_memory(_memory("persona-1", "pending"))
+        )
+        await asyncio.sleep(0)
+        await vector_manager.close()
+
+        assert await store_task is True
+        collection.add.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_strand_batch(self, vector_manager):
+        """Test that cancelling the store that filled a batch mid-flush still resolves the others"""
+        vector_manager.max_batch_size = 2
+        vector_manager.batch_window_ms = 60_000
+        adding = threading.Event()
+        release = threading.Event()
+
+        def add(documents, metadatas, ids):
+            adding.set()
+            release.wait(5)
+
+        collection = MagicMock()
+        collection.add.side_effect = add
+        vector_manager.collections["persona-1"] = collection
+
+        first = asyncio.create_task(vector_manager.store_memory(_memory("persona-1", "first")))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(vector_manager.store_memory(_memory("persona-1", "second")))
+        await asyncio.to_thread(adding.wait, 5)
+        second.cancel()
+        release.set()
+
+        assert await asyncio.wait_for(first, timeout=5) is True
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        collection.add.assert_called_once()
+
+
+class TestQueryEmbeddingCache:
+    """Test reuse of query embeddings across searches"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_embeds_once(self, vector_manager):
+        """Test that the same query text is only embedded once"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.1, 0.2]])
+        collection = MagicMock()
+        collection.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+        vector_manager.collections["persona-1"] = collection
+
+        await vector_manager.search_memories("persona-1", "what happened?")
+        await vector_manager.search_memories("persona-1", "what happened?")
+
+        vector_manager.embedding_function.assert_called_once_with(["what happened?"])
+        assert collection.query.call_count == 2
+        assert collection.query.call_args.kwargs["query_embeddings"] == [[0.1, 0.2]]
+
+    @pytest.mark.asyncio
+    async def test_cross_persona_search_embeds_once(self, vector_manager):
+        """Test that cross-persona search shares one embedding across collections"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.3, 0.4]])
+        for persona_id in ("persona-1", "persona-2", "persona-3"):
+            collection = MagicMock()
+            collection.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+            vector_manager.collections[persona_id] = collection
+
+        await vector_manager.search_cross_persona_memories("persona-1", "festival")
+
+        vector_manager.embedding_function.assert_called_once_with(["festival"])
+
+
+class TestCrossPersonaSearch:
+    """Test cross-persona search query planning"""
+
+    @pytest.mark.asyncio
+    async def test_one_query_per_other_persona(self, vector_manager):
+        """Test that shared and public memories are fetched in a single query"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.3, 0.4]])
+        collections = {}
+        for persona_id in ("persona-1", "persona-2"):
+            collection = MagicMock()
+            collection.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+            collections[persona_id] = vector_manager.collections[persona_id] = collection
+
+        await vector_manager.search_cross_persona_memories(
+            "persona-1", "festival", n_results=5, min_importance=0.0
+        )
+
+        other = collections["persona-2"].query
+        other.assert_called_once()
+        assert other.call_args.kwargs["where"] == {"visibility": {"$in": ["shared", "public"]}}
+        assert other.call_args.kwargs["n_results"] == 10
+
+    @pytest.mark.asyncio
+    async def test_single_visibility_uses_equality_filter(self, vector_manager):
+        """Test that requesting one visibility keeps a plain equality filter"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.3, 0.4]])
+        for persona_id in ("persona-1", "persona-2"):
+            collection = MagicMock()
+            collection.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+            vector_manager.collections[persona_id] = collection
+
+        await vector_manager.search_cross_persona_memories(
+            "persona-1", "festival", min_importance=0.0, include_public=False
+        )
+
+        other = vector_manager.collections["persona-2"].query
+        assert other.call_args.kwargs["where"] == {"visibility": "shared"}
+
+    @pytest.mark.asyncio
+    async def test_importance_filter_pushed_into_query(self, vector_manager):
+        """Test that min_importance is applied by ChromaDB, not after the query"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.3, 0.4]])
+        for persona_id in ("persona-1", "persona-2"):
+            collection = MagicMock()
+            collection.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+            vector_manager.collections[persona_id] = collection
+
+        await vector_manager.search_cross_persona_memories(
+            "persona-1", "festival", min_importance=0.6
+        )
+
+        other = vector_manager.collections["persona-2"].query
+        assert other.call_args.kwargs["where"] == {"$and": [
+            {"visibility": {"$in": ["shared", "public"]}},
+            {"importance": {"$gte": 0.6}}
+        ]}
+
+    @pytest.mark.asyncio
+    async def test_shard_queries_are_bounded(self, tmp_path):
+        """Test that no more than max_concurrent_personas shards are queried at once"""
+        manager = VectorMemoryManager(str(tmp_path / "vectors"), max_concurrent_personas=2)
+        manager.embedding_function = MagicMock(return_value=[[0.3, 0.4]])
+        lock = threading.Lock()
+        active = peak = 0
+
+        def query(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+
+        for i in range(6):
+            collection = MagicMock()
+            collection.query.side_effect = query
+            manager.collections[f"persona-{i}"] = collection
+
+        await manager.search_cross_persona_memories("persona-0", "festival", min_importance=0.0)
+
+        assert peak == 2
+        assert all(c.query.called for c in manager.collections.values())
+
+
+    @pytest.mark.asyncio
+    async def test_results_merged_across_shards(self, vector_manager):
+        """Test that hits from every other persona are merged by similarity"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.3, 0.4]])
+        own = MagicMock()
+        own.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+        vector_manager.collections["persona-1"] = own
+        for persona_id, distance in (("persona-2", 0.4), ("persona-3", 0.1)):
+            collection = MagicMock()
+            collection.configuration = {"hnsw": {"space": "cosine"}}
+            collection.query.return_value = {
+                "ids": [[f"{persona_id}-memory"]],
+                "documents": [[f"{persona_id} memory"]],
+                "metadatas": [[{"importance": 0.8, "visibility": "shared"}]],
+                "distances": [[distance]]
+            }
+            vector_manager.collections[persona_id] = collection
+
+        results = await vector_manager.search_cross_persona_memories("persona-1", "festival")
+
+        assert [r["source_persona"] for r in results] == ["persona-3", "persona-2"]
+        assert results[0]["similarity"] == pytest.approx(0.9)
+
+    @pytest.mark.asyncio
+    async def test_l2_collection_scores_on_cosine_scale(self, vector_manager):
+        """Test that hits from legacy l2 collections are ranked on the same scale as cosine ones"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.3, 0.4]])
+        own = MagicMock()
+        own.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+        vector_manager.collections["persona-1"] = own
+        # Same cosine similarity of 0.8: l2 reports 2 - 2cos, cosine reports 1 - cos
+        for persona_id, space, distance in (("persona-2", "l2", 0.4), ("persona-3", "cosine", 0.2)):
+            collection = MagicMock()
+            collection.configuration = {"hnsw": {"space": space}}
+            collection.query.return_value = {
+                "ids": [[f"{persona_id}-memory"]],
+                "documents": [[f"{persona_id} memory"]],
+                "metadatas": [[{"importance": 0.8, "visibility": "shared"}]],
+                "distances": [[distance]]
+            }
+            vector_manager.collections[persona_id] = collection
+
+        results = await vector_manager.search_cross_persona_memories("persona-1", "festival")
+
+        assert [r["similarity"] for r in results] == [pytest.approx(0.8)] * 2
+
+    @pytest.mark.asyncio
+    async def test_space_read_from_metadata_without_configuration(self, vector_manager):
+        """Test that collections from chromadb releases without .configuration still score"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.3, 0.4]])
+        own = MagicMock()
+        own.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+        vector_manager.collections["persona-1"] = own
+        legacy = MagicMock(spec=["name", "metadata", "query"])
+        legacy.metadata = {"hnsw:space": "l2"}
+        legacy.query.return_value = {
+            "ids": [["legacy-memory"]],
+            "documents": [["legacy memory"]],
+            "metadatas": [[{"importance": 0.8, "visibility": "shared"}]],
+            "distances": [[0.4]]
+        }
+        vector_manager.collections["persona-2"] = legacy
+
+        results = await vector_manager.search_cross_persona_memories("persona-1", "festival")
+
+        assert [r["similarity"] for r in results] == [pytest.approx(0.8)]
+
+
+class TestEmbeddingFunctionSharing:
+    """Test that managers share one embedding model per process"""
+
+    def test_managers_share_embedding_function(self, tmp_path):
+        """Test that separate managers reuse the same embedding function"""
+        first = VectorMemoryManager(str(tmp_path / "first"))
+        second = VectorMemoryManager(str(tmp_path / "second"))
+
+        assert first.embedding_function is second.embedding_function
+        assert first.embedding_function is get_embedding_function()
+
+
+class TestSearchHydration:
+    """Test conversion of ChromaDB hits into Memory objects"""
+
+    @pytest.mark.asyncio
+    async def test_search_memories_maps_metadata(self, vector_manager):
+        """Test that reserved metadata keys become fields and the rest stays metadata"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.1, 0.2]])
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["m1", "m2"]],
+            "documents": [["first", "second"]],
+            "metadatas": [[
+                {"importance": 0.9, "related_personas": "a,b", "visibility": "shared",
+                 "accessed_count": 3, "topic": "tea"},
+                {"importance": 0.4}
+            ]]
+        }
+        vector_manager.collections["persona-1"] = collection
+
+        memories = await vector_manager.search_memories("persona-1", "tea")
+
+        assert [m.id for m in memories] == ["m1", "m2"]
+        assert memories[0].related_personas == ["a", "b"]
+        assert memories[0].visibility == "shared"
+        assert memories[0].accessed_count == 3
+        assert memories[0].metadata == {"topic": "tea"}
+        assert memories[1].related_personas == []
+        assert memories[1].visibility == "private"
+
+    @pytest.mark.asyncio
+    async def test_cross_persona_search_drops_own_private_memories(self, vector_manager):
+        """Test that the requesting persona's private memories are not returned"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.1, 0.2]])
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["m1", "m2"]],
+            "documents": [["private note", "public note"]],
+            "metadatas": [[{"visibility": "private"}, {"visibility": "public"}]]
+        }
+        vector_manager.collections["persona-1"] = collection
+
+        results = await vector_manager.search_cross_persona_memories("persona-1", "note")
+
+        assert [r["memory_id"] for r in results] == ["m2"]
+        assert results[0]["source"] == "own"
+
+    @pytest.mark.asyncio
+    async def test_cross_persona_search_keeps_top_n(self, vector_manager):
+        """Test that only the n most similar hits are returned, best first"""
+        vector_manager.embedding_function = MagicMock(return_value=[[0.1, 0.2]])
+        own = MagicMock()
+        own.query.return_value = {"documents": [[]], "metadatas": [[]], "ids": [[]]}
+        vector_manager.collections["persona-1"] = own
+        other = MagicMock()
+        distances = [0.5, 0.1, 0.9, 0.3]
+        other.query.return_value = {
+            "ids": [[f"m{i}" for i in range(4)]],
+            "documents": [[f"doc {i}" for i in range(4)]],
+            "metadatas": [[{"visibility": "public"}] * 4],
+            "distances": [distances]
+        }
+        vector_manager.collections["persona-2"] = other
+
+        results = await vector_manager.search_cross_persona_memories(
+            "persona-1", "doc", n_results=2
+        )
+
+        assert [r["memory_id"] for r in results] == ["m1", "m3"]